@@ -0,0 +1,89 @@
+"""Benchmark queue.Queue against ObservationChannel for a 100k obs/s producer and a 10 Hz consumer."""
+
+import pathlib
+import sys
+import threading
+import time
+from queue import Queue
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.core import config
+from rf_radar.core.models import Observation, ObservationSource
+from rf_radar.infrastructure import queues
+from rf_radar.infrastructure.queues import ObservationChannel
+
+
+def _observations(count: int):
+    return [Observation(ObservationSource.SIM, f"sim-{i % 5000}", -60, ts=float(i)) for i in range(count)]
+
+
+def _run(target, rate: float, duration: float, batch: int, max_batch: int):
+    """Produce ``rate`` obs/s in ``batch``-sized pushes while a consumer drains at CORE_TICK_RATE."""
+    payload = _observations(batch)
+    interval = batch / rate
+    tick = 1.0 / config.CORE_TICK_RATE
+    stop = threading.Event()
+    consumed = [0]
+    drain_time = [0.0]
+
+    def consume() -> None:
+        # Drain once per core tick without blocking so only the hand-off cost is timed.
+        while True:
+            finished = stop.wait(tick)
+            start = time.perf_counter()
+            consumed[0] += len(queues.drain(target, max_items=max_batch, timeout=0.0, budget=tick))
+            drain_time[0] += time.perf_counter() - start
+            if finished:
+                return
+
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+
+    produced = dropped = 0
+    push_time = 0.0
+    deadline = time.perf_counter() + duration
+    next_push = time.perf_counter()
+    while next_push < deadline:
+        start = time.perf_counter()
+        dropped += queues.put_many(target, payload)
+        push_time += time.perf_counter() - start
+        produced += batch
+        next_push += interval
+        pause = next_push - time.perf_counter()
+        if pause > 0:
+            time.sleep(pause)
+
+    stop.set()
+    consumer.join()
+    return {
+        "produced": produced,
+        "consumed": consumed[0],
+        "dropped": dropped,
+        "push_us_per_obs": push_time / produced * 1e6,
+        "drain_us_per_obs": drain_time[0] / max(1, consumed[0]) * 1e6,
+    }
+
+
+def main() -> None:
+    rate = 100_000.0
+    duration = 3.0
+    capacity = 16_384
+    max_batch = 20_000
+    for batch in (100, 1000):
+        for name, target in (
+            ("queue.Queue", Queue(maxsize=capacity)),
+            ("ObservationChannel", ObservationChannel(capacity)),
+        ):
+            result = _run(target, rate, duration, batch, max_batch)
+            print(
+                f"{name:18} batch={batch:5} produced={result['produced']:7} consumed={result['consumed']:7} "
+                f"dropped={result['dropped']:6} push={result['push_us_per_obs']:5.2f} us/obs "
+                f"drain={result['drain_us_per_obs']:5.2f} us/obs"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark radar frame time with many targets using SDL's dummy video driver.
+
+The baseline is ``radar_view_before``, a verbatim copy of the render path as
+it was before sprites were cached, so both columns draw the same frame:
+background, grid, crosshair, view filtering, fading and targets.
+"""
+
+import os
+import pathlib
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pygame
+
+from rf_radar.core import config
+from rf_radar.core.models import Observation, ObservationBatch, ObservationSource
+from rf_radar.core.tracker import Tracker
+from rf_radar.ui import radar_view, theme
+
+import radar_view_before
+
+
+def _snapshot(count: int):
+    tracker = Tracker(config)
+    tracker.update_many(
+        ObservationBatch.from_observations(
+            Observation(ObservationSource.SIM, f"dev-{i}", -30 - i % 70, ts=0.0) for i in range(count)
+        )
+    )
+    return tracker.build_snapshot(now_ts=0.0)
+
+
+def _frame_ms(render, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        render()
+    return (time.perf_counter() - start) / frames * 1e3
+
+
+def main() -> None:
+    pygame.init()
+    screen = pygame.display.set_mode((800, 800))
+    font = pygame.font.Font(None, 18)
+    profile = theme.VIEW_PROFILES[1]
+    frames = 60
+
+    for count in (100, 1_000, 5_000):
+        snap = _snapshot(count)
+        radar_view_before.set_snapshot(snap)
+        radar_view.set_snapshot(snap)
+        before = _frame_ms(lambda: radar_view_before.render(screen, profile, snap, font), frames)
+        after = _frame_ms(lambda: radar_view.render(screen, profile, snap, font), frames)
+        print(f"targets={count:>5} before={before:7.2f} ms/frame after={after:7.2f} ms/frame")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
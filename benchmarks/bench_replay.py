@@ -0,0 +1,78 @@
+"""Benchmark session log size and replay speed for a simulated busy-venue capture.
+
+Usage::
+
+    python benchmarks/bench_replay.py --duration 3600 --rate 1000
+"""
+
+import argparse
+import os
+import pathlib
+import sys
+import tempfile
+import time
+from typing import Sequence
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.app.replay import Replayer
+from rf_radar.core import config
+from rf_radar.core.tracker import Tracker
+from rf_radar.infrastructure.recording import SessionReader, SessionRecorder
+from rf_radar.scanners.sim_scanner import LoadProfile, SimScanner
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=3600.0, help="seconds of simulated capture")
+    parser.add_argument("--rate", type=float, default=1000.0, help="observations per second")
+    parser.add_argument("--ids", type=int, default=1500, help="devices in the venue")
+    parser.add_argument("--no-compress", action="store_true", help="write uncompressed chunks")
+    args = parser.parse_args(argv)
+
+    config.TARGET_DEBUG_LOG = False
+    profile = LoadProfile(
+        static_aps=args.ids // 10,
+        moving_phones=args.ids - args.ids // 10,
+        obs_per_second=args.rate,
+        rotation_interval=900.0,
+    )
+    scanner = SimScanner(None, config, scenario="LOAD", seed=1, tick_rate=config.CORE_TICK_RATE, load_profile=profile)
+    steps = int(args.duration * config.CORE_TICK_RATE)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "session.rfrs")
+        start = time.perf_counter()
+        with SessionRecorder(path, angle_hash=config.ANGLE_HASH, compress=not args.no_compress) as recorder:
+            for step in range(steps):
+                recorder.record_many(scanner._build_observations(step))
+        record_s = time.perf_counter() - start
+        size_mb = os.path.getsize(path) / 1e6
+        print(
+            f"recorded {recorder.records} obs in {recorder.chunks} chunks: {size_mb:.1f} MB "
+            f"({os.path.getsize(path) / max(1, recorder.records):.2f} B/obs), incl. generation {record_s:.1f}s"
+        )
+
+        with SessionReader(path) as reader:
+            start = time.perf_counter()
+            decoded = sum(len(batch) for batch in reader.batches())
+            decode_s = time.perf_counter() - start
+            print(f"decoded {decoded} obs in {decode_s:.2f}s ({decoded / decode_s:,.0f} obs/s)")
+
+            result = Replayer(reader, Tracker(config), speed=None).run()
+            print(
+                f"replayed {result['records']} obs in {result['ticks']} ticks through Tracker in "
+                f"{result['elapsed_s']:.2f}s ({result['records'] / result['elapsed_s']:,.0f} obs/s)"
+            )
+
+            seek_ts = (reader.first_ts + reader.last_ts) / 2
+            start = time.perf_counter()
+            next(reader.batches(start_ts=seek_ts))
+            print(f"seek to t={seek_ts - reader.first_ts:.0f}s in {(time.perf_counter() - start) * 1e3:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Benchmark snapshot creation: cloned Target dataclasses versus TargetView records.
+
+Bytes are what one snapshot build allocates and keeps, measured with
+``tracemalloc`` around the build alone on an already loaded tracker. A full
+TargetView build costs more per target than a clone (the 112-byte record plus
+fresh ``rssi_filt``/``last_seen`` floats, against a clone that shares every
+field object with the mutable ``Target``). The saving is across snapshots:
+unchanged records are reused, so a tick that changes 1% of the targets
+allocates about 1% of a full build, where cloning copied every target on
+every tick.
+"""
+
+import pathlib
+import sys
+import time
+import tracemalloc
+from dataclasses import replace
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.core import config
+from rf_radar.core.models import (
+    Observation,
+    ObservationBatch,
+    ObservationSource,
+    Target,
+    TargetKind,
+    TargetState,
+)
+from rf_radar.core.tracker import Tracker
+
+
+def _clone_snapshot(targets):
+    """Previous build path: shallow-copy every Target and scan it for stats."""
+    cloned = tuple(replace(tgt) for tgt in targets.values() if tgt.state != TargetState.GONE)
+    min(cloned, key=lambda t: t.radius_norm)
+    sum(1 for t in cloned if t.state == TargetState.ACTIVE)
+    sum(1 for t in cloned if t.state == TargetState.STALE)
+    return cloned
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _allocated(fn):
+    """Run ``fn`` and return its result with the bytes it allocated and still holds."""
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def _loaded_tracker(ids) -> Tracker:
+    tracker = Tracker(config)
+    tracker.update_many(
+        ObservationBatch.from_observations(Observation(ObservationSource.BLE, i, -60, ts=0.0) for i in ids)
+    )
+    return tracker
+
+
+def run(count: int) -> None:
+    ids = [f"dev-{i}" for i in range(count)]
+    targets = {
+        target_id: Target(
+            id=target_id,
+            source_mask={ObservationSource.BLE},
+            rssi_raw_last=-60,
+            rssi_filt=-60.0,
+            angle_deg=float(idx % 360),
+            radius_norm=0.8,
+            last_seen_ts=0.0,
+            state=TargetState.ACTIVE,
+            kind=TargetKind.UNKNOWN,
+        )
+        for idx, target_id in enumerate(ids)
+    }
+    clone_time = _timed(lambda: _clone_snapshot(targets))
+    _, clone_bytes = _allocated(lambda: _clone_snapshot(targets))
+
+    tracker = _loaded_tracker(ids)
+    full_time = _timed(lambda: tracker.build_snapshot(now_ts=0.0))
+    tracker = _loaded_tracker(ids)
+    previous, view_bytes = _allocated(lambda: tracker.build_snapshot(now_ts=0.0))
+
+    changed = ids[::100]
+    tracker.update_many(
+        ObservationBatch.from_observations(Observation(ObservationSource.BLE, i, -55, ts=1.0) for i in changed)
+    )
+    incr_time = _timed(lambda: tracker.build_snapshot(now_ts=1.0))
+    tracker.update_many(
+        ObservationBatch.from_observations(Observation(ObservationSource.BLE, i, -50, ts=2.0) for i in changed)
+    )
+    _, incr_bytes = _allocated(lambda: tracker.build_snapshot(now_ts=2.0))
+    idle_time = _timed(lambda: tracker.build_snapshot(now_ts=2.0))
+
+    print(
+        f"targets={count:>6} clone={clone_time * 1e3:7.2f} ms {clone_bytes / count:6.1f} B/target | "
+        f"view full={full_time * 1e3:7.2f} ms {view_bytes / count:6.1f} B/target | "
+        f"1% changed={incr_time * 1e3:6.2f} ms {incr_bytes / count:5.1f} B/target | "
+        f"unchanged={idle_time * 1e3:6.3f} ms"
+    )
+
+
+def main() -> None:
+    config.TARGET_DEBUG_LOG = False
+    for count in (1_000, 10_000, 50_000):
+        run(count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark memory per target and update cost of the tracker target store.
+
+``store`` counts what ``target_store.py`` allocates: the columns, the
+id->slot index and the expiry and nearest indexes. ``tracker`` is everything
+a fresh ``Tracker`` allocates while ingesting, including the bounded angle
+cache and the set of targets changed since the last snapshot. On CPython
+3.11 expect roughly 140-170 B/target for the store and 230-320 B/target for
+the tracker, against 570-640 B/target for the previous dict layout.
+"""
+
+import pathlib
+import sys
+import time
+import tracemalloc
+from typing import Dict
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.core import config, target_store
+from rf_radar.core.models import Observation, ObservationBatch, ObservationSource, Target, TargetKind, TargetState
+from rf_radar.core.tracker import Tracker
+
+
+def _ids(count: int):
+    return [f"aa:bb:cc:{i >> 16 & 0xFF:02x}:{i >> 8 & 0xFF:02x}:{i & 0xFF:02x}" for i in range(count)]
+
+
+def _dict_layout_bytes(ids) -> float:
+    """Bytes per target for the previous Dict[str, Target] plus side-dict layout."""
+    tracemalloc.start()
+    targets: Dict[str, Target] = {}
+    bands: Dict[str, int] = {}
+    radius_ts: Dict[str, float] = {}
+    log_ts: Dict[str, float] = {}
+    for idx, target_id in enumerate(ids):
+        targets[target_id] = Target(
+            id=target_id,
+            source_mask={ObservationSource.BLE},
+            rssi_raw_last=-60,
+            rssi_filt=-60.0 - idx % 7,
+            angle_deg=float(idx % 360),
+            radius_norm=0.8,
+            last_seen_ts=float(idx),
+            state=TargetState.ACTIVE,
+            kind=TargetKind.UNKNOWN,
+        )
+        bands[target_id] = 1
+        radius_ts[target_id] = float(idx)
+        log_ts[target_id] = float(idx)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(ids)
+
+
+def _store_bytes(ids):
+    """Bytes per target allocated by the target store module and by the whole tracker."""
+    observations = [Observation(ObservationSource.BLE, target_id, -60, ts=0.0) for target_id in ids]
+    tracemalloc.start()
+    tracker = Tracker(config)
+    for obs in observations:
+        tracker.update(obs)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    store = snapshot.filter_traces([tracemalloc.Filter(True, target_store.__file__)])
+    store_bytes = sum(stat.size for stat in store.statistics("filename"))
+    tracker_bytes = sum(stat.size for stat in snapshot.statistics("filename"))
+    return store_bytes / len(ids), tracker_bytes / len(ids)
+
+
+def _update_cost(ids, rounds: int = 5):
+    tracker = Tracker(config)
+    observations = [
+        Observation(ObservationSource.BLE, target_id, -40 - (n * 7 + idx) % 60, ts=float(n))
+        for n in range(rounds)
+        for idx, target_id in enumerate(ids)
+    ]
+    start = time.perf_counter()
+    for obs in observations:
+        tracker.update(obs)
+    scalar = (time.perf_counter() - start) / len(observations)
+
+    tracker = Tracker(config)
+    batch = ObservationBatch.from_observations(observations)
+    start = time.perf_counter()
+    tracker.update_many(batch)
+    bulk = (time.perf_counter() - start) / len(observations)
+    return scalar, bulk
+
+
+def main() -> None:
+    for count in (1_000, 10_000, 50_000):
+        ids = _ids(count)
+        dict_bytes = _dict_layout_bytes(ids)
+        store_bytes, tracker_bytes = _store_bytes(ids)
+        scalar, bulk = _update_cost(ids)
+        print(
+            f"targets={count:>6} dict_layout={dict_bytes:7.1f} B/target store={store_bytes:7.1f} B/target "
+            f"tracker={tracker_bytes:7.1f} B/target "
+            f"update={scalar * 1e6:6.2f} us update_many={bulk * 1e6:6.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Headless benchmark harness for the scanner -> tracker -> snapshot pipeline.
+
+Usage::
+
+    python benchmarks/pipeline.py --output results.json
+    python benchmarks/pipeline.py --ids 1000,100000 --rates 100,50000 --duration 5
+    python benchmarks/pipeline.py --compare baseline.json --output current.json
+
+``--compare`` runs the suite, compares every metric against the baseline file
+and exits with status 1 when a metric regressed by more than ``--threshold``.
+Every scenario runs in a fresh subprocess so ``peak_rss_mb`` is its own peak
+rather than the largest one seen so far.
+"""
+
+import argparse
+import json
+import multiprocessing
+import pathlib
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Sequence
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.app.runtime import Runtime
+from rf_radar.app.supervisor import ScannerSupervisor
+from rf_radar.core import config
+from rf_radar.core.models import ObservationBatch, ObservationSource
+from rf_radar.core.tracker import Tracker
+from rf_radar.infrastructure import queues
+from rf_radar.scanners.sim_scanner import LoadProfile, SimScanner
+
+# Direction of each metric: +1 when higher is better, -1 when lower is better.
+METRIC_DIRECTIONS: Dict[str, int] = {
+    "ingest_obs_per_s": 1,
+    "tick_p50_ms": -1,
+    "tick_p95_ms": -1,
+    "tick_p99_ms": -1,
+    "snapshot_mean_ms": -1,
+    "snapshot_max_ms": -1,
+    "snapshots_per_s": 1,
+    "dropped": -1,
+    "peak_rss_mb": -1,
+}
+
+
+def _percentile(values: Sequence[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux; it is the peak of the whole process.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _isolated(bench: Callable[..., Dict[str, float]], *args) -> Dict[str, float]:
+    """Run one scenario in a fresh interpreter so its process-wide peak RSS is its own."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(bench, *args).result()
+
+
+def _profile(ids: int, rate: float) -> LoadProfile:
+    static_aps = max(1, ids // 10)
+    return LoadProfile(static_aps=static_aps, moving_phones=ids - static_aps, obs_per_second=rate)
+
+
+def bench_tracker(ids: int, rate: float, duration: float) -> Dict[str, float]:
+    """Drive Tracker.update_many/tick/build_snapshot tick by tick with pre-generated load."""
+    tick_rate = float(config.CORE_TICK_RATE)
+    scanner = SimScanner(None, config, scenario="LOAD", seed=1, tick_rate=tick_rate, load_profile=_profile(ids, rate))
+    # Pre-populate every id so the table is at full size from the first measured tick.
+    warmup = ObservationBatch(
+        ids=scanner._ap_ids + [scanner._phone_id(i, 0.0) for i in range(len(scanner._phone_levels))],
+        rssi=[-60] * ids,
+        ts=[0.0] * ids,
+        sources=[ObservationSource.SIM] * ids,
+    )
+    batches = [
+        ObservationBatch.from_observations(scanner._build_observations(step))
+        for step in range(int(duration * tick_rate))
+    ]
+
+    tracker = Tracker(config)
+    tracker.update_many(warmup)
+    tracker.build_snapshot(now_ts=0.0)
+
+    ingest_time = 0.0
+    ingested = 0
+    tick_ms: List[float] = []
+    snapshot_ms: List[float] = []
+    for batch in batches:
+        now_ts = batch.ts[-1] if len(batch) else 0.0
+        start = time.perf_counter()
+        tracker.update_many(batch)
+        ingested_at = time.perf_counter()
+        tracker.tick(now_ts)
+        snap_start = time.perf_counter()
+        tracker.build_snapshot(now_ts)
+        end = time.perf_counter()
+        ingest_time += ingested_at - start
+        ingested += len(batch)
+        tick_ms.append((end - start) * 1e3)
+        snapshot_ms.append((end - snap_start) * 1e3)
+
+    return {
+        "ingest_obs_per_s": ingested / ingest_time if ingest_time else 0.0,
+        "tick_p50_ms": _percentile(tick_ms, 50),
+        "tick_p95_ms": _percentile(tick_ms, 95),
+        "tick_p99_ms": _percentile(tick_ms, 99),
+        "snapshot_mean_ms": sum(snapshot_ms) / len(snapshot_ms) if snapshot_ms else 0.0,
+        "snapshot_max_ms": max(snapshot_ms, default=0.0),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def bench_runtime(ids: int, rate: float, duration: float) -> Dict[str, float]:
+    """Run the threaded Runtime with a load scanner as a supervised source.
+
+    The load scanner hands over one tick of observations at a time, so its
+    channel is sized for a few ticks; drops then mean the core fell behind
+    rather than that the harness queue was too small. Runs in its own
+    process (see ``_isolated``), so resizing the channel does not leak.
+    """
+    tick_rate = float(config.CORE_TICK_RATE)
+    config.OBS_CHANNEL_CAPACITY = max(config.OBS_CHANNEL_CAPACITY, int(4 * rate / tick_rate))
+    profile = _profile(ids, rate)
+
+    def load_factory(channel, cfg):
+        return SimScanner(channel, cfg, scenario="LOAD", seed=1, tick_rate=tick_rate, load_profile=profile)
+
+    observation_queue = queues.create_observation_queue(config)
+    snapshot_queue = queues.create_snapshot_queue(config)
+    supervisor = ScannerSupervisor(config, factories={"load": load_factory}, inputs={"input": observation_queue})
+    runtime = Runtime(config, observation_queue, snapshot_queue, supervisor=supervisor)
+
+    runtime.start()
+    start = time.perf_counter()
+    snapshots = 0
+    last = None
+    while time.perf_counter() - start < duration:
+        try:
+            last = snapshot_queue.get(timeout=0.1)
+            snapshots += 1
+        except Exception:
+            pass
+    elapsed = time.perf_counter() - start
+    runtime.stop()
+
+    ingested = last.stats.get("ingested", 0) if last else 0
+    return {
+        "ingest_obs_per_s": ingested / elapsed,
+        "snapshots_per_s": snapshots / elapsed,
+        "dropped": float(supervisor.dropped()),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_suite(ids_list: Sequence[int], rates: Sequence[float], duration: float, runtime: bool) -> Dict:
+    results: Dict[str, Dict[str, float]] = {}
+    for ids in ids_list:
+        for rate in rates:
+            key = f"tracker/ids={ids}/rate={int(rate)}"
+            results[key] = _isolated(bench_tracker, ids, rate, duration)
+            print(_format(key, results[key]))
+            if runtime:
+                key = f"runtime/ids={ids}/rate={int(rate)}"
+                results[key] = _isolated(bench_runtime, ids, rate, duration)
+                print(_format(key, results[key]))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "duration_s": duration,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """Return a description of every metric that regressed beyond ``threshold`` (a fraction)."""
+    regressions = []
+    for key, metrics in current["results"].items():
+        base_metrics = baseline.get("results", {}).get(key)
+        if not base_metrics:
+            continue
+        for name, value in metrics.items():
+            direction = METRIC_DIRECTIONS.get(name)
+            base = base_metrics.get(name)
+            if direction is None or base is None:
+                continue
+            if base == 0:
+                worse = direction < 0 and value > 0
+                change = float("inf") if worse else 0.0
+            else:
+                change = (base - value) / abs(base) if direction > 0 else (value - base) / abs(base)
+                worse = change > threshold
+            if worse:
+                regressions.append(f"{key} {name}: {base:.3f} -> {value:.3f} ({change:+.0%} worse)")
+    return regressions
+
+
+def _format(key: str, metrics: Dict[str, float]) -> str:
+    return key + " " + " ".join(f"{name}={value:.2f}" for name, value in metrics.items())
+
+
+def _csv(value: str, cast) -> List:
+    return [cast(item) for item in value.split(",") if item]
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ids", default="1000,10000", help="comma separated tracked-id counts")
+    parser.add_argument("--rates", default="100,5000", help="comma separated observations per second")
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds of load per scenario")
+    parser.add_argument("--no-runtime", action="store_true", help="skip the threaded Runtime scenarios")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed regression fraction")
+    args = parser.parse_args(argv)
+
+    current = run_suite(_csv(args.ids, int), _csv(args.rates, float), args.duration, not args.no_runtime)
+
+    if args.output:
+        pathlib.Path(args.output).write_text(json.dumps(current, indent=2))
+
+    if args.compare:
+        baseline = json.loads(pathlib.Path(args.compare).read_text())
+        regressions = compare(baseline, current, args.threshold)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            return 1
+        print("No regressions beyond threshold.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+"""Runtime variant running scanners and the core loop as tasks on one asyncio event loop."""
+
+import asyncio
+import logging
+import threading
+import time
+from queue import Empty, Queue
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from rf_radar.app.runtime import publish_snapshot
+from rf_radar.app.scheduler import CoreScheduler
+from rf_radar.core.models import Observation, ObservationBatch
+from rf_radar.core.tracker import Tracker
+from rf_radar.infrastructure import metrics, queues
+from rf_radar.infrastructure.recording import SessionRecorder, create_session_recorder
+
+logger = logging.getLogger(__name__)
+
+Emit = Callable[[List[Observation]], None]
+AsyncProducer = Callable[[Emit, object], Awaitable[None]]
+
+_update_ms = metrics.registry.histogram("tracker.update_ms")
+_tick_ms = metrics.registry.histogram("tracker.tick_ms")
+_snapshot_ms = metrics.registry.histogram("tracker.snapshot_ms")
+_loop_ms = metrics.registry.histogram("core.loop_ms")
+_latency_ms = metrics.registry.histogram("snapshot.latency_ms")
+_ingested = metrics.registry.counter("core.ingested")
+_snapshot_skipped = metrics.registry.counter("snapshot.skipped")
+_backlog = metrics.registry.gauge("queue.backlog")
+_dropped = metrics.registry.gauge("queue.dropped")
+
+
+def default_producers(config) -> Dict[str, AsyncProducer]:
+    """Async producers for every source enabled in ``config``, keyed like the supervisor's sources."""
+    producers: Dict[str, AsyncProducer] = {}
+    if getattr(config, "ENABLE_WIFI", False):
+        from rf_radar.scanners import wifi_scanner
+
+        producers["wifi"] = wifi_scanner.produce_async
+    if getattr(config, "ENABLE_BLE", False):
+        from rf_radar.scanners import ble_scanner
+
+        producers["ble"] = ble_scanner.produce_async
+    if getattr(config, "ENABLE_SIMULATOR", False):
+        from rf_radar.scanners import sim_scanner
+
+        producers["sim"] = sim_scanner.produce_async
+    return producers
+
+
+class AsyncRuntime:
+    """Runtime running every scanner and the core loop on a single event loop thread.
+
+    Each source is an async producer task handing whole scans or windows to an
+    ``asyncio.Queue``; a producer that raises is restarted after
+    ``SCANNER_RESTART_BACKOFF`` seconds doubled per consecutive failure, while
+    one that returns (e.g. BLE without an adapter) stays stopped. The core task
+    drains that queue in batches under a ``CoreScheduler`` and publishes
+    snapshots into ``snapshot_queue``, normally a ``SnapshotMailbox`` read by
+    the UI thread. Observations put on ``observation_queue`` from other threads
+    are picked up at each tick. Adding sources adds tasks, not threads, and
+    ``stop`` cancels everything at once.
+    """
+
+    def __init__(
+        self,
+        config,
+        observation_queue: Queue,
+        snapshot_queue,
+        producers: Optional[Dict[str, AsyncProducer]] = None,
+    ) -> None:
+        self.config = config
+        self.observation_queue = observation_queue
+        self.snapshot_queue = snapshot_queue
+        self.producers = producers if producers is not None else default_producers(config)
+        self.core_interval = 1.0 / float(config.CORE_TICK_RATE)
+        self.max_batch = int(getattr(config, "CORE_MAX_BATCH", 1))
+        self.batch_budget = float(getattr(config, "CORE_BATCH_BUDGET", self.core_interval))
+        self.inbox_size = int(getattr(config, "ASYNC_INBOX_MAXSIZE", 256))
+        self.backoff = float(getattr(config, "SCANNER_RESTART_BACKOFF", 1.0))
+        self.backoff_max = float(getattr(config, "SCANNER_RESTART_BACKOFF_MAX", 30.0))
+
+        self.tracker: Optional[Tracker] = None
+        self.scheduler: Optional[CoreScheduler] = None
+        self.recorder: Optional[SessionRecorder] = None
+        self.metrics_dumper: Optional[metrics.JsonLinesDumper] = None
+        self.thread: Optional[threading.Thread] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._inbox: Optional[asyncio.Queue] = None
+        self._sources: Dict[str, Dict[str, int]] = {}
+        self._ingested = 0
+        self._batch_max = 0
+        self._tick_count = 0
+        self._pending = 0
+
+    def start(self) -> None:
+        """Start the event loop thread with one task per producer plus the core task."""
+        if self.is_running():
+            return
+        self.tracker = Tracker(self.config)
+        self.recorder = create_session_recorder(self.config, start_ts=time.time())
+        self.metrics_dumper = metrics.create_dumper(self.config, metrics.registry)
+        if self.metrics_dumper:
+            self.metrics_dumper.start()
+        self._pending = 0
+        self._sources = {name: {"emitted": 0, "dropped": 0, "restarts": 0} for name in self.producers}
+
+        ready = threading.Event()
+        self.thread = threading.Thread(target=asyncio.run, args=(self._main(ready),), name="AsyncRuntime", daemon=True)
+        self.thread.start()
+        ready.wait(timeout=2.0)
+
+    def stop(self) -> None:
+        """Cancel all tasks, wait for the loop thread and flush recording and metrics."""
+        loop, stop = self.loop, self._stop
+        if loop is not None and stop is not None:
+            try:
+                loop.call_soon_threadsafe(stop.set)
+            except RuntimeError:
+                pass  # loop already closed
+        if self.thread:
+            self.thread.join(timeout=2.0)
+        if self.recorder:
+            self.recorder.close()
+        if self.metrics_dumper:
+            self.metrics_dumper.stop()
+        self._drain_queues()
+
+    def is_running(self) -> bool:
+        """Return True while the event loop thread is alive."""
+        return bool(self.thread and self.thread.is_alive())
+
+    async def _main(self, ready: threading.Event) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._inbox = asyncio.Queue(maxsize=self.inbox_size)
+        self.scheduler = CoreScheduler(
+            self.core_interval,
+            idle_interval_max=float(getattr(self.config, "CORE_IDLE_INTERVAL_MAX", self.core_interval)),
+            stats_interval=float(getattr(self.config, "CORE_STATS_INTERVAL", 1.0)),
+            clock=self.loop.time,
+        )
+        tasks = [
+            asyncio.create_task(self._supervise(name, producer), name=f"producer-{name}")
+            for name, producer in self.producers.items()
+        ]
+        tasks.append(asyncio.create_task(self._core(), name="core"))
+        ready.set()
+        try:
+            await self._stop.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.loop = None
+
+    async def _supervise(self, name: str, producer: AsyncProducer) -> None:
+        """Run ``producer``, restarting it with backoff when it raises."""
+        emit = self._emitter(name)
+        failures = 0
+        while True:
+            started = time.monotonic()
+            try:
+                await producer(emit, self.config)
+                logger.info("Producer %s finished", name)
+                return
+            except Exception:
+                if failures and time.monotonic() - started >= self.backoff_max:
+                    failures = 0
+                failures += 1
+                delay = min(self.backoff_max, self.backoff * 2 ** (failures - 1))
+                logger.warning("Producer %s failed; restarting in %.1fs", name, delay, exc_info=True)
+            self._sources[name]["restarts"] += 1
+            await asyncio.sleep(delay)
+
+    def _emitter(self, name: str) -> Emit:
+        """Callback a producer uses to hand over one scan's observations without blocking."""
+        counters = self._sources[name]
+
+        def emit(observations: List[Observation]) -> None:
+            if not observations:
+                return
+            try:
+                self._inbox.put_nowait(observations)
+            except asyncio.QueueFull:
+                previous = counters["dropped"]
+                counters["dropped"] += len(observations)
+                if queues.drop_warning_due(previous, counters["dropped"]):
+                    logger.warning("Producer %s dropped observations: %s", name, counters["dropped"])
+                return
+            counters["emitted"] += len(observations)
+            self._pending += len(observations)
+
+        return emit
+
+    async def _core(self) -> None:
+        """Core task: ingest batches as they arrive and tick at the scheduler's deadlines."""
+        scheduler = self.scheduler
+        while True:
+            batch = await self._collect(scheduler.remaining())
+            if batch:
+                self._ingest(batch)
+                scheduler.ingested(len(batch))
+            if scheduler.due():
+                # Take what arrived since the wait returned, so only what is still queued counts as backlog.
+                batch = await self._collect(0.0)
+                batch.extend(
+                    queues.drain(self.observation_queue, self.max_batch, timeout=0.0, budget=self.batch_budget)
+                )
+                if batch:
+                    self._ingest(batch)
+                    scheduler.ingested(len(batch))
+                self._tick(scheduler)
+
+    async def _collect(self, timeout: float) -> List[Observation]:
+        """Wait up to ``timeout`` seconds for producer output, then take what is queued up to ``max_batch``."""
+        inbox = self._inbox
+        batch: List[Observation] = []
+        if inbox.empty() and timeout > 0:
+            try:
+                batch.extend(await asyncio.wait_for(inbox.get(), timeout))
+            except asyncio.TimeoutError:
+                return batch
+        while len(batch) < self.max_batch and not inbox.empty():
+            batch.extend(inbox.get_nowait())
+        self._pending -= len(batch)
+        return batch
+
+    def _ingest(self, batch: List[Observation]) -> None:
+        if self.recorder:
+            self.recorder.record_many(batch)
+        self._tick_count += len(batch)
+        self.scheduler.observed(batch[-1].ts)
+        update_start = time.perf_counter()
+        self.tracker.update_many(ObservationBatch.from_observations(batch))
+        _update_ms.observe_since(update_start)
+
+    def _tick(self, scheduler: CoreScheduler) -> None:
+        now_ts = scheduler.now_ts(time.time())
+        batch_size = self._tick_count
+        self._tick_count = 0
+        self._ingested += batch_size
+        self._batch_max = max(self._batch_max, batch_size)
+        _ingested.inc(batch_size)
+
+        tick_start = time.perf_counter()
+        self.tracker.tick(now_ts)
+        _tick_ms.observe_since(tick_start)
+        if scheduler.should_build(self.tracker.has_changes(), self.snapshot_queue.empty()):
+            latency = scheduler.latency()
+            snapshot_start = time.perf_counter()
+            snap = self.tracker.build_snapshot(now_ts, extra_stats=self._stats(batch_size, latency))
+            _snapshot_ms.observe_since(snapshot_start)
+            publish_snapshot(self.snapshot_queue, snap)
+            scheduler.built()
+            if latency:
+                _latency_ms.observe(latency * 1e3)
+        else:
+            _snapshot_skipped.inc()
+        _loop_ms.observe_since(tick_start)
+        scheduler.ticked(self._pending)
+
+    def _stats(self, batch_size: int, latency: float) -> dict:
+        dropped = sum(counters["dropped"] for counters in self._sources.values())
+        stats = {
+            "batch_size": batch_size,
+            "batch_max": self._batch_max,
+            "ingested": self._ingested,
+            "backlog": self._pending,
+            "dropped": dropped,
+            "latency_ms": round(latency * 1e3, 1),
+        }
+        for name, counters in self._sources.items():
+            for key, value in counters.items():
+                stats[f"{name}.{key}"] = value
+        _backlog.set(stats["backlog"])
+        _dropped.set(dropped)
+        return stats
+
+    def _drain_queues(self) -> None:
+        for queue in (self.observation_queue, self.snapshot_queue):
+            try:
+                while True:
+                    queue.get_nowait()
+            except Empty:
+                pass
@@ -0,0 +1,227 @@
+"""Runtime variant running the Tracker in a worker process with shared-memory snapshots."""
+
+import logging
+import multiprocessing
+import threading
+import time
+from queue import Empty, Full, Queue
+from types import ModuleType, SimpleNamespace
+from typing import Dict, Optional
+
+from rf_radar.app.runtime import publish_snapshot
+from rf_radar.app.supervisor import ScannerSupervisor
+from rf_radar.core.models import ObservationBatch
+from rf_radar.core.tracker import Tracker
+from rf_radar.infrastructure import metrics
+from rf_radar.infrastructure.recording import SessionRecorder, create_session_recorder
+from rf_radar.infrastructure.shared_snapshot import SharedSnapshotReader, SharedSnapshotWriter
+
+logger = logging.getLogger(__name__)
+
+_forwarded = metrics.registry.counter("core.forwarded")
+_backlog = metrics.registry.gauge("queue.backlog")
+_dropped = metrics.registry.gauge("queue.dropped")
+
+
+def _config_values(config) -> Dict[str, object]:
+    """Upper-case settings of ``config`` in a picklable form for the worker process."""
+    return {
+        name: getattr(config, name)
+        for name in dir(config)
+        if name.isupper() and not isinstance(getattr(config, name), ModuleType)
+    }
+
+
+def _core_worker(settings: Dict[str, object], shm_name: str, inbox, stop_event) -> None:
+    """Worker process loop: ingest batches, tick the tracker, publish snapshots to shared memory."""
+    config = SimpleNamespace(**settings)
+    writer = SharedSnapshotWriter.attach(shm_name)
+    tracker = Tracker(config)
+    interval = 1.0 / float(config.CORE_TICK_RATE)
+    extra: Dict[str, object] = {}
+    ingested = 0
+    batch_max = 0
+    last = None
+    try:
+        while not stop_event.is_set():
+            iteration_start = time.time()
+            ids, rssi, ts, sources = [], [], [], []
+            try:
+                message = inbox.get(timeout=interval)
+                while True:
+                    batch, extra = message
+                    ids.extend(batch.ids)
+                    rssi.extend(batch.rssi)
+                    ts.extend(batch.ts)
+                    sources.extend(batch.sources)
+                    message = inbox.get_nowait()
+            except Empty:
+                pass
+
+            if ids:
+                tracker.update_many(ObservationBatch(ids=ids, rssi=rssi, ts=ts, sources=sources))
+            now_ts = ts[-1] if ts else time.time()
+            tracker.tick(now_ts)
+            ingested += len(ids)
+            batch_max = max(batch_max, len(ids))
+            stats = dict(extra, batch_size=len(ids), batch_max=batch_max, ingested=ingested)
+            snap = tracker.build_snapshot(now_ts, extra_stats=stats)
+            if snap is not last:
+                writer.write(snap)
+                last = snap
+
+            remaining = interval - (time.time() - iteration_start)
+            if remaining > 0:
+                stop_event.wait(remaining)
+    finally:
+        writer.close()
+
+
+class ProcessRuntime:
+    """Runtime running the Tracker in a separate process.
+
+    Scanners stay in this process under a ``ScannerSupervisor``; a forwarder
+    thread ships their observations to the worker as columnar batches over a
+    ``multiprocessing`` queue. The worker publishes snapshots into a
+    double-buffered shared memory segment, and a reader thread decodes each new
+    one straight from shared memory into ``snapshot_queue``, so the UI keeps
+    consuming ``Snapshot`` objects exactly as with ``Runtime``.
+    """
+
+    def __init__(
+        self,
+        config,
+        observation_queue: Queue,
+        snapshot_queue: Queue,
+        supervisor: Optional[ScannerSupervisor] = None,
+    ) -> None:
+        self.config = config
+        self.observation_queue = observation_queue
+        self.snapshot_queue = snapshot_queue
+        self.supervisor = supervisor or ScannerSupervisor(config, inputs={"input": observation_queue})
+        self.core_interval = 1.0 / float(config.CORE_TICK_RATE)
+        self.max_batch = int(getattr(config, "CORE_MAX_BATCH", 1))
+        self.batch_budget = float(getattr(config, "CORE_BATCH_BUDGET", self.core_interval))
+        self.capacity = int(getattr(config, "PROCESS_SNAPSHOT_CAPACITY", 16384))
+        self.poll_interval = 1.0 / float(getattr(config, "UI_FPS", 30))
+
+        self._context = multiprocessing.get_context("spawn")
+        self.stop_event = threading.Event()
+        self.worker: Optional[multiprocessing.process.BaseProcess] = None
+        self.forward_thread: Optional[threading.Thread] = None
+        self.reader_thread: Optional[threading.Thread] = None
+        self._worker_stop = None
+        self._inbox = None
+        self._writer: Optional[SharedSnapshotWriter] = None
+        self.recorder: Optional[SessionRecorder] = None
+        self.metrics_dumper: Optional[metrics.JsonLinesDumper] = None
+        self._forward_dropped = 0
+
+    def start(self) -> None:
+        """Start the worker process, scanners and hand-off threads."""
+        if self.is_running():
+            return
+        self.stop_event.clear()
+        self._writer = SharedSnapshotWriter.create(self.capacity)
+        self._inbox = self._context.Queue(maxsize=int(getattr(self.config, "PROCESS_INBOX_MAXSIZE", 64)))
+        self._worker_stop = self._context.Event()
+        self.worker = self._context.Process(
+            target=_core_worker,
+            args=(_config_values(self.config), self._writer.name, self._inbox, self._worker_stop),
+            name="RuntimeCoreProcess",
+            daemon=True,
+        )
+        self.worker.start()
+        self.recorder = create_session_recorder(self.config, start_ts=time.time())
+        self.metrics_dumper = metrics.create_dumper(self.config, metrics.registry)
+        if self.metrics_dumper:
+            self.metrics_dumper.start()
+        self.supervisor.start()
+
+        self.forward_thread = threading.Thread(target=self._forward_loop, name="RuntimeForward", daemon=True)
+        self.forward_thread.start()
+        self.reader_thread = threading.Thread(target=self._reader_loop, name="RuntimeSnapshots", daemon=True)
+        self.reader_thread.start()
+
+    def stop(self) -> None:
+        """Stop scanners, threads and the worker, then release the shared memory."""
+        self.stop_event.set()
+        self.supervisor.stop()
+        if self._worker_stop is not None:
+            self._worker_stop.set()
+        for thread in (self.forward_thread, self.reader_thread):
+            if thread:
+                thread.join(timeout=2.0)
+        if self.worker is not None:
+            self.worker.join(timeout=2.0)
+            if self.worker.is_alive():
+                logger.warning("Core worker did not stop in time; terminating it.")
+                self.worker.terminate()
+                self.worker.join(timeout=1.0)
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.metrics_dumper is not None:
+            self.metrics_dumper.stop()
+        if self._inbox is not None:
+            self._inbox.close()
+            self._inbox.cancel_join_thread()
+            self._inbox = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer.unlink()
+            self._writer = None
+
+    def is_running(self) -> bool:
+        """Return True while the worker process and the snapshot reader are alive."""
+        return bool(
+            self.worker is not None
+            and self.worker.is_alive()
+            and self.reader_thread is not None
+            and self.reader_thread.is_alive()
+        )
+
+    def _forward_loop(self) -> None:
+        """Ship fairly drained scanner output to the worker, one columnar batch per tick."""
+        while not self.stop_event.is_set():
+            batch = self.supervisor.drain(
+                max_items=self.max_batch,
+                timeout=self.core_interval,
+                budget=self.batch_budget,
+            )
+            if not batch:
+                continue
+            if self.recorder is not None:
+                self.recorder.record_many(batch)
+            stats = {
+                "backlog": self.supervisor.backlog(),
+                "dropped": self.supervisor.dropped() + self._forward_dropped,
+                "forward_dropped": self._forward_dropped,
+            }
+            stats.update(self.supervisor.stats())
+            _backlog.set(stats["backlog"])
+            _dropped.set(stats["dropped"])
+            try:
+                self._inbox.put_nowait((ObservationBatch.from_observations(batch), stats))
+                _forwarded.inc(len(batch))
+            except Full:
+                self._forward_dropped += len(batch)
+            except (OSError, ValueError):
+                return  # inbox closed during shutdown
+
+    def _reader_loop(self) -> None:
+        """Decode each newly published snapshot from shared memory into ``snapshot_queue``."""
+        reader = SharedSnapshotReader.attach(self._writer.name)
+        try:
+            while not self.stop_event.is_set():
+                if self.worker is not None and not self.worker.is_alive():
+                    logger.warning("Core worker exited (code %s)", self.worker.exitcode)
+                    return
+                snap = reader.read_if_new()
+                if snap is not None:
+                    self._publish_snapshot(snap)
+                self.stop_event.wait(self.poll_interval)
+        finally:
+            reader.close()
+
+    def _publish_snapshot(self, snap) -> None:
+        publish_snapshot(self.snapshot_queue, snap)
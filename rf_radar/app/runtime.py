@@ -7,24 +7,63 @@ import time
 from queue import Empty, Full, Queue
 from typing import Optional
 
+from rf_radar.app.scheduler import CoreScheduler
+from rf_radar.app.supervisor import ScannerSupervisor
+from rf_radar.core.models import ObservationBatch
 from rf_radar.core.tracker import Tracker
-from rf_radar.scanners.sim_scanner import SimScanner
+from rf_radar.infrastructure import metrics
+from rf_radar.infrastructure.queues import SnapshotMailbox
+from rf_radar.infrastructure.recording import SessionRecorder, create_session_recorder
 
 logger = logging.getLogger(__name__)
 
+_update_ms = metrics.registry.histogram("tracker.update_ms")
+_tick_ms = metrics.registry.histogram("tracker.tick_ms")
+_snapshot_ms = metrics.registry.histogram("tracker.snapshot_ms")
+_loop_ms = metrics.registry.histogram("core.loop_ms")
+_latency_ms = metrics.registry.histogram("snapshot.latency_ms")
+_ingested = metrics.registry.counter("core.ingested")
+_published = metrics.registry.counter("snapshot.published")
+_replaced = metrics.registry.counter("snapshot.replaced")
+_snapshot_dropped = metrics.registry.counter("snapshot.dropped")
+_snapshot_skipped = metrics.registry.counter("snapshot.skipped")
+_backlog = metrics.registry.gauge("queue.backlog")
+_scanner_dropped = metrics.registry.gauge("queue.dropped")
+_tick_interval_ms = metrics.registry.gauge("core.tick_interval_ms")
+_overruns = metrics.registry.gauge("core.tick_overruns")
 
-class Runtime:
-    """Runtime coordinates scanner and core processing in background threads."""
 
-    def __init__(self, config, observation_queue: Queue, snapshot_queue: Queue) -> None:
+class Runtime:
+    """Runtime coordinates scanners and core processing in background threads.
+
+    Scanners enabled in ``config`` run under a ``ScannerSupervisor``; the
+    ``observation_queue`` is drained alongside their queues as the "input"
+    source, so observations can still be injected from outside.
+    """
+
+    def __init__(
+        self,
+        config,
+        observation_queue: Queue,
+        snapshot_queue: Queue,
+        supervisor: Optional[ScannerSupervisor] = None,
+    ) -> None:
         self.config = config
         self.observation_queue = observation_queue
         self.snapshot_queue = snapshot_queue
         self.tracker: Optional[Tracker] = None
-        self.scanner: Optional[SimScanner] = None
+        self.recorder: Optional[SessionRecorder] = None
+        self.metrics_dumper: Optional[metrics.JsonLinesDumper] = None
+        self.supervisor = supervisor or ScannerSupervisor(config, inputs={"input": observation_queue})
         self.stop_event = threading.Event()
         self.core_thread: Optional[threading.Thread] = None
         self.core_interval = 1.0 / float(self.config.CORE_TICK_RATE)
+        self.max_batch = int(getattr(self.config, "CORE_MAX_BATCH", 1))
+        self.batch_budget = float(getattr(self.config, "CORE_BATCH_BUDGET", self.core_interval))
+        self.scheduler: Optional[CoreScheduler] = None
+        self._ingested = 0
+        self._batch_max = 0
+        self._tick_count = 0
 
     def start(self) -> None:
         """Initialize components and start processing threads."""
@@ -32,8 +71,16 @@ class Runtime:
             return
 
         self.tracker = Tracker(self.config)
-        self.scanner = SimScanner(self.observation_queue, self.config, scenario="C", seed=1)
-        self.scanner.start()
+        self.scheduler = CoreScheduler(
+            self.core_interval,
+            idle_interval_max=float(getattr(self.config, "CORE_IDLE_INTERVAL_MAX", self.core_interval)),
+            stats_interval=float(getattr(self.config, "CORE_STATS_INTERVAL", 1.0)),
+        )
+        self.recorder = create_session_recorder(self.config, start_ts=time.time())
+        self.metrics_dumper = metrics.create_dumper(self.config, metrics.registry)
+        if self.metrics_dumper:
+            self.metrics_dumper.start()
+        self.supervisor.start()
 
         self.core_thread = threading.Thread(target=self._core_loop, name="RuntimeCore", daemon=True)
         self.core_thread.start()
@@ -41,10 +88,13 @@ class Runtime:
     def stop(self) -> None:
         """Signal shutdown and wait for threads to finish."""
         self.stop_event.set()
-        if self.scanner:
-            self.scanner.stop()
+        self.supervisor.stop()
         if self.core_thread:
             self.core_thread.join(timeout=2.0)
+        if self.recorder:
+            self.recorder.close()
+        if self.metrics_dumper:
+            self.metrics_dumper.stop()
         self._drain_queues()
 
     def is_running(self) -> bool:
@@ -52,40 +102,90 @@ class Runtime:
         return bool(self.core_thread and self.core_thread.is_alive())
 
     def _core_loop(self) -> None:
-        """Core processing loop running in a background thread."""
+        """Core processing loop running in a background thread.
+
+        Between tick deadlines the loop feeds whatever the scanners deliver to
+        the tracker; at each deadline it advances the tracker and, when the
+        ``CoreScheduler`` wants one, publishes a snapshot. While the scheduler
+        is backed off the loop sleeps on the stop event instead of polling the
+        queues, so an idle core barely wakes up.
+        """
+        scheduler = self.scheduler
         while not self.stop_event.is_set():
-            iteration_start = time.time()
-            obs = None
-            try:
-                obs = self.observation_queue.get(timeout=self.core_interval)
-            except Empty:
-                pass
-
-            now_ts = obs.ts if obs else time.time()
-            if self.tracker:
-                if obs:
-                    self.tracker.update(obs)
-                self.tracker.tick(now_ts)
-                snap = self.tracker.build_snapshot(now_ts)
+            remaining = scheduler.remaining()
+            if scheduler.idle and remaining > 0:
+                if self.stop_event.wait(remaining):
+                    break
+                remaining = 0.0
+            batch = self.supervisor.drain(
+                max_items=self.max_batch,
+                timeout=remaining,
+                budget=self.batch_budget,
+            )
+            if batch:
+                self._ingest(batch)
+                scheduler.ingested(len(batch))
+            if scheduler.due():
+                self._tick(scheduler)
+
+    def _ingest(self, batch) -> None:
+        if self.recorder:
+            self.recorder.record_many(batch)
+        self._tick_count += len(batch)
+        self.scheduler.observed(batch[-1].ts)
+        if self.tracker:
+            update_start = time.perf_counter()
+            self.tracker.update_many(ObservationBatch.from_observations(batch))
+            _update_ms.observe_since(update_start)
+
+    def _tick(self, scheduler: CoreScheduler) -> None:
+        now_ts = scheduler.now_ts(time.time())
+        batch_size = self._tick_count
+        self._tick_count = 0
+        if self.tracker:
+            tick_start = time.perf_counter()
+            self.tracker.tick(now_ts)
+            _tick_ms.observe_since(tick_start)
+            if scheduler.should_build(self.tracker.has_changes(), self.snapshot_queue.empty()):
+                latency = scheduler.latency()
+                extra_stats = self._ingest_stats(batch_size)
+                extra_stats["latency_ms"] = round(latency * 1e3, 1)
+                snapshot_start = time.perf_counter()
+                snap = self.tracker.build_snapshot(now_ts, extra_stats=extra_stats)
+                _snapshot_ms.observe_since(snapshot_start)
                 self._publish_snapshot(snap)
-
-            elapsed = time.time() - iteration_start
-            remaining = self.core_interval - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
+                scheduler.built()
+                if latency:
+                    _latency_ms.observe(latency * 1e3)
+            else:
+                self._count_ingest(batch_size)
+                _snapshot_skipped.inc()
+            _loop_ms.observe_since(tick_start)
+        scheduler.ticked(self.supervisor.backlog())
+        _tick_interval_ms.set(scheduler.interval * 1e3)
+        _overruns.set(scheduler.overruns)
+
+    def _count_ingest(self, batch_size: int) -> None:
+        self._ingested += batch_size
+        self._batch_max = max(self._batch_max, batch_size)
+        _ingested.inc(batch_size)
+
+    def _ingest_stats(self, batch_size: int) -> dict:
+        self._count_ingest(batch_size)
+        stats = {
+            "batch_size": batch_size,
+            "batch_max": self._batch_max,
+            "ingested": self._ingested,
+            "backlog": self.supervisor.backlog(),
+            "dropped": self.supervisor.dropped(),
+        }
+        stats.update(self.supervisor.stats())
+        _backlog.set(stats["backlog"])
+        _scanner_dropped.set(stats["dropped"])
+        return stats
 
     def _publish_snapshot(self, snap) -> None:
-        try:
-            self.snapshot_queue.put_nowait(snap)
-        except Full:
-            try:
-                self.snapshot_queue.get_nowait()
-            except Empty:
-                pass
-            try:
-                self.snapshot_queue.put_nowait(snap)
-            except Full:
-                logger.debug("Snapshot queue still full; dropping snapshot.")
+        publish_snapshot(self.snapshot_queue, snap)
 
     def _drain_queues(self) -> None:
         try:
@@ -100,7 +200,49 @@ class Runtime:
             pass
 
 
-def install_signal_handlers(runtime: Runtime) -> None:
+def publish_snapshot(snapshot_queue: Queue, snap) -> None:
+    """Put ``snap`` on the queue, replacing an unread snapshot if the queue is full."""
+    if isinstance(snapshot_queue, SnapshotMailbox):
+        if snapshot_queue.put(snap):
+            _replaced.inc()
+        _published.inc()
+        return
+    try:
+        snapshot_queue.put_nowait(snap)
+        _published.inc()
+        return
+    except Full:
+        pass
+    try:
+        snapshot_queue.get_nowait()
+        _replaced.inc()
+    except Empty:
+        pass
+    try:
+        snapshot_queue.put_nowait(snap)
+        _published.inc()
+    except Full:
+        _snapshot_dropped.inc()
+        logger.debug("Snapshot queue still full; dropping snapshot.")
+
+
+def create_runtime(config, observation_queue: Queue, snapshot_queue: Queue):
+    """Build the runtime selected by ``config.RUNTIME_MODE`` ("thread", "process" or "async")."""
+    mode = getattr(config, "RUNTIME_MODE", "thread")
+    if mode == "process":
+        from rf_radar.app.process_runtime import ProcessRuntime
+
+        return ProcessRuntime(config, observation_queue, snapshot_queue)
+    if mode == "async":
+        from rf_radar.app.async_runtime import AsyncRuntime
+
+        return AsyncRuntime(config, observation_queue, snapshot_queue)
+    if mode != "thread":
+        logger.warning("Unknown RUNTIME_MODE %r; using the threaded runtime.", mode)
+    return Runtime(config, observation_queue, snapshot_queue)
+
+
+def install_signal_handlers(runtime) -> None:
     """Register signal handlers to stop the runtime gracefully."""
 
     def handler(signum, frame):
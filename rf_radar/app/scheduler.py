@@ -0,0 +1,115 @@
+"""Tick scheduling for the core loop on a monotonic clock."""
+
+import time
+from typing import Optional
+
+
+class CoreScheduler:
+    """Decide when the core loop ticks and when a tick builds a snapshot.
+
+    Ticks follow deadlines on a monotonic clock, so wall clock jumps do not
+    stretch or compress them. After a tick with no ingest, the interval doubles
+    up to ``idle_interval_max``, and the first ingest restores ``interval``.
+    When the queues still hold a backlog after a tick, the next tick is due
+    at once, so a burst is worked off at the drain budget instead of the
+    tick rate.
+
+    A snapshot is built on the first tick. After that, a tick builds one only
+    when the consumer has taken the previous one and either targets changed
+    or ``stats_interval`` has passed since the last build. ``latency`` is the
+    time since the oldest ingest not yet in a published snapshot.
+
+    Ticks are stamped on the observations' clock: ``now_ts`` is the newest
+    ingested timestamp advanced by the monotonic time since it was ingested,
+    so a tick that ingests nothing neither stands still nor jumps to a
+    different clock than the one the scanners stamp with.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        idle_interval_max: Optional[float] = None,
+        stats_interval: float = 1.0,
+        clock=time.monotonic,
+    ) -> None:
+        self.base_interval = interval
+        self.idle_interval_max = max(interval, idle_interval_max if idle_interval_max is not None else interval)
+        self.stats_interval = stats_interval
+        self.clock = clock
+        self.interval = interval
+        self.overruns = 0
+        self._deadline = clock() + interval
+        self._ingested = 0
+        self._pending_since: Optional[float] = None
+        self._last_build: Optional[float] = None
+        self._observed_ts: Optional[float] = None
+        self._observed_at = 0.0
+
+    @property
+    def idle(self) -> bool:
+        """True while the interval is backed off because nothing arrived."""
+        return self.interval > self.base_interval
+
+    def remaining(self) -> float:
+        """Seconds until the next tick is due, never negative."""
+        return max(0.0, self._deadline - self.clock())
+
+    def due(self) -> bool:
+        return self.clock() >= self._deadline
+
+    def ingested(self, count: int) -> None:
+        """Record ``count`` observations fed to the tracker since the last tick."""
+        if count <= 0:
+            return
+        self._ingested += count
+        if self._pending_since is None:
+            self._pending_since = self.clock()
+
+    def observed(self, ts: float) -> None:
+        """Record ``ts``, the timestamp of the newest observation just ingested."""
+        self._observed_ts = ts
+        self._observed_at = self.clock()
+
+    def now_ts(self, default: float) -> float:
+        """Current time on the observations' clock; ``default`` until something was ingested."""
+        if self._observed_ts is None:
+            return default
+        return self._observed_ts + (self.clock() - self._observed_at)
+
+    def should_build(self, changed: bool, consumed: bool) -> bool:
+        """Whether this tick should build and publish a snapshot."""
+        if self._last_build is None:
+            return True
+        if not consumed:
+            return False
+        return changed or self.clock() - self._last_build >= self.stats_interval
+
+    def latency(self) -> float:
+        """Seconds the oldest unpublished ingest has been waiting; 0.0 when none is."""
+        if self._pending_since is None:
+            return 0.0
+        return self.clock() - self._pending_since
+
+    def built(self) -> None:
+        """Record that a snapshot covering everything ingested so far was published."""
+        self._last_build = self.clock()
+        self._pending_since = None
+
+    def ticked(self, backlog: int = 0) -> None:
+        """Schedule the next tick from this tick's ingest and the remaining ``backlog``."""
+        now = self.clock()
+        if self._ingested or backlog:
+            self.interval = self.base_interval
+        else:
+            self.interval = min(self.interval * 2, self.idle_interval_max)
+        self._ingested = 0
+
+        if backlog:
+            self._deadline = now
+            return
+        deadline = self._deadline + self.interval
+        if deadline < now:
+            # The tick ran past its slot; start a fresh cadence instead of bunching ticks.
+            self.overruns += 1
+            deadline = now + self.interval
+        self._deadline = deadline
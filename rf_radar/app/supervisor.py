@@ -0,0 +1,260 @@
+"""Supervisor starting the enabled scanners, restarting crashed ones and merging their output."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from queue import Queue
+from typing import Any, Callable, Dict, List, Optional
+
+from rf_radar.infrastructure import queues
+
+logger = logging.getLogger(__name__)
+
+ScannerFactory = Callable[[Queue, Any], Any]
+
+
+def _sim_factory(observation_queue: Queue, config):
+    from rf_radar.scanners.sim_scanner import SimScanner
+
+    # Stamp wall-clock times like the WiFi and BLE scanners, so mixed sources share one clock.
+    return SimScanner(observation_queue, config, scenario="C", seed=1, start_ts=time.time())
+
+
+def _wifi_factory(observation_queue: Queue, config):
+    from rf_radar.scanners.wifi_scanner import WifiScanner
+
+    return WifiScanner(observation_queue, config)
+
+
+def _ble_factory(observation_queue: Queue, config):
+    from rf_radar.scanners.ble_scanner import BleScanner
+
+    return BleScanner(observation_queue, config)
+
+
+def default_factories(config) -> Dict[str, ScannerFactory]:
+    """Scanner factories for every source enabled in ``config``, in drain order."""
+    factories: Dict[str, ScannerFactory] = {}
+    if getattr(config, "ENABLE_WIFI", False):
+        factories["wifi"] = _wifi_factory
+    if getattr(config, "ENABLE_BLE", False):
+        factories["ble"] = _ble_factory
+    if getattr(config, "ENABLE_SIMULATOR", False):
+        factories["sim"] = _sim_factory
+    return factories
+
+
+@dataclass
+class _Source:
+    """Book-keeping for one observation source."""
+
+    name: str
+    queue: Queue
+    factory: Optional[ScannerFactory] = None
+    scanner: Any = None
+    restarts: int = 0
+    failures: int = 0
+    retry_at: Optional[float] = None
+    healthy_since: float = 0.0
+    unavailable: bool = False
+    retired_dropped: int = 0
+    ingested: int = 0
+    window_count: int = 0
+    rate: float = 0.0
+
+    @property
+    def dropped(self) -> int:
+        scanner = self.scanner
+        current = scanner.dropped if scanner is not None else 0
+        return self.retired_dropped + current
+
+
+class ScannerSupervisor:
+    """Run one scanner per enabled source, each feeding its own ``ObservationChannel``.
+
+    A monitor thread restarts scanners whose thread died, waiting
+    ``SCANNER_RESTART_BACKOFF`` seconds doubled per consecutive failure up to
+    ``SCANNER_RESTART_BACKOFF_MAX``. A scanner that stops and reports
+    ``unavailable`` (e.g. BLE without bleak or an adapter) is not restarted.
+    ``drain`` merges the per-source queues
+    round-robin with an equal share each, so a chatty source cannot starve
+    the others, and sleeps on a condition shared by the channels while they
+    are all empty. Extra queues passed as ``inputs`` are drained the same way
+    without a scanner behind them; they do not wake a waiting ``drain`` and
+    are picked up when it returns.
+    """
+
+    def __init__(
+        self,
+        config,
+        factories: Optional[Dict[str, ScannerFactory]] = None,
+        inputs: Optional[Dict[str, Queue]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.config = config
+        self.clock = clock
+        self.check_interval = float(getattr(config, "SCANNER_CHECK_INTERVAL", 0.5))
+        self.backoff = float(getattr(config, "SCANNER_RESTART_BACKOFF", 1.0))
+        self.backoff_max = float(getattr(config, "SCANNER_RESTART_BACKOFF_MAX", 30.0))
+        self.rate_window = float(getattr(config, "SCANNER_RATE_WINDOW", 1.0))
+
+        factories = default_factories(config) if factories is None else factories
+        self._notifier = threading.Condition()
+        self._sources: List[_Source] = [
+            _Source(name, queues.create_observation_channel(config, self._notifier), factory)
+            for name, factory in factories.items()
+        ]
+        for name, queue in (inputs or {}).items():
+            self._sources.append(_Source(name, queue))
+        self._queues = [source.queue for source in self._sources]
+        self._next_start = 0
+        self._window_start = clock()
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._monitor: threading.Thread | None = None
+
+    @property
+    def names(self) -> List[str]:
+        """Source names in drain order."""
+        return [source.name for source in self._sources]
+
+    def scanner(self, name: str):
+        """Currently running scanner of source ``name``, or None."""
+        for source in self._sources:
+            if source.name == name:
+                return source.scanner
+        return None
+
+    def start(self) -> None:
+        """Start every scanner and the monitor thread."""
+        if self._monitor is not None and self._monitor.is_alive():
+            return
+        now = self.clock()
+        with self._lock:
+            for source in self._sources:
+                if source.factory is not None:
+                    self._launch(source, now)
+        self._monitor = threading.Thread(target=self._run, name="ScannerSupervisor", daemon=True)
+        self._monitor.start()
+
+    def stop(self) -> None:
+        """Stop the monitor and every scanner."""
+        self._stop_event.set()
+        if self._monitor is not None:
+            self._monitor.join(timeout=2.0)
+        with self._lock:
+            for source in self._sources:
+                self._halt(source)
+        self._stop_event.clear()
+
+    def drain(self, max_items: int, timeout: float, budget: float) -> List:
+        """Fairly collect up to ``max_items`` observations from all sources."""
+        batches = queues.drain_fair(
+            self._queues, max_items, timeout, budget, start=self._next_start, notifier=self._notifier
+        )
+        if self._queues:
+            self._next_start = (self._next_start + 1) % len(self._queues)
+        merged: List = []
+        for source, batch in zip(self._sources, batches):
+            if batch:
+                source.ingested += len(batch)
+                source.window_count += len(batch)
+                merged.extend(batch)
+        return merged
+
+    def backlog(self) -> int:
+        """Observations waiting in all source queues."""
+        return sum(queue.qsize() for queue in self._queues)
+
+    def dropped(self) -> int:
+        """Observations dropped by all scanners, including restarted instances."""
+        return sum(source.dropped for source in self._sources)
+
+    def stats(self) -> Dict[str, float]:
+        """Per-source ingest rate, totals, drops and restarts keyed ``<source>.<metric>``.
+
+        Counters a running scanner reports in its ``metrics`` property are
+        included under the same prefix.
+        """
+        now = self.clock()
+        elapsed = now - self._window_start
+        if elapsed >= self.rate_window:
+            for source in self._sources:
+                source.rate = source.window_count / elapsed
+                source.window_count = 0
+            self._window_start = now
+        stats: Dict[str, float] = {}
+        for source in self._sources:
+            prefix = source.name
+            stats[f"{prefix}.rate"] = source.rate
+            stats[f"{prefix}.ingested"] = source.ingested
+            stats[f"{prefix}.backlog"] = source.queue.qsize()
+            if isinstance(source.queue, queues.ObservationChannel):
+                stats[f"{prefix}.high_water"] = source.queue.high_water
+            if source.factory is not None:
+                stats[f"{prefix}.dropped"] = source.dropped
+                stats[f"{prefix}.restarts"] = source.restarts
+                scanner = source.scanner
+                stats[f"{prefix}.alive"] = int(scanner is not None and scanner.is_alive())
+                stats[f"{prefix}.unavailable"] = int(source.unavailable)
+                for name, value in getattr(scanner, "metrics", {}).items():
+                    stats.setdefault(f"{prefix}.{name}", value)
+        return stats
+
+    def check(self) -> None:
+        """Restart scanners that died once their backoff delay has passed."""
+        now = self.clock()
+        with self._lock:
+            for source in self._sources:
+                if source.factory is None or source.unavailable:
+                    continue
+                if source.scanner is not None and source.scanner.is_alive():
+                    if source.failures and now - source.healthy_since >= self.backoff_max:
+                        source.failures = 0
+                    continue
+                if getattr(source.scanner, "unavailable", False):
+                    source.unavailable = True
+                    self._halt(source)
+                    logger.info("Scanner %s unavailable; not restarting it", source.name)
+                    continue
+                if source.retry_at is None:
+                    source.failures += 1
+                    delay = min(self.backoff_max, self.backoff * 2 ** (source.failures - 1))
+                    source.retry_at = now + delay
+                    logger.warning("Scanner %s stopped; restarting in %.1fs", source.name, delay)
+                    continue
+                if now >= source.retry_at:
+                    self._halt(source)
+                    source.restarts += 1
+                    self._launch(source, now)
+
+    def _launch(self, source: _Source, now: float) -> None:
+        source.retry_at = None
+        source.healthy_since = now
+        try:
+            source.scanner = source.factory(source.queue, self.config)
+            source.scanner.start()
+        except Exception:
+            logger.warning("Scanner %s failed to start", source.name, exc_info=True)
+            self._halt(source)
+
+    def _halt(self, source: _Source) -> None:
+        scanner = source.scanner
+        if scanner is None:
+            return
+        try:
+            scanner.stop()
+        except Exception:
+            logger.warning("Scanner %s failed to stop cleanly", source.name, exc_info=True)
+        source.retired_dropped += scanner.dropped
+        source.scanner = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.check_interval):
+            try:
+                self.check()
+            except Exception:
+                logger.warning("Scanner supervision failed", exc_info=True)
+
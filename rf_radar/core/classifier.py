@@ -1,8 +1,8 @@
 """Minimal placeholder classifier."""
 
-from rf_radar.core.models import Target, TargetKind
+from rf_radar.core.models import TargetKind, TargetView
 
 
-def classify(target: Target) -> TargetKind:
+def classify(target: TargetView) -> TargetKind:
     """Return a placeholder classification for the target."""
     return TargetKind.UNKNOWN
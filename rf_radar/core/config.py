@@ -1,10 +1,24 @@
 """Centralized configuration values for RF Presence Radar."""
 
 # Runtime / Performance
+RUNTIME_MODE = "thread"  # "process" runs the tracker in a worker process; "async" runs scanners as asyncio tasks
+PROCESS_SNAPSHOT_CAPACITY = 16384  # max targets per shared-memory snapshot
+PROCESS_INBOX_MAXSIZE = 64  # observation batches buffered for the worker process
+ASYNC_INBOX_MAXSIZE = 256  # scans/windows buffered between async producers and the core task
 UI_FPS = 30
+UI_PARTIAL_REDRAW = True  # push only changed screen areas and skip unchanged frames
 CORE_TICK_RATE = 10
 OBS_QUEUE_MAXSIZE = 256
+OBS_CHANNEL_CAPACITY = 4096  # per-scanner ring buffer size
+OBS_CHANNEL_POLICY = "drop_oldest"  # or "drop_newest" when the buffer is full
 SNAPSHOT_QUEUE_MAXSIZE = 1
+CORE_MAX_BATCH = 1024  # max observations drained per core tick
+CORE_BATCH_BUDGET = 0.05  # seconds per tick spent draining observations
+CORE_IDLE_INTERVAL_MAX = 0.5  # tick interval backs off up to this when nothing arrives
+CORE_STATS_INTERVAL = 1.0  # rebuild an unchanged snapshot this often to refresh its stats
+UI_METRICS_OVERLAY = False  # start with the metrics overlay shown; toggle with M
+METRICS_DUMP_PATH = None  # append a JSON line of all metrics to this file; None disables
+METRICS_DUMP_INTERVAL = 10.0  # seconds between metric dumps
 
 # RSSI / Señal
 RSSI_MIN = -100
@@ -15,14 +29,39 @@ RSSI_BANDS = [(-100, -80), (-79, -60), (-59, -40), (-39, -20)]
 RADII_NORMALIZED = [1.0, 0.8, 0.55, 0.3]
 TARGET_UPDATE_INTERVAL = 10  # seconds
 TARGET_LOG_INTERVAL = 10  # seconds
-TARGET_DEBUG_LOG = False
+TARGET_DEBUG_LOG = False  # per-target TARGET debug records; also needs LOG_LEVEL = "DEBUG"
 VIEW_NAMES = ("LIST", "FAR", "NEAR")
+ANGLE_HASH = "blake2b"  # "sha256" reproduces angles of sessions recorded before the switch
+ANGLE_CACHE_SIZE = 4096
+
+# Session recording
+RECORD_PATH = None  # path of a session log to record observations into; None disables
+RECORD_COMPRESS = True
+RECORD_CHUNK_RECORDS = 8192
+RECORD_FLUSH_INTERVAL = 5.0  # seconds; buffered observations are written at least this often
 
 # Modos
 ENABLE_WIFI = False
 ENABLE_BLE = False
 ENABLE_SIMULATOR = True
+SCANNER_CHECK_INTERVAL = 0.5  # seconds between scanner liveness checks
+SCANNER_RESTART_BACKOFF = 1.0  # first restart delay; doubles per consecutive failure
+SCANNER_RESTART_BACKOFF_MAX = 30.0
+SCANNER_RATE_WINDOW = 1.0  # seconds over which per-source ingest rates are measured
+
+# WiFi
+WIFI_BACKEND = "nmcli"  # "iw" needs root
+WIFI_INTERFACE = "wlan0"
+WIFI_SCAN_INTERVAL = 5.0  # seconds between scans
+WIFI_SCAN_TIMEOUT = 15.0  # seconds before a hung scan command is killed
+
+# BLE
+BLE_COALESCE_WINDOW = 0.5  # seconds of advertisements folded into one observation per address
+BLE_RSSI_AGGREGATE = "max"  # "max" or "mean" of the window
 
 # Logging
-LOG_LEVEL = "DEBUG"
-TARGET_DEBUG_LOG = True
+LOG_LEVEL = "INFO"
+LOG_ASYNC = True  # format and write log records on a listener thread
+LOG_RATE_LIMIT = 20.0  # records per second per event type below WARNING; 0 disables
+LOG_RATE_BURST = 50
+UI_DEBUG_LOG = False  # per-target UI_DRAW debug records; also needs LOG_LEVEL = "DEBUG"
@@ -2,30 +2,160 @@
 
 import hashlib
 import math
-from typing import Tuple
+import zlib
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Tuple
 
 
-def angle_from_id(id: str) -> float:
-    """Deterministically map an identifier to an angle in radians within [0, 2π)."""
-    digest = hashlib.sha256(id.encode("utf-8")).digest()
+def _sha256_fraction(data: bytes) -> float:
+    digest = hashlib.sha256(data).digest()
     value = int.from_bytes(digest[:8], byteorder="big", signed=False)
-    fraction = (value % (1 << 64)) / float(1 << 64)
-    return fraction * (2 * math.pi)
+    return (value % (1 << 64)) / float(1 << 64)
 
 
-def radius_from_rssi_band(rssi: int, config) -> Tuple[float, int]:
-    """Map RSSI into a quantized radius and return its band index."""
-    rssi_clamped = max(config.RSSI_MIN, min(config.RSSI_MAX, rssi))
-    bands = config.RSSI_BANDS
-    radii = config.RADII_NORMALIZED
+def _blake2b_fraction(data: bytes) -> float:
+    digest = hashlib.blake2b(data, digest_size=8).digest()
+    return (int.from_bytes(digest, byteorder="big", signed=False) >> 11) / float(1 << 53)
+
+
+def _crc32_fraction(data: bytes) -> float:
+    return zlib.crc32(data) / float(1 << 32)
+
+
+# Hash functions mapping id bytes to a fraction in [0, 1). "sha256" reproduces
+# the angles of earlier versions and recorded sessions; the others are cheaper.
+ANGLE_HASHES: Dict[str, Callable[[bytes], float]] = {
+    "sha256": _sha256_fraction,
+    "blake2b": _blake2b_fraction,
+    "crc32": _crc32_fraction,
+}
+
+
+def angle_from_id(id: str, algorithm: str = "sha256") -> float:
+    """Deterministically map an identifier to an angle in radians within [0, 2π)."""
+    return ANGLE_HASHES[algorithm](id.encode("utf-8")) * (2 * math.pi)
+
+
+class AngleResolver:
+    """Memoized ``angle_from_id`` with a bounded LRU cache.
+
+    Ids that churn in and out of the tracker (e.g. randomized BLE MACs going
+    GONE and coming back) resolve from the cache instead of being hashed again.
+    """
+
+    def __init__(self, algorithm: str = "sha256", max_entries: int = 4096) -> None:
+        if algorithm not in ANGLE_HASHES:
+            raise ValueError(f"Unknown angle hash algorithm: {algorithm}")
+        self.algorithm = algorithm
+        fraction = ANGLE_HASHES[algorithm]
+        full_turn = 2 * math.pi
+
+        @lru_cache(maxsize=max_entries)
+        def resolve(id: str) -> float:
+            return fraction(id.encode("utf-8")) * full_turn
+
+        self.resolve: Callable[[str], float] = resolve
+
+    def resolve_many(self, ids: Iterable[str]) -> List[float]:
+        """Resolve angles in radians for many ids at once, in input order."""
+        resolve = self.resolve
+        return [resolve(id) for id in ids]
+
+    def cache_info(self):
+        """Hit/miss statistics of the underlying LRU cache."""
+        return self.resolve.cache_info()
+
 
-    for idx, ((low, high), radius) in enumerate(zip(bands, radii)):
-        if low <= rssi_clamped <= high:
-            return radius, idx
+_angle_resolvers: Dict[Tuple[str, int], AngleResolver] = {}
 
-    if rssi_clamped < bands[0][0]:
-        return radii[0], 0
-    return radii[-1], len(radii) - 1
+
+def angle_resolver(config) -> AngleResolver:
+    """Return the shared resolver for the configured ``ANGLE_HASH`` and ``ANGLE_CACHE_SIZE``."""
+    key = (getattr(config, "ANGLE_HASH", "sha256"), getattr(config, "ANGLE_CACHE_SIZE", 4096))
+    resolver = _angle_resolvers.get(key)
+    if resolver is None:
+        resolver = _angle_resolvers[key] = AngleResolver(*key)
+    return resolver
+
+
+class BandMapper:
+    """RSSI band lookup compiled once from the configured range and bands.
+
+    Bands are treated as contiguous: each band starts at its configured lower
+    bound and extends up to the next band's lower bound, so fractional values
+    between two integer bands (e.g. -79.5 with bands ending at -80 and starting
+    at -79) fall into the lower band. With integer band bounds, which is what
+    the config uses, integer and float RSSI alike are answered from a dense
+    table over ``[RSSI_MIN, RSSI_MAX]`` indexed by the floored offset; other
+    bounds fall back to ``bisect``.
+    """
+
+    def __init__(self, rssi_min: int, rssi_max: int, bands, radii) -> None:
+        self.rssi_min = rssi_min
+        self.rssi_max = rssi_max
+        self.bands = [tuple(band) for band in bands]
+        self.radii = list(radii)
+        self._lows = [low for low, _ in self.bands]
+        self._table = [self._search(value) for value in range(int(rssi_min), int(rssi_max) + 1)]
+        self._dense = float(rssi_min).is_integer() and all(float(low).is_integer() for low in self._lows)
+
+    @classmethod
+    def from_config(cls, config) -> "BandMapper":
+        """Compile a mapper from ``RSSI_MIN``/``RSSI_MAX``/``RSSI_BANDS``/``RADII_NORMALIZED``."""
+        return cls(config.RSSI_MIN, config.RSSI_MAX, config.RSSI_BANDS, config.RADII_NORMALIZED)
+
+    def lookup(self, rssi) -> Tuple[float, int]:
+        """Map RSSI into a quantized radius and return its band index."""
+        if rssi <= self.rssi_min:
+            return self._table[0]
+        if rssi >= self.rssi_max:
+            return self._table[-1]
+        if self._dense:
+            # The offset is positive here, so int() floors it.
+            return self._table[int(rssi - self.rssi_min)]
+        return self._search(rssi)
+
+    def lookup_many(self, values: Iterable[float]) -> Tuple[List[float], List[int]]:
+        """Vectorized ``lookup``: return parallel lists of radii and band indices."""
+        lookup = self.lookup
+        radii: List[float] = []
+        bands: List[int] = []
+        for value in values:
+            radius, band = lookup(value)
+            radii.append(radius)
+            bands.append(band)
+        return radii, bands
+
+    def _search(self, rssi) -> Tuple[float, int]:
+        idx = max(0, min(len(self.radii) - 1, bisect_right(self._lows, rssi) - 1))
+        return self.radii[idx], idx
+
+
+@lru_cache(maxsize=16)
+def _compiled_band_mapper(rssi_min, rssi_max, bands, radii) -> BandMapper:
+    return BandMapper(rssi_min, rssi_max, bands, radii)
+
+
+def band_mapper(config) -> BandMapper:
+    """Return the compiled band mapper for the current range and bands of ``config``.
+
+    Mappers are cached by value, so a changed range or zoom compiles a new one.
+    Building the key costs about as much as a lookup, so hot paths should
+    resolve the mapper once and call its ``lookup`` directly, as ``Tracker``
+    does, refreshing it on each tick.
+    """
+    return _compiled_band_mapper(
+        config.RSSI_MIN,
+        config.RSSI_MAX,
+        tuple(tuple(band) for band in config.RSSI_BANDS),
+        tuple(config.RADII_NORMALIZED),
+    )
+
+
+def radius_from_rssi_band(rssi: int, config) -> Tuple[float, int]:
+    """Map RSSI into a quantized radius and return its band index."""
+    return band_mapper(config).lookup(rssi)
 
 
 def radius_from_rssi(rssi: int, config) -> float:
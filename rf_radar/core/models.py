@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, FrozenSet, Iterable, NamedTuple, Optional, Sequence, Set
 
 
 class ObservationSource(Enum):
@@ -13,6 +13,17 @@ class ObservationSource(Enum):
     SIM = "SIM"
 
 
+SOURCE_BITS: Dict[ObservationSource, int] = {
+    source: 1 << idx for idx, source in enumerate(ObservationSource)
+}
+
+
+_SOURCE_SETS = tuple(
+    frozenset(source for source, bit in SOURCE_BITS.items() if bits & bit)
+    for bits in range(1 << len(SOURCE_BITS))
+)
+
+
 @dataclass(frozen=True)
 class Observation:
     """Immutable raw observation produced by scanners."""
@@ -24,6 +35,37 @@ class Observation:
     meta: Optional[Dict[str, Any]] = None
 
 
+@dataclass(frozen=True)
+class ObservationBatch:
+    """Columnar batch of observations; index ``i`` across all columns is one observation."""
+
+    ids: Sequence[str]
+    rssi: Sequence[int]
+    ts: Sequence[float]
+    sources: Sequence[ObservationSource]
+
+    def __post_init__(self) -> None:
+        if not len(self.ids) == len(self.rssi) == len(self.ts) == len(self.sources):
+            raise ValueError("ObservationBatch columns must have the same length.")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_observations(cls, observations: Iterable[Observation]) -> "ObservationBatch":
+        """Build a columnar batch from a sequence of observations, preserving order."""
+        ids = []
+        rssi = []
+        ts = []
+        sources = []
+        for obs in observations:
+            ids.append(obs.id)
+            rssi.append(obs.rssi)
+            ts.append(obs.ts)
+            sources.append(obs.source)
+        return cls(ids=ids, rssi=rssi, ts=ts, sources=sources)
+
+
 class TargetState(Enum):
     """Lifecycle state of a tracked target."""
 
@@ -58,3 +100,22 @@ class Target:
     def __post_init__(self) -> None:
         if not 0.0 <= self.radius_norm <= 1.0:
             raise ValueError("radius_norm must be between 0 and 1 inclusive.")
+
+
+class TargetView(NamedTuple):
+    """Immutable, compact record of a target as published in snapshots."""
+
+    id: str
+    source_bits: int
+    rssi_raw_last: int
+    rssi_filt: float
+    angle_deg: float
+    radius_norm: float
+    last_seen_ts: float
+    state: TargetState
+    kind: TargetKind
+
+    @property
+    def source_mask(self) -> FrozenSet[ObservationSource]:
+        """Sources that contributed to this target."""
+        return _SOURCE_SETS[self.source_bits]
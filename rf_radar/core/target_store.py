@@ -0,0 +1,287 @@
+"""Columnar storage for tracked targets."""
+
+import bisect
+import heapq
+from array import array
+from typing import Callable, Dict, Iterator, List, Mapping, Optional
+
+from rf_radar.core.models import TargetKind, TargetState, TargetView
+
+STATES = tuple(TargetState)
+KINDS = tuple(TargetKind)
+STATE_ACTIVE = STATES.index(TargetState.ACTIVE)
+STATE_STALE = STATES.index(TargetState.STALE)
+KIND_UNKNOWN = KINDS.index(TargetKind.UNKNOWN)
+_UNSCHEDULED = float("nan")  # deadline of a slot not filed in any ExpiryIndex bucket
+
+
+class TargetStore:
+    """Struct-of-arrays table holding per-target state.
+
+    Each target owns a slot; every column is indexed by that slot. Slots of
+    removed targets go to a free-list and are recycled for new ids, so the
+    columns only grow to the peak number of simultaneous targets.
+
+    ``rssi_raw``, ``angle_deg`` and ``radius_norm`` are plain lists rather than
+    arrays: their values are small ints, a per-target constant and one of the
+    configured radii, so keeping the objects lets every ``TargetView`` share
+    them instead of boxing fresh copies on each ``materialize``.
+    """
+
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = {}
+        self.ids: List[Optional[str]] = []
+        self.source_bits = array("B")
+        self.rssi_raw: List[int] = []
+        self.rssi_filt = array("d")
+        self.angle_deg: List[float] = []
+        self.radius_norm: List[float] = []
+        self.last_seen = array("d")
+        self.radius_update_ts = array("d")
+        self.log_ts = array("d")
+        self.band = array("b")
+        self.state = array("b")
+        self.kind = array("b")
+        self.created = array("Q")
+        self.state_counts = [0] * len(STATES)
+        self._free: List[int] = []
+        self._created_seq = 0
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def allocate(
+        self,
+        target_id: str,
+        source_bits: int,
+        rssi: int,
+        angle_deg: float,
+        radius_norm: float,
+        band: int,
+        ts: float,
+    ) -> int:
+        """Store a new ACTIVE target and return its slot."""
+        if self._free:
+            slot = self._free.pop()
+            self.ids[slot] = target_id
+            self.source_bits[slot] = source_bits
+            self.rssi_raw[slot] = int(rssi)
+            self.rssi_filt[slot] = rssi
+            self.angle_deg[slot] = angle_deg
+            self.radius_norm[slot] = radius_norm
+            self.last_seen[slot] = ts
+            self.radius_update_ts[slot] = ts
+            self.log_ts[slot] = float("-inf")
+            self.band[slot] = band
+            self.state[slot] = STATE_ACTIVE
+            self.kind[slot] = KIND_UNKNOWN
+            self.created[slot] = self._created_seq
+        else:
+            slot = len(self.ids)
+            self.ids.append(target_id)
+            self.source_bits.append(source_bits)
+            self.rssi_raw.append(int(rssi))
+            self.rssi_filt.append(rssi)
+            self.angle_deg.append(angle_deg)
+            self.radius_norm.append(radius_norm)
+            self.last_seen.append(ts)
+            self.radius_update_ts.append(ts)
+            self.log_ts.append(float("-inf"))
+            self.band.append(band)
+            self.state.append(STATE_ACTIVE)
+            self.kind.append(KIND_UNKNOWN)
+            self.created.append(self._created_seq)
+        self._created_seq += 1
+        self.state_counts[STATE_ACTIVE] += 1
+        self.index[target_id] = slot
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Remove the target stored in ``slot`` and recycle the slot."""
+        target_id = self.ids[slot]
+        if target_id is None:
+            return
+        del self.index[target_id]
+        self.state_counts[self.state[slot]] -= 1
+        self.ids[slot] = None
+        self._free.append(slot)
+
+    def set_state(self, slot: int, state: int) -> None:
+        """Change the state ordinal of ``slot``, keeping ``state_counts`` in sync."""
+        current = self.state[slot]
+        if current != state:
+            self.state_counts[current] -= 1
+            self.state_counts[state] += 1
+            self.state[slot] = state
+
+    def materialize(self, slot: int) -> TargetView:
+        """Build an immutable ``TargetView`` from the columns of ``slot``."""
+        return TargetView(
+            self.ids[slot],
+            self.source_bits[slot],
+            self.rssi_raw[slot],
+            self.rssi_filt[slot],
+            self.angle_deg[slot],
+            self.radius_norm[slot],
+            self.last_seen[slot],
+            STATES[self.state[slot]],
+            KINDS[self.kind[slot]],
+        )
+
+
+class ExpiryIndex:
+    """Per-slot deadlines bucketed by ``resolution`` seconds.
+
+    Each slot's current deadline lives in a ``deadline`` column and the slot
+    number is filed in an ``array('i')`` bucket for that deadline's interval,
+    so a scheduled target costs a float and an int instead of a heap tuple.
+    A heap holds one key per non-empty bucket. Rescheduling only files the
+    slot again; entries whose bucket no longer matches the slot's deadline
+    are skipped when their bucket comes due.
+    """
+
+    def __init__(self, store: TargetStore, resolution: float = 0.1) -> None:
+        self._store = store
+        self.resolution = resolution
+        self._deadline = array("d")
+        self._buckets: Dict[int, array] = {}
+        self._keys: List[int] = []
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def schedule(self, slot: int, deadline: float) -> None:
+        """Register ``deadline`` as the next time ``slot`` must be inspected."""
+        deadlines = self._deadline
+        if slot >= len(deadlines):
+            deadlines.extend([_UNSCHEDULED] * (slot + 1 - len(deadlines)))
+        key = int(deadline // self.resolution)
+        previous = deadlines[slot]
+        deadlines[slot] = deadline
+        if previous // self.resolution == key:
+            return  # already filed in this bucket
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = array("i")
+            heapq.heappush(self._keys, key)
+        bucket.append(slot)
+
+    def pop_due(self, now_ts: float) -> List[int]:
+        """Remove and return live slots whose deadline is at or before ``now_ts``."""
+        keys = self._keys
+        buckets = self._buckets
+        deadlines = self._deadline
+        ids = self._store.ids
+        resolution = self.resolution
+        due = []
+        while keys and keys[0] * resolution <= now_ts:
+            key = keys[0]
+            bucket = buckets[key]
+            pending = array("i")
+            for slot in bucket:
+                deadline = deadlines[slot]
+                if ids[slot] is None or deadline // resolution != key:
+                    continue
+                if deadline <= now_ts:
+                    deadlines[slot] = _UNSCHEDULED
+                    due.append(slot)
+                else:
+                    pending.append(slot)
+            if pending:
+                # Only the bucket holding ``now_ts`` can have entries not yet due.
+                buckets[key] = pending
+                break
+            heapq.heappop(keys)
+            del buckets[key]
+        return due
+
+
+class NearestIndex:
+    """Targets grouped by ``radius_norm``, each group in creation order, for nearest-target lookup.
+
+    ``radius_norm`` only takes the few configured band radii, so the nearest
+    target is the head of the non-empty group with the smallest radius. Ties
+    resolve to the oldest target, as with a scan over the targets in creation
+    order. Groups are ``array('i')`` of slots kept exact: ``push`` moves a slot
+    whose radius changed and ``remove`` drops a released one.
+    """
+
+    def __init__(self, store: TargetStore) -> None:
+        self._store = store
+        self._radii: List[float] = []
+        self._groups: List[array] = []
+        self._member = array("b")
+
+    def push(self, slot: int) -> None:
+        """File ``slot`` under its current radius, moving it out of its previous group."""
+        store = self._store
+        member = self._member
+        if slot >= len(member):
+            member.extend([-1] * (slot + 1 - len(member)))
+        radius = store.radius_norm[slot]
+        group = member[slot]
+        if group >= 0:
+            if self._radii[group] == radius:
+                return
+            self._discard(group, slot)
+        try:
+            group = self._radii.index(radius)
+        except ValueError:
+            group = self._add_group(radius)
+        slots = self._groups[group]
+        created = store.created
+        slots.insert(bisect.bisect_left(slots, created[slot], key=created.__getitem__), slot)
+        member[slot] = group
+
+    def remove(self, slot: int) -> None:
+        """Forget ``slot``; call before its target is released."""
+        if slot < len(self._member) and self._member[slot] >= 0:
+            self._discard(self._member[slot], slot)
+            self._member[slot] = -1
+
+    def nearest(self) -> Optional[str]:
+        """Return the id of the live target with the smallest radius, if any."""
+        for slots in self._groups:
+            if slots:
+                return self._store.ids[slots[0]]
+        return None
+
+    def _discard(self, group: int, slot: int) -> None:
+        slots = self._groups[group]
+        created = self._store.created
+        del slots[bisect.bisect_left(slots, created[slot], key=created.__getitem__)]
+
+    def _add_group(self, radius: float) -> int:
+        """Insert an empty group for ``radius`` keeping groups sorted by radius; returns its index."""
+        index = bisect.bisect_left(self._radii, radius)
+        self._radii.insert(index, radius)
+        self._groups.insert(index, array("i"))
+        member = self._member
+        for slot, group in enumerate(member):
+            if group >= index:
+                member[slot] = group + 1
+        return index
+
+
+class TargetTable(Mapping):
+    """Read-only ``id -> TargetView`` view over a ``TargetStore``.
+
+    Targets are materialized on access, so callers get immutable records and
+    never a handle on the store's internal state.
+    """
+
+    def __init__(self, store: TargetStore, materialize: Callable[[int], TargetView]) -> None:
+        self._store = store
+        self._materialize = materialize
+
+    def __getitem__(self, target_id: str) -> TargetView:
+        return self._materialize(self._store.index[target_id])
+
+    def __contains__(self, target_id: object) -> bool:
+        return target_id in self._store.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.index)
+
+    def __len__(self) -> int:
+        return len(self._store.index)
@@ -2,11 +2,26 @@
 
 import logging
 import math
-from dataclasses import replace
-from typing import Dict, Iterable, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set
 
 from rf_radar.core import classifier, mapping, snapshot
-from rf_radar.core.models import Observation, Target, TargetKind, TargetState
+from rf_radar.core.models import (
+    SOURCE_BITS,
+    Observation,
+    ObservationBatch,
+    ObservationSource,
+    TargetView,
+)
+from rf_radar.core.target_store import (
+    KINDS,
+    STATE_ACTIVE,
+    STATE_STALE,
+    ExpiryIndex,
+    NearestIndex,
+    TargetStore,
+    TargetTable,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,128 +31,270 @@ class Tracker:
 
     def __init__(self, config) -> None:
         self.config = config
-        self.targets: Dict[str, Target] = {}
-        self._target_bands: Dict[str, int] = {}
-        self._last_radius_update_ts: Dict[str, float] = {}
-        self._last_log_ts: Dict[str, float] = {}
+        self.store = TargetStore()
+        self._angles = mapping.angle_resolver(config)
+        self._bands = mapping.band_mapper(config)
+        self._expiry = ExpiryIndex(self.store)
+        self._nearest = NearestIndex(self.store)
+        self._dirty: Set[int] = set()
+        self._records: Dict[int, TargetView] = {}
+        self._removed = False
+        self._last_snapshot: Optional[snapshot.Snapshot] = None
+        self._last_extra_stats: Optional[Dict[str, Any]] = None
+        self._debug_log = bool(getattr(config, "TARGET_DEBUG_LOG", False))
+        self._log_interval = getattr(config, "TARGET_LOG_INTERVAL", 0.0)
+        self.targets: Mapping[str, TargetView] = TargetTable(self.store, self._materialize)
+
+    def reload_bands(self) -> None:
+        """Pick up the RSSI band mapping for the current range and bands in ``config`` (e.g. after a zoom).
+
+        ``tick`` calls this, so changes apply within one tick; the mapper is
+        only recompiled when the values changed. Existing targets keep their
+        radius until their next band change.
+        """
+        self._bands = mapping.band_mapper(self.config)
 
     def update(self, observation: Observation) -> None:
         """Ingest a new observation and update or create the corresponding target."""
-        target = self.targets.get(observation.id)
-
-        if target is None:
-            angle_rad = mapping.angle_from_id(observation.id)
-            angle_deg = math.degrees(angle_rad)
-            rssi_filt = observation.rssi
-            radius_norm, band_idx = mapping.radius_from_rssi_band(rssi_filt, self.config)
-            target = Target(
-                id=observation.id,
-                source_mask={observation.source},
-                rssi_raw_last=observation.rssi,
-                rssi_filt=rssi_filt,
-                angle_deg=angle_deg,
-                radius_norm=radius_norm,
-                last_seen_ts=observation.ts,
-                state=TargetState.ACTIVE,
-                kind=TargetKind.UNKNOWN,
-            )
-            target.kind = classifier.classify(target)
-            self.targets[observation.id] = target
-            self._target_bands[observation.id] = band_idx
-            self._last_radius_update_ts[observation.id] = observation.ts
-            self._maybe_log_debug(
-                observation.id,
+        store = self.store
+        slot = store.index.get(observation.id)
+        debug = self._debug_enabled()
+
+        if slot is None:
+            self._create_target(observation.id, observation.source, observation.rssi, observation.ts, debug)
+            return
+
+        prev_radius = store.radius_norm[slot]
+        alpha = self.config.RSSI_SMOOTHING
+        rssi_filt = (1 - alpha) * store.rssi_filt[slot] + alpha * observation.rssi
+        radius_norm, band_idx = self._bands.lookup(rssi_filt)
+        store.rssi_raw[slot] = int(observation.rssi)
+        store.rssi_filt[slot] = rssi_filt
+        store.last_seen[slot] = observation.ts
+        store.set_state(slot, STATE_ACTIVE)
+        store.source_bits[slot] |= SOURCE_BITS[observation.source]
+        self._dirty.add(slot)
+
+        elapsed = observation.ts - store.radius_update_ts[slot]
+        should_update_radius = (
+            band_idx != store.band[slot] and elapsed >= self.config.TARGET_UPDATE_INTERVAL
+        )
+
+        if should_update_radius:
+            store.radius_norm[slot] = radius_norm
+            store.band[slot] = band_idx
+            store.radius_update_ts[slot] = observation.ts
+            self._nearest.push(slot)
+
+        if debug:
+            radius = store.radius_norm[slot]
+            self._log_target(
+                slot,
                 observation.source.value,
                 observation.rssi,
                 rssi_filt,
-                band_idx,
-                radius_norm,
-                radius_norm,
-                0.0,
+                store.band[slot],
+                radius,
+                prev_radius,
+                radius - prev_radius,
                 observation.ts,
             )
-            return
 
-        prev_radius = target.radius_norm
+    def update_many(self, batch: ObservationBatch) -> None:
+        """Ingest a columnar batch of observations.
+
+        Observations are grouped by id and folded in batch order, so the result
+        matches calling ``update`` for each observation sequentially while the
+        per-target lookups and write-backs happen once per id.
+        """
+        ids = batch.ids
+        rssi = batch.rssi
+        ts = batch.ts
+        sources = batch.sources
+
+        groups: Dict[str, List[int]] = {}
+        for idx, obs_id in enumerate(ids):
+            group = groups.get(obs_id)
+            if group is None:
+                groups[obs_id] = [idx]
+            else:
+                group.append(idx)
+
+        store = self.store
         alpha = self.config.RSSI_SMOOTHING
-        target.rssi_raw_last = observation.rssi
-        target.rssi_filt = (1 - alpha) * target.rssi_filt + alpha * observation.rssi
-        radius_norm, band_idx = mapping.radius_from_rssi_band(target.rssi_filt, self.config)
-        target.last_seen_ts = observation.ts
-        target.state = TargetState.ACTIVE
-        target.source_mask.add(observation.source)
-        target.kind = classifier.classify(target)
-
-        last_band = self._target_bands.get(observation.id, band_idx)
-        last_update = self._last_radius_update_ts.get(observation.id, float("-inf"))
-        elapsed = observation.ts - last_update
-        should_update_radius = (
-            band_idx != last_band and elapsed >= self.config.TARGET_UPDATE_INTERVAL
-        )
+        keep = 1 - alpha
+        update_interval = self.config.TARGET_UPDATE_INTERVAL
+        debug = self._debug_enabled()
+        lookup_band = self._bands.lookup
 
-        if should_update_radius:
-            target.radius_norm = radius_norm
-            self._target_bands[observation.id] = band_idx
-            self._last_radius_update_ts[observation.id] = observation.ts
-
-        delta_radius = target.radius_norm - prev_radius
-        self._maybe_log_debug(
-            observation.id,
-            observation.source.value,
-            observation.rssi,
-            target.rssi_filt,
-            self._target_bands.get(observation.id, band_idx),
-            target.radius_norm,
-            prev_radius,
-            delta_radius,
-            observation.ts,
-        )
+        for obs_id, indices in groups.items():
+            slot = store.index.get(obs_id)
+            if slot is None:
+                first = indices[0]
+                slot = self._create_target(obs_id, sources[first], rssi[first], ts[first], debug)
+                indices = indices[1:]
+                if not indices:
+                    continue
+
+            rssi_filt = store.rssi_filt[slot]
+            radius_norm = store.radius_norm[slot]
+            band = store.band[slot]
+            last_update = store.radius_update_ts[slot]
+            source_bits = store.source_bits[slot]
+
+            for idx in indices:
+                obs_ts = ts[idx]
+                prev_radius = radius_norm
+                rssi_filt = keep * rssi_filt + alpha * rssi[idx]
+                new_radius, band_idx = lookup_band(rssi_filt)
+                if band_idx != band and obs_ts - last_update >= update_interval:
+                    radius_norm = new_radius
+                    band = band_idx
+                    last_update = obs_ts
+                source_bits |= SOURCE_BITS[sources[idx]]
+                if debug:
+                    self._log_target(
+                        slot,
+                        sources[idx].value,
+                        rssi[idx],
+                        rssi_filt,
+                        band,
+                        radius_norm,
+                        prev_radius,
+                        radius_norm - prev_radius,
+                        obs_ts,
+                    )
+
+            last = indices[-1]
+            radius_changed = radius_norm != store.radius_norm[slot]
+            store.rssi_raw[slot] = int(rssi[last])
+            store.rssi_filt[slot] = rssi_filt
+            store.radius_norm[slot] = radius_norm
+            store.band[slot] = band
+            store.radius_update_ts[slot] = last_update
+            store.last_seen[slot] = ts[last]
+            store.set_state(slot, STATE_ACTIVE)
+            store.source_bits[slot] = source_bits
+            self._dirty.add(slot)
+            if radius_changed:
+                self._nearest.push(slot)
 
     def tick(self, now_ts: float) -> None:
-        """Advance time-dependent state of targets."""
-        to_delete = []
+        """Advance time-dependent state of targets.
+
+        Only targets whose ACTIVE->STALE or STALE->GONE deadline has passed are
+        inspected. Deadlines are derived from ``last_seen_ts`` when scheduled;
+        a target refreshed since then is simply rescheduled from its new
+        ``last_seen_ts`` when its old deadline comes up. Band config changes
+        are picked up here, once per tick rather than per observation.
+        """
+        self.reload_bands()
+        store = self.store
+        last_seen = store.last_seen
         stale_timeout = self.config.RSSI_STALE_TIMEOUT
-        for target_id, target in self.targets.items():
-            age = now_ts - target.last_seen_ts
-            if age > 2 * stale_timeout:
-                target.state = TargetState.GONE
-                to_delete.append(target_id)
+        gone_timeout = 2 * stale_timeout
+        for slot in self._expiry.pop_due(now_ts):
+            seen = last_seen[slot]
+            age = now_ts - seen
+            if age > gone_timeout:
+                self._nearest.remove(slot)
+                store.release(slot)
+                self._records.pop(slot, None)
+                self._removed = True
             elif age > stale_timeout:
-                target.state = TargetState.STALE
-        for target_id in to_delete:
-            del self.targets[target_id]
-            self._target_bands.pop(target_id, None)
-            self._last_radius_update_ts.pop(target_id, None)
-            self._last_log_ts.pop(target_id, None)
-
-    def build_snapshot(self, now_ts: float) -> snapshot.Snapshot:
-        """Create an immutable snapshot of the current targets."""
-        active_targets: Iterable[Target] = (
-            tgt for tgt in self.targets.values() if tgt.state != TargetState.GONE
-        )
-        cloned_targets: Tuple[Target, ...] = tuple(replace(tgt) for tgt in active_targets)
+                if store.state[slot] != STATE_STALE:
+                    store.set_state(slot, STATE_STALE)
+                    self._dirty.add(slot)
+                self._expiry.schedule(slot, seen + gone_timeout)
+            else:
+                self._expiry.schedule(slot, seen + stale_timeout)
+
+    def has_changes(self) -> bool:
+        """True when targets changed since the last ``build_snapshot``."""
+        return self._removed or bool(self._dirty)
+
+    def build_snapshot(
+        self, now_ts: float, extra_stats: Optional[Mapping[str, Any]] = None
+    ) -> snapshot.Snapshot:
+        """Create an immutable snapshot of the current targets.
 
-        selected_id = None
-        if cloned_targets:
-            closest = min(cloned_targets, key=lambda t: t.radius_norm)
-            selected_id = closest.id
+        Only targets changed since the previous snapshot are materialized again;
+        unchanged records are reused. When nothing changed at all, the previous
+        snapshot is returned as is, so its ``now_ts`` is the time of the last
+        change. ``extra_stats`` are merged into the snapshot stats, letting the
+        runtime report ingest counters alongside the target counts.
+        """
+        store = self.store
+        changed = self.has_changes()
+        for slot in self._dirty:
+            if store.ids[slot] is not None:
+                self._records[slot] = self._materialize(slot)
+        self._dirty.clear()
+        self._removed = False
+
+        extra = dict(extra_stats) if extra_stats else {}
+        previous = self._last_snapshot
+        if previous is not None and not changed and extra == self._last_extra_stats:
+            return previous
 
         stats = {
-            "total": len(cloned_targets),
-            "active": sum(1 for t in cloned_targets if t.state == TargetState.ACTIVE),
-            "stale": sum(1 for t in cloned_targets if t.state == TargetState.STALE),
+            "total": len(store),
+            "active": store.state_counts[STATE_ACTIVE],
+            "stale": store.state_counts[STATE_STALE],
         }
+        stats.update(extra)
 
-        return snapshot.Snapshot(
-            targets=cloned_targets,
-            stats=stats,
-            selected_id=selected_id,
+        snap = snapshot.Snapshot(
+            targets=tuple(self._records.values()) if changed or previous is None else previous.targets,
+            stats=MappingProxyType(stats),
+            selected_id=self._nearest.nearest(),
             now_ts=now_ts,
         )
+        self._last_snapshot = snap
+        self._last_extra_stats = extra
+        return snap
+
+    def _create_target(
+        self, target_id: str, source: ObservationSource, rssi: int, ts: float, debug: bool = False
+    ) -> int:
+        angle_deg = math.degrees(self._angles.resolve(target_id))
+        radius_norm, band_idx = self._bands.lookup(rssi)
+        slot = self.store.allocate(
+            target_id,
+            source_bits=SOURCE_BITS[source],
+            rssi=rssi,
+            angle_deg=angle_deg,
+            radius_norm=radius_norm,
+            band=band_idx,
+            ts=ts,
+        )
+        self._expiry.schedule(slot, ts + self.config.RSSI_STALE_TIMEOUT)
+        self._nearest.push(slot)
+        self._dirty.add(slot)
+        if debug:
+            self._log_target(slot, source.value, rssi, rssi, band_idx, radius_norm, radius_norm, 0.0, ts)
+        return slot
+
+    def _materialize(self, slot: int) -> TargetView:
+        """Build a ``TargetView`` for ``slot`` and refresh its classification."""
+        target = self.store.materialize(slot)
+        kind = classifier.classify(target)
+        if kind is not target.kind:
+            self.store.kind[slot] = KINDS.index(kind)
+            target = target._replace(kind=kind)
+        return target
 
-    def _maybe_log_debug(
+    def _debug_enabled(self) -> bool:
+        """Whether TARGET records are wanted; callers check once per update, not per observation.
+
+        ``TARGET_DEBUG_LOG`` is read when the tracker is created; the logger
+        level is checked here so it can still be changed while running.
+        """
+        return self._debug_log and logger.isEnabledFor(logging.DEBUG)
+
+    def _log_target(
         self,
-        target_id: str,
+        slot: int,
         source: str,
         rssi_raw: int,
         rssi_filt: float,
@@ -147,15 +304,13 @@ class Tracker:
         delta_radius: float,
         ts: float,
     ) -> None:
-        if not getattr(self.config, "TARGET_DEBUG_LOG", False):
+        """Log a TARGET record unless the target logged one within ``TARGET_LOG_INTERVAL``."""
+        if ts - self.store.log_ts[slot] < self._log_interval:
             return
-        last_log = self._last_log_ts.get(target_id, float("-inf"))
-        if ts - last_log < getattr(self.config, "TARGET_LOG_INTERVAL", 0.0):
-            return
-        self._last_log_ts[target_id] = ts
+        self.store.log_ts[slot] = ts
         logger.debug(
             "TARGET id=%s src=%s rssi=%s filt=%.2f band=%s radius=%.3f prev=%.3f Δ=%.3f ts=%.3f",
-            target_id,
+            self.store.ids[slot],
             source,
             rssi_raw,
             rssi_filt,
@@ -1,13 +1,98 @@
 """Logging setup for the RF Presence Radar."""
 
+import atexit
 import logging
+import logging.handlers
 import sys
+import threading
+import time
+from queue import SimpleQueue
+from typing import Dict, List, Optional
 
+from rf_radar.infrastructure import metrics
 
-def setup_logging(config) -> None:
-    """Configure global logging using the provided config module."""
-    logging.basicConfig(
-        level=getattr(logging, config.LOG_LEVEL),
-        format="%(levelname)s - %(message)s",
-        stream=sys.stdout,
-    )
+_suppressed = metrics.registry.counter("log.suppressed")
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RateLimitFilter(logging.Filter):
+    """Let at most ``rate`` records per second through for each event type.
+
+    The event type is the record's unformatted message, so every
+    ``logger.debug("TARGET id=%s ...", ...)`` call site is limited on its own.
+    Each type may burst up to ``burst`` records. Warnings and errors always
+    pass. Suppressed records are counted in ``suppressed`` and the
+    ``log.suppressed`` metric.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock=time.monotonic) -> None:
+        super().__init__()
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.clock = clock
+        self.suppressed: Dict[str, int] = {}
+        self._buckets: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate <= 0:
+            return True
+        key = str(record.msg)
+        now = self.clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.burst, now]
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens >= 1.0:
+                bucket[0] = tokens - 1.0
+                return True
+            bucket[0] = tokens
+            self.suppressed[key] = self.suppressed.get(key, 0) + 1
+        _suppressed.inc()
+        return False
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue records as they are so the listener thread does the formatting.
+
+    The stock ``prepare`` formats the message on the logging thread, which is
+    the work this handler exists to move off the core and UI threads. The
+    queue never leaves the process, so records need not be made picklable.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(config) -> Optional[logging.handlers.QueueListener]:
+    """Configure global logging using the provided config module.
+
+    With ``LOG_ASYNC`` the root logger only enqueues records; a
+    ``QueueListener`` thread formats and writes them to stdout and is
+    stopped, flushing what is queued, at interpreter exit. ``LOG_RATE_LIMIT``
+    caps records per second per event type. Like ``logging.basicConfig``
+    this does nothing when the root logger already has handlers; it returns
+    the listener, or None when logging is synchronous.
+    """
+    global _listener
+    root = logging.getLogger()
+    if root.handlers:
+        return _listener
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+    handler: logging.Handler = stream
+    if getattr(config, "LOG_ASYNC", True):
+        handler = _DeferredQueueHandler(SimpleQueue())
+        _listener = logging.handlers.QueueListener(handler.queue, stream)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+    rate = float(getattr(config, "LOG_RATE_LIMIT", 0.0))
+    if rate > 0:
+        handler.addFilter(RateLimitFilter(rate, getattr(config, "LOG_RATE_BURST", None)))
+    root.addHandler(handler)
+    root.setLevel(getattr(logging, config.LOG_LEVEL))
+    return _listener
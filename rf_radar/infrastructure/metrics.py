@@ -0,0 +1,234 @@
+"""In-process metrics: counters, gauges and fixed-bucket histograms.
+
+Counters and histograms accumulate into per-thread cells, so recording takes
+no lock; a lock is only taken the first time a thread touches a metric and
+when a metric is created. ``snapshot`` sums the cells of every thread. Values
+read while other threads record may be a few updates behind, which is fine
+for monitoring.
+"""
+
+import json
+import logging
+import threading
+import time
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in milliseconds; the last bucket catches everything above.
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+
+
+class Counter:
+    """Monotonic count, accumulated per thread."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._local = threading.local()
+        self._cells: List[List[int]] = []
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._new_cell()
+        cell[0] += amount
+
+    def value(self) -> int:
+        return sum(cell[0] for cell in list(self._cells))
+
+    def _new_cell(self) -> List[int]:
+        cell = [0]
+        with self._lock:
+            self._cells.append(cell)
+        self._local.cell = cell
+        return cell
+
+
+class Gauge:
+    """Last value set from any thread."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def value(self) -> float:
+        return self._value
+
+
+class Histogram:
+    """Distribution over fixed bucket upper bounds, accumulated per thread.
+
+    Each thread's cell is ``[count_0 .. count_n, total_count, total_sum, max]``.
+    """
+
+    def __init__(self, name: str, buckets: Sequence[float] = LATENCY_BUCKETS_MS) -> None:
+        self.name = name
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        self._cells: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._new_cell()
+        cell[bisect_right(self.buckets, value)] += 1
+        cell[-3] += 1
+        cell[-2] += value
+        if value > cell[-1]:
+            cell[-1] = value
+
+    def observe_since(self, start: float) -> None:
+        """Record the milliseconds elapsed since ``start`` (a ``time.perf_counter`` value)."""
+        self.observe((time.perf_counter() - start) * 1e3)
+
+    def value(self) -> Dict[str, object]:
+        """Merged counts with sum, mean, max and bucket-bound p50/p95/p99 estimates."""
+        size = len(self.buckets) + 3  # bucket counts, count, sum; max is merged separately
+        merged = [0.0] * size
+        peak = 0.0
+        for cell in list(self._cells):
+            for idx in range(size):
+                merged[idx] += cell[idx]
+            peak = max(peak, cell[-1])
+        counts = [int(c) for c in merged[:-2]]
+        count = int(merged[-2])
+        total = merged[-1]
+        return {
+            "count": count,
+            "sum": total,
+            "mean": total / count if count else 0.0,
+            "max": peak,
+            "p50": self._quantile(counts, count, 0.50, peak),
+            "p95": self._quantile(counts, count, 0.95, peak),
+            "p99": self._quantile(counts, count, 0.99, peak),
+            "buckets": counts,
+        }
+
+    def _quantile(self, counts: List[int], count: int, q: float, peak: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile, capped at the largest value seen."""
+        if not count:
+            return 0.0
+        rank = q * count
+        seen = 0
+        for idx, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= rank and idx < len(self.buckets):
+                return min(self.buckets[idx], peak)
+        return peak
+
+    def _new_cell(self) -> List[float]:
+        cell = [0] * (len(self.buckets) + 1) + [0, 0.0, 0.0]
+        with self._lock:
+            self._cells.append(cell)
+        self._local.cell = cell
+        return cell
+
+
+class MetricsRegistry:
+    """Named metrics; ``counter``/``gauge``/``histogram`` return the same object for the same name."""
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, Counter] = {}
+        self._gauges: Dict[str, Gauge] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str) -> Counter:
+        metric = self._counters.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._counters.setdefault(name, Counter(name))
+        return metric
+
+    def gauge(self, name: str) -> Gauge:
+        metric = self._gauges.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._gauges.setdefault(name, Gauge(name))
+        return metric
+
+    def histogram(self, name: str, buckets: Sequence[float] = LATENCY_BUCKETS_MS) -> Histogram:
+        metric = self._histograms.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._histograms.setdefault(name, Histogram(name, buckets))
+        return metric
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """Current value of every metric, grouped by type and sorted by name."""
+        return {
+            "counters": {name: m.value() for name, m in sorted(self._counters.items())},
+            "gauges": {name: m.value() for name, m in sorted(self._gauges.items())},
+            "histograms": {name: m.value() for name, m in sorted(self._histograms.items())},
+        }
+
+
+def summary_lines(values: Dict[str, Dict[str, object]], limit: Optional[int] = None) -> List[str]:
+    """Short one-metric-per-line text of a registry snapshot, for overlays and logs."""
+    lines = [f"{name} p50={h['p50']:g} p95={h['p95']:g} n={h['count']}" for name, h in values["histograms"].items()]
+    lines += [f"{name}={value}" for name, value in values["counters"].items()]
+    lines += [
+        f"{name}={value:.1f}" if isinstance(value, float) else f"{name}={value}"
+        for name, value in values["gauges"].items()
+    ]
+    return lines[:limit] if limit is not None else lines
+
+
+class JsonLinesDumper:
+    """Append a registry snapshot as one JSON line every ``interval`` seconds on a background thread."""
+
+    def __init__(self, metrics: MetricsRegistry, path: str, interval: float = 10.0) -> None:
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="MetricsDumper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and write a final line."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self._stop_event.clear()
+
+    def dump(self) -> None:
+        line = json.dumps({"ts": time.time(), **self.metrics.snapshot()}, separators=(",", ":"))
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self._dump_logged()
+        self._dump_logged()
+
+    def _dump_logged(self) -> None:
+        try:
+            self.dump()
+        except (OSError, ValueError):
+            logger.warning("Could not write metrics to %s", self.path, exc_info=True)
+
+
+def create_dumper(config, metrics: "MetricsRegistry") -> Optional[JsonLinesDumper]:
+    """Dumper writing to ``config.METRICS_DUMP_PATH``, or None when dumping is disabled."""
+    path = getattr(config, "METRICS_DUMP_PATH", None)
+    if not path:
+        return None
+    return JsonLinesDumper(metrics, path, float(getattr(config, "METRICS_DUMP_INTERVAL", 10.0)))
+
+
+registry = MetricsRegistry()
@@ -1,6 +1,210 @@
-"""Factories for application queues."""
+"""Factories for application queues, the batched observation channel and the snapshot mailbox."""
 
-from queue import Queue
+import threading
+import time
+from queue import Empty, Full, Queue
+from typing import Iterable, List, Optional, Sequence, Union
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+
+class ObservationChannel:
+    """Bounded ring buffer moving observations in batches under a single lock.
+
+    ``push_many`` and ``drain`` take the lock once per batch instead of once per
+    item. When full, ``DROP_OLDEST`` evicts the oldest buffered items to make
+    room while ``DROP_NEWEST`` rejects the incoming ones. ``put_nowait``,
+    ``get``, ``get_nowait`` and ``qsize`` mirror ``queue.Queue`` so the channel
+    can stand in wherever a queue is expected. Channels given the same
+    ``notifier`` condition notify it when they stop being empty, so one
+    consumer can wait on all of them at once (see ``drain_fair``).
+    """
+
+    def __init__(self, capacity: int, policy: str = DROP_OLDEST, notifier: Optional[threading.Condition] = None) -> None:
+        if capacity <= 0:
+            raise ValueError("Channel capacity must be positive")
+        if policy not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown drop policy: {policy}")
+        self.maxsize = capacity
+        self.policy = policy
+        self._buffer: List = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self._not_empty = threading.Condition(threading.Lock())
+        self._notifier = notifier
+        self.enqueued = 0
+        self.dropped = 0
+        self.high_water = 0
+
+    def push_many(self, items: Iterable) -> int:
+        """Append ``items``; returns how many items (incoming or evicted) were dropped."""
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        count = len(items)
+        if not count:
+            return 0
+        capacity = self.maxsize
+        with self._not_empty:
+            was_empty = self._size == 0
+            if self.policy == DROP_NEWEST:
+                accepted = min(count, capacity - self._size)
+                dropped = count - accepted
+                if dropped:
+                    items = items[:accepted]
+            else:
+                dropped = max(0, self._size + count - capacity)
+                if count >= capacity:
+                    items = items[count - capacity:]
+                    self._head = 0
+                    self._size = 0
+                elif dropped:
+                    self._clear(self._head, dropped)
+                    self._head = (self._head + dropped) % capacity
+                    self._size -= dropped
+                accepted = len(items)
+            if accepted:
+                tail = (self._head + self._size) % capacity
+                first = min(accepted, capacity - tail)
+                self._buffer[tail:tail + first] = items[:first]
+                if accepted > first:
+                    self._buffer[:accepted - first] = items[first:]
+                self._size += accepted
+                self.enqueued += accepted
+                if self._size > self.high_water:
+                    self.high_water = self._size
+                if was_empty:
+                    self._not_empty.notify_all()
+            self.dropped += dropped
+        if accepted and was_empty and self._notifier is not None:
+            with self._notifier:
+                self._notifier.notify_all()
+        return dropped
+
+    def drain(self, max_items: int, timeout: Optional[float] = 0.0) -> List:
+        """Remove and return up to ``max_items`` items, waiting up to ``timeout`` seconds for the first.
+
+        ``timeout=None`` waits until an item arrives.
+        """
+        with self._not_empty:
+            if not self._size and (timeout is None or timeout > 0):
+                self._not_empty.wait_for(lambda: self._size, timeout)
+            count = min(max_items, self._size)
+            if not count:
+                return []
+            capacity = self.maxsize
+            head = self._head
+            first = min(count, capacity - head)
+            items = self._buffer[head:head + first]
+            self._clear(head, first)
+            if count > first:
+                items += self._buffer[:count - first]
+                self._clear(0, count - first)
+            self._head = (head + count) % capacity
+            self._size -= count
+            return items
+
+    def _clear(self, start: int, count: int) -> None:
+        """Release references held by ``count`` slots from ``start`` (must not wrap)."""
+        end = start + count
+        if end <= self.maxsize:
+            self._buffer[start:end] = [None] * count
+        else:
+            self._buffer[start:] = [None] * (self.maxsize - start)
+            self._buffer[:end - self.maxsize] = [None] * (end - self.maxsize)
+
+    def put_nowait(self, item) -> None:
+        """Queue-compatible single put; raises ``Full`` when ``DROP_NEWEST`` rejects the item."""
+        if self.push_many((item,)) and self.policy == DROP_NEWEST:
+            raise Full
+
+    def put(self, item, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Never blocks; behaves like ``put_nowait``."""
+        self.put_nowait(item)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        """Queue-compatible single get."""
+        items = self.drain(1, timeout if block else 0.0)
+        if not items:
+            raise Empty
+        return items[0]
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def full(self) -> bool:
+        return self._size >= self.maxsize
+
+    def stats(self) -> dict:
+        """Counters since creation plus the current fill level."""
+        return {
+            "size": self._size,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "high_water": self.high_water,
+        }
+
+
+class SnapshotMailbox:
+    """Thread-safe single slot holding the latest unread snapshot.
+
+    ``put`` always succeeds and overwrites an unread item, so a producer never
+    waits for the consumer and the consumer always gets the newest snapshot.
+    ``get``, ``get_nowait``, ``put_nowait``, ``empty`` and ``qsize`` mirror a
+    ``queue.Queue`` of size one.
+    """
+
+    maxsize = 1
+
+    def __init__(self) -> None:
+        self._item = None
+        self._full = False
+        self._not_empty = threading.Condition(threading.Lock())
+        self.replaced = 0
+
+    def put(self, item, block: bool = True, timeout: Optional[float] = None) -> bool:
+        """Store ``item``; returns True when it replaced an unread one."""
+        with self._not_empty:
+            replaced = self._full
+            if replaced:
+                self.replaced += 1
+            self._item = item
+            self._full = True
+            self._not_empty.notify()
+        return replaced
+
+    def put_nowait(self, item) -> bool:
+        return self.put(item)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        """Take the stored item, waiting up to ``timeout`` seconds when ``block``; raises ``Empty``."""
+        with self._not_empty:
+            if block and not self._full:
+                self._not_empty.wait_for(lambda: self._full, timeout)
+            if not self._full:
+                raise Empty
+            item = self._item
+            self._item = None
+            self._full = False
+            return item
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return 1 if self._full else 0
+
+    def empty(self) -> bool:
+        return not self._full
+
+    def full(self) -> bool:
+        return self._full
 
 
 def create_observation_queue(config) -> Queue:
@@ -8,6 +212,134 @@ def create_observation_queue(config) -> Queue:
     return Queue(maxsize=config.OBS_QUEUE_MAXSIZE)
 
 
-def create_snapshot_queue(config) -> Queue:
-    """Create the snapshot queue with fixed size of 1 via configuration."""
+def create_observation_channel(config, notifier: Optional[threading.Condition] = None) -> ObservationChannel:
+    """Create a batched observation channel with the configured capacity and drop policy."""
+    return ObservationChannel(
+        getattr(config, "OBS_CHANNEL_CAPACITY", config.OBS_QUEUE_MAXSIZE),
+        getattr(config, "OBS_CHANNEL_POLICY", DROP_OLDEST),
+        notifier,
+    )
+
+
+def create_snapshot_queue(config) -> Union[SnapshotMailbox, Queue]:
+    """Create the snapshot queue; a ``SnapshotMailbox`` for the configured size of 1."""
+    if config.SNAPSHOT_QUEUE_MAXSIZE <= 1:
+        return SnapshotMailbox()
     return Queue(maxsize=config.SNAPSHOT_QUEUE_MAXSIZE)
+
+
+def drain(queue: Queue, max_items: int, timeout: float, budget: float) -> List:
+    """Collect pending items from a queue in one batch.
+
+    Blocks up to ``timeout`` seconds for the first item, then takes whatever is
+    already queued without blocking until ``max_items`` items were collected or
+    ``budget`` seconds have elapsed. Channels are drained in one locked call.
+    """
+    if isinstance(queue, ObservationChannel):
+        return queue.drain(max_items, timeout)
+    items: List = []
+    try:
+        items.append(queue.get(timeout=timeout))
+    except Empty:
+        return items
+
+    deadline = time.monotonic() + budget
+    while len(items) < max_items:
+        try:
+            items.append(queue.get_nowait())
+        except Empty:
+            break
+        if time.monotonic() >= deadline:
+            break
+    return items
+
+
+def drain_fair(
+    sources: Sequence[Queue],
+    max_items: int,
+    timeout: float,
+    budget: float,
+    start: int = 0,
+    notifier: Optional[threading.Condition] = None,
+) -> List[List]:
+    """Collect pending items from several queues, sharing ``max_items`` fairly between them.
+
+    Queues are visited round-robin beginning at index ``start``; each visit
+    takes at most an equal share of the remaining capacity, and capacity left
+    unused by quiet queues goes to the busy ones in the next round. When all
+    queues are empty it sleeps on ``notifier``, the condition the channels
+    share, until one of them receives data or ``timeout`` seconds pass; queues
+    that do not notify it are only looked at on those wake-ups. Without a
+    notifier it returns at once. Returns one list per source in the order
+    given.
+    """
+    batches: List[List] = [[] for _ in sources]
+    if not sources:
+        return batches
+
+    wait_until = time.monotonic() + timeout
+    while True:
+        deadline = time.monotonic() + budget
+        remaining = max_items
+        active = [(start + offset) % len(sources) for offset in range(len(sources))]
+        while active and remaining > 0:
+            share = max(1, remaining // len(active))
+            still_active = []
+            for index in active:
+                taken = _take(sources[index], batches[index], min(share, remaining))
+                remaining -= taken
+                if taken == share:
+                    still_active.append(index)
+            active = still_active
+            if time.monotonic() >= deadline:
+                break
+        if remaining < max_items or notifier is None:
+            return batches
+        with notifier:
+            notifier.wait_for(
+                lambda: any(not source.empty() for source in sources), wait_until - time.monotonic()
+            )
+        if time.monotonic() >= wait_until and all(source.empty() for source in sources):
+            return batches
+
+
+def _take(source, batch: List, count: int) -> int:
+    """Move up to ``count`` items from ``source`` into ``batch`` without blocking."""
+    if isinstance(source, ObservationChannel):
+        items = source.drain(count)
+        batch.extend(items)
+        return len(items)
+    taken = 0
+    while taken < count:
+        try:
+            batch.append(source.get_nowait())
+        except Empty:
+            break
+        taken += 1
+    return taken
+
+
+def put_many(queue: Queue, items: Iterable) -> int:
+    """Enqueue items without blocking; returns how many were dropped because the queue was full.
+
+    Channels take the whole batch in one ``push_many`` call.
+    """
+    if isinstance(queue, ObservationChannel):
+        return queue.push_many(items)
+    dropped = 0
+    for item in items:
+        try:
+            queue.put_nowait(item)
+        except Full:
+            dropped += 1
+    return dropped
+
+
+def drop_warning_due(previous: int, total: int, every: int = 10) -> bool:
+    """Whether a drop counter that went from ``previous`` to ``total`` should be logged.
+
+    True on the first drop and whenever the count enters a new block of
+    ``every`` drops, so a producer stuck dropping warns periodically instead
+    of on every batch.
+    """
+    return (previous - 1) // every != (total - 1) // every
@@ -0,0 +1,418 @@
+"""Compact, chunked binary session log of observations.
+
+File layout (little endian)::
+
+    file header  b"RFRS", version u16, flags u16, start_ts f64, ts_unit f64,
+                 angle_hash_len u8, angle_hash utf-8
+    chunk*       b"CHNK", count u32, new_ids u32, first_ts f64, last_ts f64,
+                 defs_len u32, payload_len u32, flags u8, pad
+                 defs     new_ids x (len u16, utf-8 id), never compressed
+                 payload  columns id_index (u16 or u32), rssi i8, source u8,
+                          ts delta i32 in ts_unit; zlib-compressed when flagged
+    index        b"RFIX", chunks u32, chunks x (offset u64, first_ts f64, last_ts f64, count u32)
+    trailer      index_offset u64, b"RFIE"
+
+Ids are interned: each id is written once, in the chunk where it first
+appears, and later referenced by its position in the table. Timestamps are
+quantized to ``ts_unit`` and stored as deltas from the previous record, the
+first one relative to the chunk's ``first_ts`` (its earliest timestamp). The
+trailing index is written on ``close``; a file without it (crashed recorder)
+is indexed by scanning the chunk headers.
+"""
+
+import logging
+import mmap
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from queue import Empty, Queue
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from rf_radar.core.models import Observation, ObservationBatch, ObservationSource
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"RFRS"
+VERSION = 1
+FLAG_COMPRESSED = 0x1
+CHUNK_WIDE_IDS = 0x2
+TS_UNIT = 0.001  # seconds per timestamp tick
+_FILE_HEADER = struct.Struct("<4sHHddB")
+_CHUNK_HEADER = struct.Struct("<4sIIddIIB3x")
+_INDEX_ENTRY = struct.Struct("<QddI")
+_INDEX_HEADER = struct.Struct("<4sI")
+_TRAILER = struct.Struct("<Q4s")
+_ID_LEN = struct.Struct("<H")
+SOURCES = tuple(ObservationSource)
+_SOURCE_INDEX = {source: idx for idx, source in enumerate(SOURCES)}
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+class ChunkInfo(NamedTuple):
+    """Location and time span of one chunk."""
+
+    offset: int
+    first_ts: float
+    last_ts: float
+    count: int
+
+
+def _to_le(column: array) -> bytes:
+    if _BIG_ENDIAN and column.itemsize > 1:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _from_le(typecode: str, data) -> array:
+    column = array(typecode)
+    column.frombytes(data)
+    if _BIG_ENDIAN and column.itemsize > 1:
+        column.byteswap()
+    return column
+
+
+class SessionRecorder:
+    """Append observations to a session log, one chunk per ``chunk_records`` records.
+
+    ``record_many`` is thread-safe and only buffers: full chunks are handed to a
+    writer thread that encodes, compresses and writes them, so the caller (the
+    core loop) never waits on zlib or the disk. With ``flush_interval`` the
+    writer also writes whatever is buffered once that many seconds passed
+    without a write, bounding what a crash can lose. ``flush`` waits until
+    everything recorded so far is on disk.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        angle_hash: str = "sha256",
+        compress: bool = True,
+        chunk_records: int = 8192,
+        start_ts: float = 0.0,
+        flush_interval: Optional[float] = None,
+    ) -> None:
+        self.path = path
+        self.compress = compress
+        self.chunk_records = chunk_records
+        self.flush_interval = flush_interval
+        self._file = open(path, "wb")
+        self._lock = threading.Lock()
+        self._closed = False
+        self._ids: Dict[str, int] = {}
+        self._pending: List[Observation] = []
+        self._chunks: Queue = Queue()
+        self._index: List[ChunkInfo] = []
+        self.records = 0
+        encoded_hash = angle_hash.encode()
+        self._file.write(
+            _FILE_HEADER.pack(
+                MAGIC, VERSION, FLAG_COMPRESSED if compress else 0, start_ts, TS_UNIT, len(encoded_hash)
+            )
+            + encoded_hash
+        )
+        self._writer = threading.Thread(target=self._write_loop, name="SessionRecorder", daemon=True)
+        self._writer.start()
+
+    def __enter__(self) -> "SessionRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def chunks(self) -> int:
+        return len(self._index)
+
+    def record(self, observation: Observation) -> None:
+        self.record_many((observation,))
+
+    def record_many(self, observations: Iterable[Observation]) -> None:
+        """Buffer observations, handing every chunk that fills up to the writer thread."""
+        with self._lock:
+            if self._closed or self._file is None:
+                return
+            self._pending.extend(observations)
+            while len(self._pending) >= self.chunk_records:
+                self._chunks.put(self._pending[: self.chunk_records])
+                del self._pending[: self.chunk_records]
+
+    def flush(self) -> None:
+        """Write buffered observations as a (possibly short) chunk and wait until they are on disk."""
+        with self._lock:
+            if self._closed:
+                return
+            self._queue_pending()
+        self._chunks.join()
+
+    def close(self) -> None:
+        """Write remaining observations and the seek index, then close the file."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue_pending()
+            self._chunks.put(None)
+        self._writer.join()
+        if self._file is not None:
+            index_offset = self._file.tell()
+            self._file.write(_INDEX_HEADER.pack(b"RFIX", len(self._index)))
+            for info in self._index:
+                self._file.write(_INDEX_ENTRY.pack(*info))
+            self._file.write(_TRAILER.pack(index_offset, b"RFIE"))
+            self._file.close()
+            self._file = None
+
+    def _queue_pending(self) -> None:
+        """Hand the buffered observations to the writer as one chunk; caller holds the lock."""
+        if self._pending:
+            self._chunks.put(self._pending)
+            self._pending = []
+
+    def _write_loop(self) -> None:
+        """Writer thread: write queued chunks and flush idle buffers every ``flush_interval``."""
+        last_write = time.monotonic()
+        while True:
+            timeout = None
+            if self.flush_interval is not None:
+                timeout = max(0.0, last_write + self.flush_interval - time.monotonic())
+            try:
+                chunk = self._chunks.get(timeout=timeout)
+            except Empty:
+                with self._lock:
+                    self._queue_pending()
+                last_write = time.monotonic()
+                continue
+            try:
+                if chunk is None:
+                    return
+                if self._file is not None:
+                    self._write_chunk(chunk)
+            except Exception:
+                # The file may end in a partial chunk; keep consuming so flush/close never wait forever.
+                logger.warning("Session recording to %s failed; recording stopped", self.path, exc_info=True)
+                self._stop_recording()
+            finally:
+                self._chunks.task_done()
+            last_write = time.monotonic()
+
+    def _stop_recording(self) -> None:
+        """Drop the file after a write failure; later chunks are discarded and no index is written."""
+        file, self._file = self._file, None
+        with self._lock:
+            self._pending = []
+        try:
+            file.close()
+        except Exception:
+            pass
+
+    def _write_chunk(self, observations: List[Observation]) -> None:
+        ids = self._ids
+        defs = bytearray()
+        new_ids = 0
+        id_column = []
+        rssi_column = array("b")
+        source_column = array("B")
+        ts_column = array("i")
+        first_ts = min(obs.ts for obs in observations)
+        last_ts = max(obs.ts for obs in observations)
+        previous = 0
+        for obs in observations:
+            index = ids.get(obs.id)
+            if index is None:
+                index = ids[obs.id] = len(ids)
+                encoded = obs.id.encode()
+                defs += _ID_LEN.pack(len(encoded))
+                defs += encoded
+                new_ids += 1
+            id_column.append(index)
+            rssi_column.append(max(-128, min(127, int(obs.rssi))))
+            source_column.append(_SOURCE_INDEX[obs.source])
+            quantized = int(round((obs.ts - first_ts) / TS_UNIT))
+            ts_column.append(max(-(2**31), min(2**31 - 1, quantized - previous)))
+            previous = quantized
+
+        wide = len(ids) > 0xFFFF
+        flags = CHUNK_WIDE_IDS if wide else 0
+        payload = (
+            _to_le(array("I" if wide else "H", id_column))
+            + rssi_column.tobytes()
+            + source_column.tobytes()
+            + _to_le(ts_column)
+        )
+        if self.compress:
+            payload = zlib.compress(payload, 6)
+            flags |= FLAG_COMPRESSED
+
+        offset = self._file.tell()
+        self._file.write(
+            _CHUNK_HEADER.pack(
+                b"CHNK", len(observations), new_ids, first_ts, last_ts, len(defs), len(payload), flags
+            )
+        )
+        self._file.write(defs)
+        self._file.write(payload)
+        self._file.flush()
+        self._index.append(ChunkInfo(offset, first_ts, last_ts, len(observations)))
+        self.records += len(observations)
+
+
+def create_session_recorder(config, start_ts: float = 0.0) -> Optional[SessionRecorder]:
+    """Open a recorder at ``config.RECORD_PATH``, or return None when recording is disabled."""
+    path = getattr(config, "RECORD_PATH", None)
+    if not path:
+        return None
+    return SessionRecorder(
+        path,
+        angle_hash=getattr(config, "ANGLE_HASH", "sha256"),
+        compress=getattr(config, "RECORD_COMPRESS", True),
+        chunk_records=int(getattr(config, "RECORD_CHUNK_RECORDS", 8192)),
+        start_ts=start_ts,
+        flush_interval=getattr(config, "RECORD_FLUSH_INTERVAL", None),
+    )
+
+
+class SessionReader:
+    """Memory-mapped reader of a session log with timestamp seeking."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, flags, start_ts, ts_unit, hash_len = _FILE_HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a session recording")
+        self.compressed = bool(flags & FLAG_COMPRESSED)
+        self.start_ts = start_ts
+        self.ts_unit = ts_unit
+        self._data_offset = _FILE_HEADER.size + hash_len
+        self.angle_hash = bytes(self._map[_FILE_HEADER.size:self._data_offset]).decode()
+        self.chunks: List[ChunkInfo] = self._read_index()
+        self._chunk_starts = [info.first_ts for info in self.chunks]
+        self._id_table: List[str] = []
+        self._ids_loaded = 0
+
+    def __enter__(self) -> "SessionReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(info.count for info in self.chunks)
+
+    @property
+    def first_ts(self) -> Optional[float]:
+        return self.chunks[0].first_ts if self.chunks else None
+
+    @property
+    def last_ts(self) -> Optional[float]:
+        return max((info.last_ts for info in self.chunks), default=None)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def batches(self, start_ts: Optional[float] = None) -> Iterator[ObservationBatch]:
+        """Yield one columnar batch per chunk, skipping records before ``start_ts``."""
+        first = 0
+        if start_ts is not None:
+            # The chunk before the first one starting after start_ts may still hold later records.
+            first = max(0, bisect_right(self._chunk_starts, start_ts) - 1)
+        for number in range(first, len(self.chunks)):
+            batch = self._decode(number)
+            if start_ts is not None and self.chunks[number].first_ts < start_ts:
+                keep = [idx for idx, ts in enumerate(batch.ts) if ts >= start_ts]
+                if not keep:
+                    continue
+                batch = ObservationBatch(
+                    ids=[batch.ids[idx] for idx in keep],
+                    rssi=[batch.rssi[idx] for idx in keep],
+                    ts=[batch.ts[idx] for idx in keep],
+                    sources=[batch.sources[idx] for idx in keep],
+                )
+            yield batch
+
+    def _read_index(self) -> List[ChunkInfo]:
+        data = self._map
+        size = len(data)
+        if size >= self._data_offset + _TRAILER.size:
+            index_offset, tag = _TRAILER.unpack_from(data, size - _TRAILER.size)
+            if tag == b"RFIE" and self._data_offset <= index_offset < size:
+                header_tag, count = _INDEX_HEADER.unpack_from(data, index_offset)
+                if header_tag == b"RFIX":
+                    start = index_offset + _INDEX_HEADER.size
+                    return [
+                        ChunkInfo(*_INDEX_ENTRY.unpack_from(data, start + n * _INDEX_ENTRY.size))
+                        for n in range(count)
+                    ]
+        return self._scan_chunks()
+
+    def _scan_chunks(self) -> List[ChunkInfo]:
+        """Rebuild the index from chunk headers, stopping at the first incomplete chunk."""
+        chunks = []
+        offset = self._data_offset
+        size = len(self._map)
+        while offset + _CHUNK_HEADER.size <= size:
+            tag, count, _, first_ts, last_ts, defs_len, payload_len, _ = _CHUNK_HEADER.unpack_from(
+                self._map, offset
+            )
+            end = offset + _CHUNK_HEADER.size + defs_len + payload_len
+            if tag != b"CHNK" or end > size:
+                break
+            chunks.append(ChunkInfo(offset, first_ts, last_ts, count))
+            offset = end
+        return chunks
+
+    def _load_ids(self, upto: int) -> None:
+        """Intern the ids defined by chunks ``[0, upto]``; only their small defs blocks are read."""
+        data = self._map
+        while self._ids_loaded <= upto:
+            offset = self.chunks[self._ids_loaded].offset
+            _, _, new_ids, _, _, _, _, _ = _CHUNK_HEADER.unpack_from(data, offset)
+            position = offset + _CHUNK_HEADER.size
+            for _ in range(new_ids):
+                (length,) = _ID_LEN.unpack_from(data, position)
+                position += _ID_LEN.size
+                self._id_table.append(bytes(data[position:position + length]).decode())
+                position += length
+            self._ids_loaded += 1
+
+    def _decode(self, number: int) -> ObservationBatch:
+        self._load_ids(number)
+        data = memoryview(self._map)
+        try:
+            offset = self.chunks[number].offset
+            _, count, _, first_ts, _, defs_len, payload_len, flags = _CHUNK_HEADER.unpack_from(data, offset)
+            start = offset + _CHUNK_HEADER.size + defs_len
+            payload = data[start:start + payload_len]
+            if flags & FLAG_COMPRESSED:
+                payload = memoryview(zlib.decompress(payload))
+            id_size = 4 if flags & CHUNK_WIDE_IDS else 2
+            position = count * id_size
+            id_column = _from_le("I" if id_size == 4 else "H", payload[:position])
+            rssi_column = _from_le("b", payload[position:position + count])
+            position += count
+            source_column = payload[position:position + count].tolist()
+            position += count
+            ts_column = _from_le("i", payload[position:position + count * 4])
+            payload.release()
+        finally:
+            data.release()
+
+        table = self._id_table
+        unit = self.ts_unit
+        return ObservationBatch(
+            ids=[table[idx] for idx in id_column],
+            rssi=rssi_column.tolist(),
+            ts=[first_ts + quantized * unit for quantized in accumulate(ts_column)],
+            sources=[SOURCES[idx] for idx in source_column],
+        )
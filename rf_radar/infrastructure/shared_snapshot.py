@@ -0,0 +1,246 @@
+"""Double-buffered snapshots in shared memory with a fixed columnar layout.
+
+Segment layout (little endian)::
+
+    header   magic u32, version u32, capacity u32, id_bytes u32, generation u64, active u64
+    buffer 0 seq u64, count u32, selected i32, now_ts f64, stats_len u32, pad
+             stats   STATS_BYTES of JSON
+             columns rssi_filt f64, angle_deg f64, radius_norm f64, last_seen_ts f64,
+                     rssi_raw i16, source_bits u8, state u8, kind u8, ids id_bytes each
+    buffer 1 same as buffer 0
+
+The writer always fills the buffer that is not active, then publishes it by
+flipping ``active`` and bumping ``generation``. Each buffer carries a sequence
+number that is odd while it is being written, so a reader that raced a writer
+lapping it detects the torn read and retries.
+"""
+
+import json
+import struct
+from array import array
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+from rf_radar.core.models import TargetKind, TargetState, TargetView
+from rf_radar.core.snapshot import Snapshot
+
+MAGIC = 0x52465244  # "RFRD"
+VERSION = 1
+STATS_BYTES = 4096
+_HEADER = struct.Struct("<IIIIQQ")
+_BUFFER_HEADER = struct.Struct("<QIidI4x")
+_SEQ = struct.Struct("<Q")
+_GENERATION_OFFSET = 16
+_ACTIVE_OFFSET = 24
+_READ_RETRIES = 8
+
+STATES = tuple(TargetState)
+KINDS = tuple(TargetKind)
+# (name, typecode, item size); 8-byte columns first keeps every column aligned.
+_COLUMNS: Tuple[Tuple[str, str, int], ...] = (
+    ("rssi_filt", "d", 8),
+    ("angle_deg", "d", 8),
+    ("radius_norm", "d", 8),
+    ("last_seen_ts", "d", 8),
+    ("rssi_raw", "h", 2),
+    ("source_bits", "B", 1),
+    ("state", "B", 1),
+    ("kind", "B", 1),
+)
+
+
+def _layout(capacity: int, id_bytes: int):
+    """Return ``(buffer_size, {column: offset}, ids_offset)`` relative to a buffer start."""
+    offset = _BUFFER_HEADER.size + STATS_BYTES
+    offsets = {}
+    for name, _, size in _COLUMNS:
+        offsets[name] = offset
+        offset += capacity * size
+    ids_offset = offset
+    offset += capacity * id_bytes
+    buffer_size = (offset + 7) // 8 * 8
+    return buffer_size, offsets, ids_offset
+
+
+def segment_size(capacity: int, id_bytes: int) -> int:
+    """Bytes needed for a segment holding ``capacity`` targets per buffer."""
+    return _HEADER.size + 2 * _layout(capacity, id_bytes)[0]
+
+
+class _Segment:
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int, id_bytes: int) -> None:
+        self.shm = shm
+        self.buf = shm.buf
+        self.capacity = capacity
+        self.id_bytes = id_bytes
+        self.buffer_size, self.offsets, self.ids_offset = _layout(capacity, id_bytes)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def buffer_start(self, index: int) -> int:
+        return _HEADER.size + index * self.buffer_size
+
+    def header(self) -> Tuple[int, int]:
+        _, _, _, _, generation, active = _HEADER.unpack_from(self.buf, 0)
+        return generation, active
+
+    def close(self) -> None:
+        self.buf = None
+        self.shm.close()
+
+
+class SharedSnapshotWriter(_Segment):
+    """Writes snapshots into the inactive buffer of a shared memory segment."""
+
+    @classmethod
+    def create(cls, capacity: int, id_bytes: int = 64) -> "SharedSnapshotWriter":
+        shm = shared_memory.SharedMemory(create=True, size=segment_size(capacity, id_bytes))
+        _HEADER.pack_into(shm.buf, 0, MAGIC, VERSION, capacity, id_bytes, 0, 0)
+        return cls(shm, capacity, id_bytes)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedSnapshotWriter":
+        return _attach(cls, name)
+
+    def write(self, snap: Snapshot) -> int:
+        """Publish ``snap``; returns the number of targets written (at most ``capacity``)."""
+        generation, active = self.header()
+        index = 1 - active
+        start = self.buffer_start(index)
+        buf = self.buf
+        seq = _SEQ.unpack_from(buf, start)[0] + 1
+        _SEQ.pack_into(buf, start, seq)
+
+        targets = snap.targets[: self.capacity]
+        count = len(targets)
+        stats = json.dumps(dict(snap.stats), separators=(",", ":")).encode()
+        if len(stats) > STATS_BYTES:
+            stats = b'{"stats_overflow":1}'
+        selected = -1
+        if snap.selected_id is not None:
+            for row, target in enumerate(targets):
+                if target.id == snap.selected_id:
+                    selected = row
+                    break
+
+        columns = (
+            array("d", [t.rssi_filt for t in targets]),
+            array("d", [t.angle_deg for t in targets]),
+            array("d", [t.radius_norm for t in targets]),
+            array("d", [t.last_seen_ts for t in targets]),
+            array("h", [t.rssi_raw_last for t in targets]),
+            array("B", [t.source_bits for t in targets]),
+            array("B", [STATES.index(t.state) for t in targets]),
+            array("B", [KINDS.index(t.kind) for t in targets]),
+        )
+        for (name, _, size), column in zip(_COLUMNS, columns):
+            offset = start + self.offsets[name]
+            buf[offset:offset + count * size] = column.tobytes()
+
+        id_bytes = self.id_bytes
+        ids = b"".join(t.id.encode()[:id_bytes].ljust(id_bytes, b"\0") for t in targets)
+        offset = start + self.ids_offset
+        buf[offset:offset + len(ids)] = ids
+
+        stats_offset = start + _BUFFER_HEADER.size
+        buf[stats_offset:stats_offset + len(stats)] = stats
+        _BUFFER_HEADER.pack_into(buf, start, seq, count, selected, float(snap.now_ts), len(stats))
+        _SEQ.pack_into(buf, start, seq + 1)
+        # Flip the active buffer before bumping the generation readers poll.
+        _SEQ.pack_into(buf, _ACTIVE_OFFSET, index)
+        _SEQ.pack_into(buf, _GENERATION_OFFSET, generation + 1)
+        return count
+
+    def unlink(self) -> None:
+        """Free the segment; readers that are still attached keep their mapping."""
+        self.shm.unlink()
+
+
+class SharedSnapshotReader(_Segment):
+    """Reads the active buffer straight from shared memory without unpickling."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int, id_bytes: int) -> None:
+        super().__init__(shm, capacity, id_bytes)
+        self.generation = 0
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedSnapshotReader":
+        return _attach(cls, name)
+
+    def read_if_new(self) -> Optional[Snapshot]:
+        """Return the latest snapshot if one was published since the previous call, else None."""
+        generation, _ = self.header()
+        if generation == self.generation:
+            return None
+        snap = self.read()
+        if snap is not None:
+            self.generation = generation
+        return snap
+
+    def read(self) -> Optional[Snapshot]:
+        """Return the active snapshot, or None if nothing was published or every attempt was torn."""
+        for _ in range(_READ_RETRIES):
+            generation, active = self.header()
+            if not generation:
+                return None
+            start = self.buffer_start(active)
+            seq = _SEQ.unpack_from(self.buf, start)[0]
+            if seq & 1:
+                continue
+            try:
+                snap = self._decode(start)
+            except (ValueError, IndexError):
+                continue  # torn read of a buffer the writer lapped
+            if _SEQ.unpack_from(self.buf, start)[0] == seq:
+                return snap
+        return None
+
+    def _decode(self, start: int) -> Snapshot:
+        buf = self.buf
+        _, count, selected, now_ts, stats_len = _BUFFER_HEADER.unpack_from(buf, start)
+        count = min(count, self.capacity)
+        stats_len = min(stats_len, STATS_BYTES)
+        stats_offset = start + _BUFFER_HEADER.size
+        stats = json.loads(bytes(buf[stats_offset:stats_offset + stats_len]) or b"{}")
+
+        columns = []
+        for name, typecode, size in _COLUMNS:
+            offset = start + self.offsets[name]
+            columns.append(buf[offset:offset + count * size].cast(typecode).tolist())
+        rssi_filt, angle_deg, radius_norm, last_seen, rssi_raw, source_bits, states, kinds = columns
+
+        id_bytes = self.id_bytes
+        offset = start + self.ids_offset
+        raw_ids = bytes(buf[offset:offset + count * id_bytes])
+        ids = [
+            raw_ids[row * id_bytes:(row + 1) * id_bytes].rstrip(b"\0").decode(errors="replace")
+            for row in range(count)
+        ]
+
+        targets = tuple(
+            TargetView(
+                ids[row],
+                source_bits[row],
+                rssi_raw[row],
+                rssi_filt[row],
+                angle_deg[row],
+                radius_norm[row],
+                last_seen[row],
+                STATES[states[row]],
+                KINDS[kinds[row]],
+            )
+            for row in range(count)
+        )
+        selected_id = ids[selected] if 0 <= selected < count else None
+        return Snapshot(targets=targets, stats=stats, selected_id=selected_id, now_ts=now_ts)
+
+
+def _attach(cls, name: str):
+    shm = shared_memory.SharedMemory(name=name)
+    magic, version, capacity, id_bytes, _, _ = _HEADER.unpack_from(shm.buf, 0)
+    if magic != MAGIC or version != VERSION:
+        shm.close()
+        raise ValueError(f"Shared memory segment {name} does not hold radar snapshots")
+    return cls(shm, capacity, id_bytes)
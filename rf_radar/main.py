@@ -2,7 +2,7 @@
 import logging
 import time
 
-from rf_radar.app.runtime import Runtime, install_signal_handlers
+from rf_radar.app.runtime import create_runtime, install_signal_handlers
 from rf_radar.core import config
 from rf_radar.infrastructure import queues
 from rf_radar.infrastructure.logging import setup_logging
@@ -16,7 +16,7 @@ def main() -> None:
     observation_queue = queues.create_observation_queue(config)
     snapshot_queue = queues.create_snapshot_queue(config)
 
-    runtime = Runtime(config, observation_queue, snapshot_queue)
+    runtime = create_runtime(config, observation_queue, snapshot_queue)
     install_signal_handlers(runtime)
 
     logger.info("Starting runtime")
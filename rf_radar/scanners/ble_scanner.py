@@ -1,3 +1,281 @@
-"""BLE scanner stub using bleak in later milestones."""
+"""BLE scanner using bleak, coalescing advertisements per address before they reach the queue."""
 
-# Implementation will arrive in later milestones.
+import asyncio
+import logging
+import threading
+import time
+from queue import Queue
+from typing import Callable, Dict, List, Optional
+
+from rf_radar.core.models import Observation, ObservationSource
+from rf_radar.infrastructure import metrics, queues
+
+logger = logging.getLogger(__name__)
+
+_advertisement_count = metrics.registry.counter("ble.advertisements")
+_emitted_count = metrics.registry.counter("ble.emitted")
+
+AdvertisementCallback = Callable[[str, int, float], None]
+
+
+class AdvertisementCoalescer:
+    """Aggregate advertisements per address and release one observation per address per window.
+
+    Each address keeps ``[count, rssi_sum, rssi_max, last_ts]`` until ``flush``
+    turns it into an ``Observation`` whose RSSI is the window maximum (or mean
+    with ``aggregate="mean"``). ``add`` may be called from the backend thread
+    while ``flush`` runs on the scanner thread.
+    """
+
+    def __init__(self, window: float, aggregate: str = "max") -> None:
+        if aggregate not in ("max", "mean"):
+            raise ValueError(f"Unknown RSSI aggregate: {aggregate}")
+        self.window = window
+        self.aggregate = aggregate
+        self._pending: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        self._window_start: Optional[float] = None
+        self.advertisements = 0
+
+    def add(self, address: str, rssi: int, ts: float) -> None:
+        """Fold one advertisement into the current window."""
+        with self._lock:
+            self.advertisements += 1
+            if self._window_start is None:
+                self._window_start = ts
+            entry = self._pending.get(address)
+            if entry is None:
+                self._pending[address] = [1, rssi, rssi, ts]
+                return
+            entry[0] += 1
+            entry[1] += rssi
+            if rssi > entry[2]:
+                entry[2] = rssi
+            if ts > entry[3]:
+                entry[3] = ts
+
+    def due(self, now: float) -> bool:
+        """True when the current window holds data and has been open for ``window`` seconds."""
+        start = self._window_start
+        return start is not None and now - start >= self.window
+
+    def flush(self) -> List[Observation]:
+        """Close the current window and return one observation per address seen in it."""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._window_start = None
+        use_mean = self.aggregate == "mean"
+        observations = []
+        for address, (count, rssi_sum, rssi_max, last_ts) in pending.items():
+            rssi_mean = rssi_sum / count
+            observations.append(
+                Observation(
+                    source=ObservationSource.BLE,
+                    id=address,
+                    rssi=int(round(rssi_mean)) if use_mean else rssi_max,
+                    ts=last_ts,
+                    meta={"count": count, "rssi_max": rssi_max, "rssi_mean": rssi_mean},
+                )
+            )
+        return observations
+
+
+class BleakBackend:
+    """Advertisement source backed by ``bleak.BleakScanner`` on its own event loop thread.
+
+    bleak is imported lazily so the rest of the application works without it.
+    ``unavailable`` turns True when the adapter cannot start scanning.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self.clock = clock
+        self.unavailable = False
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, callback: AdvertisementCallback) -> None:
+        from bleak import BleakScanner  # noqa: F401  # fail in the caller when bleak is missing
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(callback,), name="BleakBackend", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self, callback: AdvertisementCallback) -> None:
+        try:
+            asyncio.run(self._scan(callback))
+        except Exception:
+            logger.warning("BLE backend stopped unexpectedly", exc_info=True)
+
+    async def _scan(self, callback: AdvertisementCallback) -> None:
+        from bleak import BleakScanner
+
+        clock = self.clock
+
+        def on_detection(device, advertisement_data) -> None:
+            callback(device.address.lower(), advertisement_data.rssi, clock())
+
+        scanner = BleakScanner(detection_callback=on_detection)
+        try:
+            await scanner.start()
+        except Exception:
+            self.unavailable = True
+            logger.warning("BLE adapter unavailable, continuing without BLE", exc_info=True)
+            return
+        try:
+            while not self._stop_event.is_set():
+                await asyncio.sleep(0.1)
+        finally:
+            await scanner.stop()
+
+
+async def produce_async(emit: Callable[[List[Observation]], None], config, clock: Callable[[], float] = time.time) -> None:
+    """Scan with bleak on the running event loop, passing each closed window to ``emit``.
+
+    Returns at once, logging a warning, when bleak is missing or the adapter
+    cannot start, so the runtime continues without BLE.
+    """
+    window = float(getattr(config, "BLE_COALESCE_WINDOW", 0.5))
+    coalescer = AdvertisementCoalescer(window, getattr(config, "BLE_RSSI_AGGREGATE", "max"))
+    try:
+        from bleak import BleakScanner
+
+        scanner = BleakScanner(
+            detection_callback=lambda device, data: coalescer.add(device.address.lower(), data.rssi, clock())
+        )
+        await scanner.start()
+    except Exception:
+        logger.warning("BLE scanner unavailable, continuing without BLE", exc_info=True)
+        return
+    interval = max(0.01, window / 4.0)
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            if coalescer.due(clock()):
+                emit(coalescer.flush())
+    finally:
+        emit(coalescer.flush())
+        await scanner.stop()
+
+
+class BleScanner:
+    """BLE scanner emitting one coalesced observation per address per window on a background thread."""
+
+    def __init__(
+        self,
+        observation_queue: Queue,
+        config,
+        backend=None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.observation_queue = observation_queue
+        self.config = config
+        self.clock = clock
+        self.backend = backend if backend is not None else BleakBackend(clock)
+        self.window = float(getattr(config, "BLE_COALESCE_WINDOW", 0.5))
+        self.coalescer = AdvertisementCoalescer(self.window, getattr(config, "BLE_RSSI_AGGREGATE", "max"))
+
+        self.running = False
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._dropped = 0
+        self._emitted = 0
+        self._advertisements_counted = 0
+        self._unavailable = False
+
+    def start(self) -> None:
+        """Start the backend and the flush thread; stays inactive and ``unavailable`` if the backend cannot start."""
+        if self.running:
+            return
+        try:
+            self.backend.start(self.coalescer.add)
+        except Exception:
+            self._unavailable = True
+            logger.warning("BLE scanner unavailable, continuing without BLE", exc_info=True)
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name="BleScanner", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the backend, flush the open window and wait for the thread to finish."""
+        if not self.running:
+            return
+        try:
+            self.backend.stop()
+        except Exception:
+            logger.warning("BLE backend failed to stop cleanly", exc_info=True)
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self.running = False
+        self._stop_event.clear()
+
+    def is_alive(self) -> bool:
+        """True while the flush thread and, when it reports liveness, the backend are running."""
+        thread_alive = self._thread is not None and self._thread.is_alive()
+        backend_alive = getattr(self.backend, "is_alive", None)
+        return thread_alive and (backend_alive is None or backend_alive())
+
+    @property
+    def unavailable(self) -> bool:
+        """True when bleak or the adapter is missing; restarting the scanner will not help."""
+        return self._unavailable or bool(getattr(self.backend, "unavailable", False))
+
+    @property
+    def dropped(self) -> int:
+        """Number of coalesced observations discarded because the queue was full."""
+        return self._dropped
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Advertisements received versus observations emitted, merged into the supervisor's per-source stats."""
+        return {
+            "advertisements": self.coalescer.advertisements,
+            "emitted": self._emitted,
+            "dropped": self._dropped,
+        }
+
+    def flush(self) -> List[Observation]:
+        """Emit the current window to the queue and return its observations."""
+        advertisements = self.coalescer.advertisements
+        observations = self.coalescer.flush()
+        _advertisement_count.inc(advertisements - self._advertisements_counted)
+        self._advertisements_counted = advertisements
+        if not observations:
+            return observations
+        dropped = queues.put_many(self.observation_queue, observations)
+        emitted = len(observations)
+        if getattr(self.observation_queue, "policy", queues.DROP_NEWEST) == queues.DROP_NEWEST:
+            emitted -= dropped  # rejected from this window; drop_oldest evicts older items instead
+        self._emitted += emitted
+        _emitted_count.inc(emitted)
+        if dropped:
+            previous = self._dropped
+            self._dropped += dropped
+            if queues.drop_warning_due(previous, self._dropped):
+                logger.warning("BleScanner dropped observations: %s", self._dropped)
+        return observations
+
+    def _run(self) -> None:
+        """Thread loop closing coalescing windows as they expire."""
+        interval = max(0.01, self.window / 4.0)
+        while not self._stop_event.is_set():
+            try:
+                if self.coalescer.due(self.clock()):
+                    self.flush()
+            except Exception:
+                logger.warning("BLE flush failed", exc_info=True)
+            self._stop_event.wait(interval)
+        try:
+            self.flush()
+        except Exception:
+            logger.warning("BLE flush failed", exc_info=True)
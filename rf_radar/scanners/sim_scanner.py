@@ -1,17 +1,49 @@
 """Deterministic simulator scanner emitting observations for testing and development."""
 
+import asyncio
 import logging
 import threading
 import time
-from queue import Full, Queue
+from dataclasses import dataclass
+from queue import Queue
 from random import Random
-from typing import Callable, Dict, Iterable
+from typing import Callable, Dict, Iterable, List, Optional
 
 from rf_radar.core.models import Observation, ObservationSource
+from rf_radar.infrastructure import queues
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class LoadProfile:
+    """Parameters of the large-scale simulator scenarios."""
+
+    static_aps: int = 50
+    moving_phones: int = 200
+    obs_per_second: float = 1000.0
+    rotation_interval: float = 0.0  # seconds between MAC rotations per phone; 0 disables
+    burst_period: float = 0.0  # seconds between bursts; 0 disables
+    burst_duration: float = 1.0  # seconds each burst lasts
+    burst_factor: float = 1.0  # rate multiplier during a burst
+    walk_step: float = 2.0  # max dBm change per tick of a phone's random walk
+    noise: int = 2  # max dBm jitter added to every observation
+
+
+LOAD_PROFILES: Dict[str, LoadProfile] = {
+    "CROWD": LoadProfile(static_aps=100, moving_phones=1000, obs_per_second=5000.0),
+    "CHURN": LoadProfile(static_aps=20, moving_phones=500, obs_per_second=2000.0, rotation_interval=15.0),
+    "BURST": LoadProfile(
+        static_aps=50,
+        moving_phones=300,
+        obs_per_second=500.0,
+        burst_period=5.0,
+        burst_duration=1.0,
+        burst_factor=20.0,
+    ),
+}
+
+
 class SimScanner:
     """Deterministic simulator that emits observations on a background thread."""
 
@@ -23,6 +55,7 @@ class SimScanner:
         seed: int = 42,
         tick_rate: float = None,
         start_ts: float = 0.0,
+        load_profile: Optional[LoadProfile] = None,
     ) -> None:
         self.observation_queue = observation_queue
         self.config = config
@@ -43,6 +76,11 @@ class SimScanner:
             "B": self._emit_scenario_b,
             "C": self._emit_scenario_c,
         }
+        for name in LOAD_PROFILES:
+            self._scenario_emitters[name] = self._emit_load
+        self.load_profile = load_profile or LOAD_PROFILES.get(self.scenario)
+        if self.load_profile is not None:
+            self._init_load_state(self.load_profile)
 
     def start(self) -> None:
         """Start the simulator thread."""
@@ -62,22 +100,32 @@ class SimScanner:
         self.running = False
         self._stop_event.clear()
 
+    def is_alive(self) -> bool:
+        """True while the simulator thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def dropped(self) -> int:
+        """Number of observations discarded because the queue was full."""
+        return self._dropped
+
     def _run(self) -> None:
         """Thread loop emitting observations at a fixed tick rate."""
         step = 0
         while not self._stop_event.is_set():
-            for obs in self._build_observations(step):
-                try:
-                    self.observation_queue.put_nowait(obs)
-                except Full:
-                    self._dropped += 1
-                    if self._dropped % 10 == 1:
-                        logger.warning("SimScanner dropped observations: %s", self._dropped)
+            dropped = queues.put_many(self.observation_queue, self._build_observations(step))
+            if dropped:
+                previous = self._dropped
+                self._dropped += dropped
+                if queues.drop_warning_due(previous, self._dropped):
+                    logger.warning("SimScanner dropped observations: %s", self._dropped)
             step += 1
             time.sleep(self.tick_interval)
 
     def _build_observations(self, step: int):
-        emitter = self._scenario_emitters.get(self.scenario, self._emit_scenario_a)
+        emitter = self._scenario_emitters.get(self.scenario)
+        if emitter is None:
+            emitter = self._emit_load if self.load_profile is not None else self._emit_scenario_a
         return emitter(step)
 
     def _base_observation(self, obs_id: str, rssi: int, ts: float):
@@ -111,3 +159,97 @@ class SimScanner:
             frac = (position - half) / half
             rssi = self.config.RSSI_MAX - frac * (self.config.RSSI_MAX - self.config.RSSI_MIN)
         yield self._base_observation("sim-move", rssi=rssi, ts=ts)
+
+    def _init_load_state(self, profile: LoadProfile) -> None:
+        rssi_min = self.config.RSSI_MIN
+        rssi_max = self.config.RSSI_MAX
+        self._load_meta = {"scenario": self.scenario}
+        self._ap_ids = [f"sim-ap-{i:05d}" for i in range(profile.static_aps)]
+        self._ap_levels = [self.random.uniform(rssi_min, rssi_max) for _ in range(profile.static_aps)]
+        self._phone_levels = [self.random.uniform(rssi_min, rssi_max) for _ in range(profile.moving_phones)]
+        self._phone_offsets = [
+            self.random.uniform(0.0, profile.rotation_interval) for _ in range(profile.moving_phones)
+        ]
+        self._load_carry = 0.0
+        self._phone_ids = (
+            [] if profile.rotation_interval > 0 else [f"sim-ph-{i:05d}" for i in range(profile.moving_phones)]
+        )
+
+    def _load_rate(self, ts: float) -> float:
+        profile = self.load_profile
+        rate = profile.obs_per_second
+        if profile.burst_period > 0 and (ts - self.start_ts) % profile.burst_period < profile.burst_duration:
+            rate *= profile.burst_factor
+        return rate
+
+    def _phone_id(self, idx: int, ts: float) -> str:
+        interval = self.load_profile.rotation_interval
+        if interval <= 0:
+            return f"sim-ph-{idx:05d}"
+        epoch = int((ts - self.start_ts + self._phone_offsets[idx]) // interval)
+        return f"sim-ph-{idx:05d}-{epoch:x}"
+
+    def _emit_load(self, step: int) -> List[Observation]:
+        """Emit one tick of a large-scale scenario as a single list of observations."""
+        profile = self.load_profile
+        rnd = self.random
+        rssi_min = self.config.RSSI_MIN
+        rssi_max = self.config.RSSI_MAX
+        ts = self.start_ts + step * self.tick_interval
+
+        levels = self._phone_levels
+        walk = profile.walk_step
+        for idx, level in enumerate(levels):
+            level += rnd.uniform(-walk, walk)
+            levels[idx] = min(rssi_max, max(rssi_min, level))
+
+        exact = self._load_rate(ts) * self.tick_interval + self._load_carry
+        count = int(exact)
+        self._load_carry = exact - count
+        devices = profile.static_aps + profile.moving_phones
+        if count <= 0 or devices <= 0:
+            return []
+
+        ap_count = profile.static_aps
+        ap_ids = self._ap_ids
+        ap_levels = self._ap_levels
+        phone_ids = self._phone_ids
+        picks = rnd.choices(range(devices), k=count)
+        noise = profile.noise
+        dt = self.tick_interval / count
+        meta = self._load_meta
+        observations = []
+        for k, device in enumerate(picks):
+            if device < ap_count:
+                obs_id = ap_ids[device]
+                level = ap_levels[device]
+            else:
+                idx = device - ap_count
+                obs_id = phone_ids[idx] if phone_ids else self._phone_id(idx, ts)
+                level = levels[idx]
+            rssi = int(level) + rnd.randint(-noise, noise)
+            observations.append(
+                Observation(
+                    source=ObservationSource.SIM,
+                    id=obs_id,
+                    rssi=min(rssi_max, max(rssi_min, rssi)),
+                    ts=ts + k * dt,
+                    meta=meta,
+                )
+            )
+        return observations
+
+
+async def produce_async(
+    emit: Callable[[List[Observation]], None], config, scenario: str = "C", seed: int = 1
+) -> None:
+    """Emit simulator observations forever on the running event loop at the core tick rate.
+
+    Observations are stamped from the wall clock at start, like the WiFi and BLE producers.
+    """
+    scanner = SimScanner(None, config, scenario=scenario, seed=seed, start_ts=time.time())
+    step = 0
+    while True:
+        emit(list(scanner._build_observations(step)))
+        step += 1
+        await asyncio.sleep(scanner.tick_interval)
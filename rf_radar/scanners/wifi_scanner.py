@@ -1,3 +1,371 @@
-"""WiFi scanner stub using nmcli in later milestones."""
+"""WiFi scanner running nmcli (or iw) scans and streaming their output into observations."""
 
-# Implementation will arrive in later milestones.
+import asyncio
+import logging
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from queue import Queue
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from rf_radar.core.models import Observation, ObservationSource
+from rf_radar.infrastructure import metrics, queues
+
+logger = logging.getLogger(__name__)
+
+_scan_ms = metrics.registry.histogram("wifi.scan_ms")
+_parse_ms = metrics.registry.histogram("wifi.parse_ms")
+_scan_count = metrics.registry.counter("wifi.scans")
+_failure_count = metrics.registry.counter("wifi.failures")
+
+CommandRunner = Callable[[Sequence[str], float], Iterable[str]]
+AsyncCommandRunner = Callable[[Sequence[str], float], Awaitable[List[str]]]
+
+_NMCLI_FIELDS = "BSSID,SIGNAL,FREQ,SSID"
+_IW_BSS = re.compile(r"^BSS ([0-9a-fA-F:]{17})")
+_IW_SIGNAL = re.compile(r"^\s*signal:\s*(-?\d+(?:\.\d+)?)\s*dBm")
+_IW_FREQ = re.compile(r"^\s*freq:\s*(\d+)")
+_IW_SSID = re.compile(r"^\s*SSID:\s?(.*)$")
+
+
+@dataclass(frozen=True)
+class ScanRecord:
+    """One access point reported by a scan."""
+
+    bssid: str
+    rssi: int
+    ssid: str
+    freq: Optional[int]
+
+
+def run_command(command: Sequence[str], timeout: float) -> Iterator[str]:
+    """Run ``command`` and yield its stdout lines as they arrive.
+
+    The process is killed if it is still running after ``timeout`` seconds, so
+    a hung scan cannot stall the scanner thread.
+    """
+    proc = subprocess.Popen(
+        list(command),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        bufsize=1,
+    )
+    killer = threading.Timer(timeout, proc.kill)
+    killer.start()
+    try:
+        for line in proc.stdout:
+            yield line
+        proc.wait()
+    finally:
+        killer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+
+async def run_command_async(command: Sequence[str], timeout: float) -> List[str]:
+    """Run ``command`` as an asyncio subprocess and return its stdout lines.
+
+    The process is killed if it has not finished after ``timeout`` seconds or
+    when the awaiting task is cancelled; ``asyncio.TimeoutError`` is raised on
+    timeout.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    return stdout.decode("utf-8", errors="replace").splitlines(keepends=True)
+
+
+def _split_nmcli(line: str) -> List[str]:
+    """Split a ``nmcli -t`` line on unescaped colons, unescaping ``\\:`` and ``\\\\``."""
+    fields = []
+    current = []
+    chars = iter(line)
+    for char in chars:
+        if char == "\\":
+            current.append(next(chars, ""))
+        elif char == ":":
+            fields.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    fields.append("".join(current))
+    return fields
+
+
+def parse_nmcli(lines: Iterable[str]) -> Iterator[ScanRecord]:
+    """Parse ``nmcli -t -f BSSID,SIGNAL,FREQ,SSID device wifi list`` output line by line.
+
+    nmcli reports signal quality as 0-100; it is converted to dBm with the
+    usual ``quality / 2 - 100`` approximation. Malformed lines are skipped.
+    """
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line:
+            continue
+        fields = _split_nmcli(line)
+        if len(fields) < 4:
+            continue
+        bssid, signal, freq, ssid = fields[0], fields[1], fields[2], ":".join(fields[3:])
+        try:
+            quality = int(signal)
+        except ValueError:
+            continue
+        freq_digits = freq.split(" ", 1)[0]
+        yield ScanRecord(
+            bssid=bssid.lower(),
+            rssi=int(round(quality / 2 - 100)),
+            ssid=ssid,
+            freq=int(freq_digits) if freq_digits.isdigit() else None,
+        )
+
+
+def parse_iw(lines: Iterable[str]) -> Iterator[ScanRecord]:
+    """Parse ``iw dev <iface> scan`` output, emitting a record as each BSS block ends."""
+    bssid = None
+    rssi = None
+    ssid = ""
+    freq = None
+    for line in lines:
+        match = _IW_BSS.match(line)
+        if match:
+            if bssid is not None and rssi is not None:
+                yield ScanRecord(bssid=bssid, rssi=rssi, ssid=ssid, freq=freq)
+            bssid = match.group(1).lower()
+            rssi = None
+            ssid = ""
+            freq = None
+            continue
+        if bssid is None:
+            continue
+        match = _IW_SIGNAL.match(line)
+        if match:
+            rssi = int(round(float(match.group(1))))
+            continue
+        match = _IW_FREQ.match(line)
+        if match:
+            freq = int(match.group(1))
+            continue
+        match = _IW_SSID.match(line)
+        if match:
+            ssid = match.group(1).strip()
+    if bssid is not None and rssi is not None:
+        yield ScanRecord(bssid=bssid, rssi=rssi, ssid=ssid, freq=freq)
+
+
+_BACKENDS: Dict[str, Callable[[Iterable[str]], Iterator[ScanRecord]]] = {
+    "nmcli": parse_nmcli,
+    "iw": parse_iw,
+}
+
+
+def scan_command(backend: str, interface: str) -> List[str]:
+    """Return the command line used by ``backend`` to scan on ``interface``."""
+    if backend == "iw":
+        return ["iw", "dev", interface, "scan"]
+    command = ["nmcli", "-t", "-f", _NMCLI_FIELDS, "device", "wifi", "list", "--rescan", "yes"]
+    if interface:
+        command += ["ifname", interface]
+    return command
+
+
+def build_observations(records: Iterable[ScanRecord], ts: float) -> List[Observation]:
+    """One observation per BSSID at ``ts``, keeping the strongest reading of each."""
+    strongest: Dict[str, ScanRecord] = {}
+    for record in records:
+        known = strongest.get(record.bssid)
+        if known is None or record.rssi > known.rssi:
+            strongest[record.bssid] = record
+    return [
+        Observation(
+            source=ObservationSource.WIFI,
+            id=record.bssid,
+            rssi=record.rssi,
+            ts=ts,
+            meta={"ssid": record.ssid, "freq": record.freq},
+        )
+        for record in strongest.values()
+    ]
+
+
+async def produce_async(
+    emit: Callable[[List[Observation]], None],
+    config,
+    runner: AsyncCommandRunner = run_command_async,
+    clock: Callable[[], float] = time.time,
+) -> None:
+    """Scan forever on the running event loop, passing each scan's observations to ``emit``.
+
+    Failed or timed out scans are logged and retried at the next interval.
+    Returns, logging a warning, when the scan command is not installed, so
+    the runtime continues without WiFi.
+    """
+    backend = getattr(config, "WIFI_BACKEND", "nmcli")
+    command = scan_command(backend, getattr(config, "WIFI_INTERFACE", ""))
+    parse = _BACKENDS.get(backend, parse_nmcli)
+    interval = float(getattr(config, "WIFI_SCAN_INTERVAL", 5.0))
+    timeout = float(getattr(config, "WIFI_SCAN_TIMEOUT", 15.0))
+    while True:
+        started = time.perf_counter()
+        try:
+            lines = await runner(command, timeout)
+            parse_start = time.perf_counter()
+            records = list(parse(lines))
+            _parse_ms.observe_since(parse_start)
+            emit(build_observations(records, clock()))
+            _scan_count.inc()
+            _scan_ms.observe_since(started)
+        except FileNotFoundError:
+            logger.warning("WiFi scan command %s not found, continuing without WiFi", command[0])
+            return
+        except Exception:
+            _failure_count.inc()
+            logger.warning("WiFi scan failed (%s)", backend, exc_info=True)
+        await asyncio.sleep(interval)
+
+
+def _timed_lines(lines: Iterable[str], wait: List[float]) -> Iterator[str]:
+    """Yield ``lines``, adding the time spent waiting for each one to ``wait[0]``."""
+    iterator = iter(lines)
+    while True:
+        start = time.perf_counter()
+        line = next(iterator, None)
+        wait[0] += time.perf_counter() - start
+        if line is None:
+            return
+        yield line
+
+
+class WifiScanner:
+    """Periodic WiFi scanner emitting one observation per BSSID per scan on a background thread."""
+
+    def __init__(
+        self,
+        observation_queue: Queue,
+        config,
+        runner: CommandRunner = run_command,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.observation_queue = observation_queue
+        self.config = config
+        self.runner = runner
+        self.clock = clock
+        self.backend = getattr(config, "WIFI_BACKEND", "nmcli")
+        self.interface = getattr(config, "WIFI_INTERFACE", "")
+        self.scan_interval = float(getattr(config, "WIFI_SCAN_INTERVAL", 5.0))
+        self.scan_timeout = float(getattr(config, "WIFI_SCAN_TIMEOUT", 15.0))
+        self._parse = _BACKENDS.get(self.backend, parse_nmcli)
+
+        self.running = False
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._dropped = 0
+        self._scans = 0
+        self._failures = 0
+        self._last_bssids = 0
+        self._unavailable = False
+
+    def start(self) -> None:
+        """Start the scanner thread."""
+        if self.running:
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name="WifiScanner", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the scanner to stop and wait for the thread to finish."""
+        if not self.running:
+            return
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self.running = False
+        self._stop_event.clear()
+
+    def is_alive(self) -> bool:
+        """True while the scanner thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def dropped(self) -> int:
+        """Number of observations discarded because the queue was full."""
+        return self._dropped
+
+    @property
+    def unavailable(self) -> bool:
+        """True when the scan command is not installed; restarting the scanner will not help."""
+        return self._unavailable
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """Scan counts of this scanner, merged into the supervisor's per-source stats.
+
+        Scan and parse durations go to the ``wifi.scan_ms`` and ``wifi.parse_ms``
+        histograms of the metrics registry.
+        """
+        return {
+            "scans": self._scans,
+            "failures": self._failures,
+            "last_bssids": self._last_bssids,
+            "dropped": self._dropped,
+        }
+
+    def scan_once(self) -> List[Observation]:
+        """Run one scan, emit its observations to the queue and return them."""
+        started = time.perf_counter()
+        parsed: List[ScanRecord] = []
+        parse_time = 0.0
+        wait = [0.0]
+        lines = self.runner(scan_command(self.backend, self.interface), self.scan_timeout)
+        records = self._parse(_timed_lines(lines, wait))
+        while True:
+            parse_start = time.perf_counter()
+            record = next(records, None)
+            parse_time += time.perf_counter() - parse_start
+            if record is None:
+                break
+            parsed.append(record)
+
+        ts = self.clock()
+        observations = build_observations(parsed, ts)
+        dropped = queues.put_many(self.observation_queue, observations)
+        if dropped:
+            previous = self._dropped
+            self._dropped += dropped
+            if queues.drop_warning_due(previous, self._dropped):
+                logger.warning("WifiScanner dropped observations: %s", self._dropped)
+
+        self._scans += 1
+        self._last_bssids = len(observations)
+        _scan_count.inc()
+        _scan_ms.observe_since(started)
+        _parse_ms.observe(max(0.0, parse_time - wait[0]) * 1e3)
+        return observations
+
+    def _run(self) -> None:
+        """Thread loop scanning at the configured interval until stopped or the scan command is missing."""
+        while not self._stop_event.is_set():
+            try:
+                self.scan_once()
+            except FileNotFoundError:
+                self._unavailable = True
+                logger.warning("WiFi scan command for %s not found, continuing without WiFi", self.backend)
+                return
+            except Exception:
+                self._failures += 1
+                _failure_count.inc()
+                logger.warning("WiFi scan failed (%s)", self.backend, exc_info=True)
+            self._stop_event.wait(self.scan_interval)
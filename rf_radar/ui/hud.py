@@ -1,16 +1,20 @@
 """HUD rendering for the radar UI."""
 
+from itertools import islice
+
 import pygame
 
-from rf_radar.ui import theme
+from rf_radar.ui import text_cache, theme
 
 
 def _render_text(surface, font, text, x, y):
-    surface.blit(font.render(text, True, theme.TEXT), (x, y))
+    surface.blit(text_cache.shared.render(font, text, theme.TEXT), (x, y))
 
 
-def draw_hud(surface: pygame.Surface, font: pygame.font.Font, view_profile: dict, snap, rendered_count: int) -> None:
-    """Draw HUD with view info and optional target list."""
+def draw_hud(
+    surface: pygame.Surface, font: pygame.font.Font, view_profile: dict, snap, rendered_count: int
+) -> pygame.Rect:
+    """Draw HUD with view info and optional target list; returns the HUD area."""
     width, height = surface.get_size()
     line_height = font.get_linesize()
     max_lines = 6
@@ -34,7 +38,8 @@ def draw_hud(surface: pygame.Surface, font: pygame.font.Font, view_profile: dict
 
     if snap and view_name == "LIST":
         base_y = height - hud_height + 4 + line_height * 2
-        for idx, tgt in enumerate(snap.targets, start=1):
+        visible_rows = max_lines - 2
+        for idx, tgt in enumerate(islice(snap.targets, visible_rows), start=1):
             src = getattr(tgt, "source_mask", None)
             src_label = " ".join(s.value for s in src) if src else "N/A"
             rssi = getattr(tgt, "rssi_filt", getattr(tgt, "rssi_raw_last", 0))
@@ -43,3 +48,14 @@ def draw_hud(surface: pygame.Surface, font: pygame.font.Font, view_profile: dict
             state_label = tgt.state.name[0] if hasattr(tgt, "state") else "?"
             row = f"{idx:02d} {tgt.id[:10]:10} {src_label:3} {int(rssi):4}  {band_label}  {state_label}"
             _render_text(surface, font, row, 8, base_y + line_height * (idx - 1))
+    return hud_rect
+
+
+def draw_metrics_overlay(surface: pygame.Surface, font: pygame.font.Font, lines) -> pygame.Rect:
+    """Draw metric summary lines in a fixed box at the top of the surface; returns the box."""
+    line_height = font.get_linesize()
+    overlay_rect = pygame.Rect(0, 0, surface.get_width(), line_height * theme.METRICS_OVERLAY_LINES + 8)
+    surface.fill(theme.HUD_BG, overlay_rect)
+    for idx, line in enumerate(islice(lines, theme.METRICS_OVERLAY_LINES)):
+        _render_text(surface, font, line, 8, 4 + line_height * idx)
+    return overlay_rect
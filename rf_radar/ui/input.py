@@ -3,10 +3,12 @@
 import pygame
 
 
-def handle_events(current_index: int, total_views: int) -> tuple[bool, int]:
-    """Process pygame events; returns (running, new_view_index)."""
+def handle_events(current_index: int, total_views: int) -> tuple[bool, int, int, bool]:
+    """Process pygame events; returns (running, new_view_index, list_page_delta, toggle_metrics)."""
     running = True
     view_index = current_index
+    page_delta = 0
+    toggle_metrics = False
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
@@ -15,4 +17,10 @@ def handle_events(current_index: int, total_views: int) -> tuple[bool, int]:
                 running = False
             elif event.key == pygame.K_c:
                 view_index = (view_index + 1) % total_views
-    return running, view_index
+            elif event.key == pygame.K_PAGEDOWN:
+                page_delta += 1
+            elif event.key == pygame.K_PAGEUP:
+                page_delta -= 1
+            elif event.key == pygame.K_m:
+                toggle_metrics = not toggle_metrics
+    return running, view_index, page_delta, toggle_metrics
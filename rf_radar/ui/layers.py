@@ -0,0 +1,42 @@
+"""Cached render layers composed by the radar view."""
+
+from typing import Callable, Dict, Hashable, Tuple
+
+import pygame
+
+
+class StaticLayerCache:
+    """Pre-rendered layer that only changes with the surface size or view configuration.
+
+    ``draw`` paints the layer for a view profile and ``key`` extracts from the
+    profile the values the drawing depends on. One surface is kept per key; all
+    of them are dropped when the target surface size changes.
+    """
+
+    def __init__(
+        self,
+        draw: Callable[[pygame.Surface, dict], None],
+        key: Callable[[dict], Hashable],
+    ) -> None:
+        self._draw = draw
+        self._key = key
+        self._size: Tuple[int, int] = (0, 0)
+        self._layers: Dict[Hashable, pygame.Surface] = {}
+
+    def get(self, surface: pygame.Surface, view_profile: dict) -> pygame.Surface:
+        """Return the layer for ``surface``'s size and ``view_profile``."""
+        size = surface.get_size()
+        if size != self._size:
+            self._layers.clear()
+            self._size = size
+        key = self._key(view_profile)
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = pygame.Surface(size, 0, surface)
+            self._draw(layer, view_profile)
+            self._layers[key] = layer
+        return layer
+
+    def invalidate(self) -> None:
+        """Force every layer to be redrawn on next use."""
+        self._layers.clear()
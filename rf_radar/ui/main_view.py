@@ -2,17 +2,23 @@
 
 import logging
 import sys
+import time
 
 import pygame
 
-from rf_radar.app.runtime import Runtime
+from rf_radar.app.runtime import create_runtime
 from rf_radar.core import config
-from rf_radar.infrastructure import queues
+from rf_radar.infrastructure import metrics, queues
 from rf_radar.infrastructure.logging import setup_logging
 from rf_radar.ui import hud, radar_view, theme, input
 
 logger = logging.getLogger(__name__)
 
+_frame_ms = metrics.registry.histogram("ui.frame_ms")
+_frames = metrics.registry.counter("ui.frames")
+_frames_skipped = metrics.registry.counter("ui.frames_skipped")
+_fps = metrics.registry.gauge("ui.fps")
+
 
 def run(width: int = 400, height: int = 400, fps: int = None) -> None:
     """Run the radar UI loop consuming snapshots."""
@@ -26,16 +32,28 @@ def run(width: int = 400, height: int = 400, fps: int = None) -> None:
 
     observation_queue = queues.create_observation_queue(config)
     snapshot_queue = queues.create_snapshot_queue(config)
-    runtime = Runtime(config, observation_queue, snapshot_queue)
+    runtime = create_runtime(config, observation_queue, snapshot_queue)
     runtime.start()
 
     view_index = 0
     profiles = theme.VIEW_PROFILES
+    partial = getattr(config, "UI_PARTIAL_REDRAW", False)
+    show_metrics = getattr(config, "UI_METRICS_OVERLAY", False)
+    metric_lines = None
+    metric_refresh_at = 0.0
     running = True
     snap = None
+    shown = None
     while running:
-        running, view_index = input.handle_events(view_index, len(profiles))
+        running, view_index, page_delta, toggle_metrics = input.handle_events(view_index, len(profiles))
         view_profile = profiles[view_index]
+        if page_delta:
+            radar_view.scroll_list(page_delta)
+        if toggle_metrics:
+            show_metrics = not show_metrics
+            metric_lines = None
+            metric_refresh_at = 0.0
+            radar_view.invalidate()
 
         try:
             snap = snapshot_queue.get_nowait()
@@ -43,15 +61,62 @@ def run(width: int = 400, height: int = 400, fps: int = None) -> None:
         except Exception:
             pass
 
-        rendered_count = radar_view.render(screen, view_profile, snap if snap else None, font)
-        hud.draw_hud(screen, font, view_profile, snap if snap else None, rendered_count)
+        _fps.set(clock.get_fps())
+        if show_metrics and time.monotonic() >= metric_refresh_at:
+            # A fresh tuple each refresh, so the overlay counts as changed content.
+            metric_lines = tuple(
+                metrics.summary_lines(metrics.registry.snapshot(), limit=theme.METRICS_OVERLAY_LINES)
+            )
+            metric_refresh_at = time.monotonic() + theme.METRICS_OVERLAY_REFRESH
+
+        content = _frame_content(view_index, snap, metric_lines)
+        if partial and _same_content(content, shown) and not radar_view.is_animating():
+            _frames_skipped.inc()
+            clock.tick(target_fps)
+            continue
 
-        pygame.display.flip()
+        frame_start = time.perf_counter()
+        rendered_count = radar_view.render(screen, view_profile, snap if snap else None, font, partial=partial)
+        hud_rect = hud.draw_hud(screen, font, view_profile, snap if snap else None, rendered_count)
+        overlay_rect = hud.draw_metrics_overlay(screen, font, metric_lines) if metric_lines else None
+
+        if partial:
+            rects = radar_view.dirty_rects()
+            if not _same_content(content, shown) or hud_rect.collidelist(rects) != -1:
+                rects.append(hud_rect)
+            if overlay_rect is not None and (not _same_content(content, shown) or overlay_rect.collidelist(rects) != -1):
+                rects.append(overlay_rect)
+            if rects:
+                pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+        _frame_ms.observe_since(frame_start)
+        _frames.inc()
+        shown = content
         clock.tick(target_fps)
 
     runtime.stop()
     pygame.quit()
 
 
+def _frame_content(view_index: int, snap, metric_lines=None):
+    page = radar_view.list_page()
+    if snap is None:
+        return (view_index, None, None, page, metric_lines)
+    return (view_index, snap.targets, snap.selected_id, page, metric_lines)
+
+
+def _same_content(content, shown) -> bool:
+    """Compare frame inputs by identity of the snapshot targets tuple, which the core reuses when unchanged."""
+    return (
+        shown is not None
+        and content[0] == shown[0]
+        and content[1] is shown[1]
+        and content[2] == shown[2]
+        and content[3] == shown[3]
+        and content[4] is shown[4]
+    )
+
+
 if __name__ == "__main__":
     run()
@@ -3,13 +3,13 @@
 import logging
 import math
 import time
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
 from rf_radar.core import config, mapping
 from rf_radar.core.models import TargetState
-from rf_radar.ui import theme
+from rf_radar.ui import layers, sprites, text_cache, theme
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +45,16 @@ def draw_crosshair(surface: pygame.Surface) -> None:
     pygame.draw.polygon(surface, theme.TRIANGLE, points)
 
 
+def _draw_static_layer(surface: pygame.Surface, view_profile: dict) -> None:
+    draw_background(surface)
+    draw_grid(surface, view_profile.get("grid_spacing", theme.GRID_SPACING))
+    draw_crosshair(surface)
+
+
+def _static_layer_key(view_profile: dict):
+    return view_profile.get("grid_spacing", theme.GRID_SPACING)
+
+
 def _blend(color_from, color_to, factor: float):
     factor = max(0.0, min(1.0, factor))
     return tuple(
@@ -53,6 +63,20 @@ def _blend(color_from, color_to, factor: float):
     )
 
 
+_sprite_cache = sprites.SpriteCache()
+_static_layer = layers.StaticLayerCache(_draw_static_layer, _static_layer_key)
+_unit_vectors: Dict[str, Tuple[float, float]] = {}
+_placements: Dict[str, tuple] = {}
+_placement_key = None
+_placement_targets = None
+_placed: List[Tuple[str, int, int]] = []
+_placed_visible = 0
+_frame_key = None
+_frame_targets: Dict[str, Tuple[pygame.Surface, pygame.Rect]] = {}
+_dirty_rects: List[pygame.Rect] = []
+_animating = False
+_list_page = 0
+_debug_log = bool(getattr(config, "UI_DEBUG_LOG", False))
 _last_snapshot = None
 _last_snapshot_walltime: Optional[float] = None
 _target_reset_seen_ts = {}
@@ -77,105 +101,229 @@ def set_snapshot(snap) -> None:
         if known_id not in current_ids:
             _target_reset_seen_ts.pop(known_id, None)
             _target_reset_walltime.pop(known_id, None)
+            _unit_vectors.pop(known_id, None)
+            _placements.pop(known_id, None)
 
 
-def _filter_targets_for_view(snap, view_profile: dict):
-    rssi_min = view_profile.get("rssi_min_visible", -100)
-    filtered = []
-    for target in snap.targets:
-        try:
-            if target.rssi_filt < rssi_min and target.state == TargetState.ACTIVE:
-                continue
-        except Exception:
-            pass
-        filtered.append(target)
-    return filtered
-
-
-def _render_targets(surface: pygame.Surface, snap, view_profile: dict) -> int:
-    width, height = surface.get_size()
-    cx = width // 2
-    cy = height // 2
-    max_radius = min(width, height) * view_profile.get("radius_scale", 0.45)
-    fade_seconds = getattr(config, "TARGET_UPDATE_INTERVAL", theme.TARGET_FADE_SECONDS)
+def _project_targets(snap, view_profile: dict, size: Tuple[int, int], frame_ts: float):
+    """Project every target using a single frame timestamp.
+
+    Returns ``(visible, projected)``: the number of targets passing the view
+    filter and a list of ``(id, x, y, age, fade)`` for those still on screen.
+    Screen positions only change with the snapshot, so they are placed once
+    per snapshot (see ``_place_targets``) and each frame only computes age
+    and fade.
+    """
+    global _placement_key, _placement_targets, _placed_visible, _placed
     rssi_min = view_profile.get("rssi_min_visible", -100)
     rssi_max = view_profile.get("rssi_max_visible", -30)
+    placement_key = (size, view_profile.get("radius_scale", 0.45), rssi_min, rssi_max)
+    if placement_key != _placement_key:
+        _placements.clear()
+        _placement_key = placement_key
+        _placement_targets = None
+    if snap.targets is not _placement_targets:
+        _placed_visible, _placed = _place_targets(snap.targets, size, placement_key[1], rssi_min, rssi_max)
+        _placement_targets = snap.targets
 
-    filtered = _filter_targets_for_view(snap, view_profile)
-
-    for target in filtered:
-        if target.state == TargetState.GONE:
-            continue
-        angle_rad = math.radians(target.angle_deg)
-        rssi = getattr(target, "rssi_filt", None)
-        if rssi is None:
-            continue
-        norm = (rssi_max - max(rssi_min, min(rssi_max, rssi))) / max(1e-6, (rssi_max - rssi_min))
-        radius_px = norm * max_radius
-        x_norm, y_norm = mapping.polar_to_cartesian(angle_rad, radius_px)
-        x = int(cx + x_norm)
-        y = int(cy + y_norm)
-
-        last_seen_wall = _target_reset_walltime.get(target.id, _last_snapshot_walltime or time.time())
-        age = max(0.0, time.time() - last_seen_wall)
+    fade_seconds = getattr(config, "TARGET_UPDATE_INTERVAL", theme.TARGET_FADE_SECONDS)
+    default_wall = _last_snapshot_walltime or frame_ts
+    reset_walltime = _target_reset_walltime
+    projected = []
+    for target_id, x, y in _placed:
+        age = max(0.0, frame_ts - reset_walltime.get(target_id, default_wall))
         fade = max(0.0, 1.0 - age / fade_seconds) if fade_seconds > 0 else 0.0
-        if fade <= 0.0:
+        if fade > 0.0:
+            projected.append((target_id, x, y, age, fade))
+    return _placed_visible, projected
+
+
+def _place_targets(targets, size: Tuple[int, int], radius_scale: float, rssi_min: float, rssi_max: float):
+    """Filter targets for the view and place them on screen, reusing placements of unchanged records.
+
+    The core reuses a target's record while it is unchanged, so a placement
+    cached for the same record object is still valid; only new or changed
+    targets are projected again. Unit direction vectors are cached per id
+    since a target's angle never changes during its life. Returns
+    ``(visible, placed)`` with ``(id, x, y)`` for each target to draw.
+    """
+    width, height = size
+    cx = width // 2
+    cy = height // 2
+    scale = min(width, height) * radius_scale / max(1e-6, (rssi_max - rssi_min))
+    placements = _placements
+    units = _unit_vectors
+    active = TargetState.ACTIVE
+    gone = TargetState.GONE
+
+    visible = 0
+    placed = []
+    for target in targets:
+        target_id = target.id
+        cached = placements.get(target_id)
+        if cached is not None and cached[0] is target:
+            place = cached[1]
+        else:
+            state = target.state
+            rssi = target.rssi_filt
+            if rssi < rssi_min and state is active:
+                place = None
+            elif state is gone:
+                place = ()
+            else:
+                unit = units.get(target_id)
+                if unit is None:
+                    unit = units[target_id] = mapping.polar_to_cartesian(math.radians(target.angle_deg), 1.0)
+                radius_px = (rssi_max - max(rssi_min, min(rssi_max, rssi))) * scale
+                place = (target_id, int(cx + unit[0] * radius_px), int(cy + unit[1] * radius_px))
+            placements[target_id] = (target, place)
+        if place is None:
             continue
+        visible += 1
+        if place:
+            placed.append(place)
+    return visible, placed
 
+
+def _render_targets(surface: pygame.Surface, snap, view_profile: dict, partial: bool) -> int:
+    global _animating
+    visible, projected = _project_targets(snap, view_profile, surface.get_size(), time.time())
+
+    frame: Dict[str, Tuple[pygame.Surface, pygame.Rect]] = {}
+    animating = False
+    selected_id = snap.selected_id
+    radius_min = theme.TARGET_RADIUS_MIN
+    radius_span = theme.TARGET_RADIUS - theme.TARGET_RADIUS_MIN
+    debug = _debug_log and logger.isEnabledFor(logging.DEBUG)
+    for target_id, x, y, age, fade in projected:
         alpha = int(255 * fade)
-        if snap.selected_id and snap.selected_id == target.id:
-            alpha = min(255, int(alpha * 1.2))
-
-        radius = max(
-            theme.TARGET_RADIUS_MIN,
-            int(round(theme.TARGET_RADIUS_MIN + (theme.TARGET_RADIUS - theme.TARGET_RADIUS_MIN) * fade)),
-        )
-        diameter = radius * 2
-        temp = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
-        pygame.draw.circle(
-            temp,
-            (*theme.TARGET_HOT, alpha),
-            (radius, radius),
-            radius,
-        )
-        surface.blit(temp, (x - radius, y - radius))
-        logger.debug(
-            "UI_DRAW id=%s age=%.2f fade=%.2f alpha=%s radius=%s pos=(%s,%s)",
-            target.id,
-            age,
-            fade,
-            alpha,
-            radius,
-            x,
-            y,
-        )
-    return len(filtered)
+        radius = max(radius_min, int(round(radius_min + radius_span * fade)))
+        sprite = _sprite_cache.get(radius, alpha, target_id == selected_id, theme.TARGET_HOT)
+        frame[target_id] = (sprite, pygame.Rect(x - radius, y - radius, radius * 2, radius * 2))
+        animating = animating or fade < 1.0
+        if debug:
+            logger.debug(
+                "UI_DRAW id=%s age=%.2f fade=%.2f alpha=%s radius=%s pos=(%s,%s)",
+                target_id,
+                age,
+                fade,
+                alpha,
+                radius,
+                x,
+                y,
+            )
+    _animating = animating
+    _compose_targets(surface, frame, view_profile, partial)
+    return visible
+
+
+def _compose_targets(surface: pygame.Surface, frame, view_profile: dict, partial: bool) -> None:
+    """Paint the static layer and target sprites, fully or only where the frame changed."""
+    global _frame_key, _frame_targets, _dirty_rects
+    background = _static_layer.get(surface, view_profile)
+    frame_key = (surface.get_size(), view_profile.get("name"))
+    previous = _frame_targets if frame_key == _frame_key else None
+    _frame_key = frame_key
+    _frame_targets = frame
+
+    dirty: List[pygame.Rect] = []
+    if partial and previous is not None:
+        for target_id, (sprite, rect) in frame.items():
+            prev = previous.get(target_id)
+            if prev is None:
+                dirty.append(rect)
+            elif prev[0] is not sprite or prev[1] != rect:
+                dirty.append(rect)
+                dirty.append(prev[1])
+        for target_id, (_, rect) in previous.items():
+            if target_id not in frame:
+                dirty.append(rect)
+
+    if not partial or previous is None or len(dirty) > theme.DIRTY_RECTS_MAX:
+        surface.blit(background, (0, 0))
+        surface.blits(list(frame.values()), doreturn=False)
+        _dirty_rects = [surface.get_rect()]
+        return
+
+    # Repaint each dirty area clipped to itself so sprites outside it are not blended twice.
+    drawn = list(frame.values())
+    rects = [rect for _, rect in drawn]
+    for area in dirty:
+        surface.set_clip(area)
+        surface.blit(background, area, area)
+        surface.blits([drawn[idx] for idx in area.collidelistall(rects)], doreturn=False)
+    surface.set_clip(None)
+    _dirty_rects = dirty
+
+
+def dirty_rects() -> List[pygame.Rect]:
+    """Areas of the surface repainted by the last ``render`` call."""
+    return list(_dirty_rects)
+
+
+def invalidate() -> None:
+    """Force the next ``render`` to repaint the whole surface."""
+    global _frame_key
+    _frame_key = None
+
+
+def is_animating() -> bool:
+    """True while targets drawn in the last frame are still fading out."""
+    return _animating
+
+
+def scroll_list(pages: int) -> None:
+    """Move the LIST view by ``pages`` pages; clamped to the available rows when rendered."""
+    global _list_page
+    _list_page = max(0, _list_page + pages)
+
+
+def list_page() -> int:
+    """Current page of the LIST view."""
+    return _list_page
 
 
 def _render_list(surface: pygame.Surface, font, snap) -> None:
+    global _list_page
     surface.fill(theme.BG_BASE)
     if not snap:
         return
+    line_height = font.get_linesize()
     header = "ID        SRC  RSSI  BAND  ST"
-    surface.blit(font.render(header, True, theme.TEXT), (12, 12))
-    for idx, tgt in enumerate(snap.targets):
+    surface.blit(text_cache.shared.render(font, header, theme.TEXT), (12, 12))
+
+    # Only the rows that fit on screen are formatted and drawn.
+    rows_per_page = max(1, (surface.get_height() - 12) // line_height - 1)
+    last_page = max(0, (len(snap.targets) - 1) // rows_per_page)
+    _list_page = min(_list_page, last_page)
+    start = _list_page * rows_per_page
+    for row, tgt in enumerate(snap.targets[start:start + rows_per_page], start=1):
         src = getattr(tgt, "source_mask", None)
         src_label = " ".join(s.value for s in src) if src else "N/A"
         rssi = getattr(tgt, "rssi_filt", getattr(tgt, "rssi_raw_last", 0))
         band = getattr(tgt, "state", None)
         state_label = band.name[0] if band else "?"
         line = f"{tgt.id[:10]:10} {src_label:3} {int(rssi):4}  --   {state_label}"
-        surface.blit(font.render(line, True, theme.TEXT), (12, 12 + (idx + 1) * font.get_linesize()))
+        surface.blit(text_cache.shared.render(font, line, theme.TEXT), (12, 12 + row * line_height))
 
 
-def render(surface: pygame.Surface, view_profile: dict, snap, font) -> int:
-    """Render according to view profile; returns count of rendered targets."""
-    draw_background(surface)
+def render(surface: pygame.Surface, view_profile: dict, snap, font, partial: bool = False) -> int:
+    """Render according to view profile; returns count of rendered targets.
+
+    With ``partial`` the radar view only repaints the areas of targets that
+    appeared, moved, changed sprite or disappeared since the previous frame.
+    ``dirty_rects`` reports what was repainted either way.
+    """
+    global _animating, _frame_key, _frame_targets, _dirty_rects
     if view_profile.get("draw_radar", True):
-        draw_grid(surface, view_profile.get("grid_spacing", theme.GRID_SPACING))
-        draw_crosshair(surface)
         if snap:
-            return _render_targets(surface, snap, view_profile)
+            return _render_targets(surface, snap, view_profile, partial)
+        _animating = False
+        _compose_targets(surface, {}, view_profile, partial)
     else:
         _render_list(surface, font, snap)
+        _animating = False
+        _frame_key = None
+        _frame_targets = {}
+        _dirty_rects = [surface.get_rect()]
     return snap.stats.get("total", 0) if snap else 0
@@ -0,0 +1,58 @@
+"""Cache of pre-rendered target sprites for the radar view."""
+
+from collections import OrderedDict
+from typing import Tuple
+
+import pygame
+
+from rf_radar.ui import theme
+
+Color = Tuple[int, int, int]
+
+
+class SpriteCache:
+    """Bounded LRU cache of circle sprites keyed by (radius, alpha bucket, selected, color).
+
+    Alpha is quantized into ``alpha_buckets`` levels so fading targets share a
+    small set of surfaces instead of allocating one per target per frame.
+    """
+
+    def __init__(self, max_entries: int = theme.SPRITE_CACHE_SIZE, alpha_buckets: int = theme.SPRITE_ALPHA_BUCKETS) -> None:
+        self.max_entries = max_entries
+        self.alpha_buckets = alpha_buckets
+        self.hits = 0
+        self.misses = 0
+        self._sprites: "OrderedDict[Tuple[int, int, bool, Color], pygame.Surface]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def get(self, radius: int, alpha: int, selected: bool, color: Color) -> pygame.Surface:
+        """Return a sprite for a target drawn with the given radius and base alpha."""
+        bucket = max(0, min(255, alpha)) * (self.alpha_buckets - 1) // 255
+        key = (radius, bucket, selected, color)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = self._render(radius, bucket * 255 // (self.alpha_buckets - 1), selected, color)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def clear(self) -> None:
+        """Drop every cached sprite."""
+        self._sprites.clear()
+
+    @staticmethod
+    def _render(radius: int, alpha: int, selected: bool, color: Color) -> pygame.Surface:
+        if selected:
+            alpha = min(255, int(alpha * 1.2))
+        diameter = radius * 2
+        sprite = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+        return sprite
@@ -0,0 +1,46 @@
+"""Cache of rendered text surfaces shared by the HUD and list renderers."""
+
+from collections import OrderedDict
+from typing import Tuple
+
+import pygame
+
+from rf_radar.ui import theme
+
+Color = Tuple[int, int, int]
+
+
+class TextCache:
+    """Bounded LRU cache of ``font.render`` results keyed by (font, text, color)."""
+
+    def __init__(self, max_entries: int = theme.TEXT_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: "OrderedDict[Tuple[pygame.font.Font, str, Color], pygame.Surface]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, font: pygame.font.Font, text: str, color: Color) -> pygame.Surface:
+        """Return an antialiased surface for ``text``, rasterizing it only on a miss."""
+        key = (font, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """Drop every cached surface."""
+        self._surfaces.clear()
+
+
+shared = TextCache()
@@ -19,6 +19,10 @@ TARGET_SELECTED = (230, 255, 230)
 TARGET_RADIUS = 6
 TARGET_RADIUS_MIN = 2
 TARGET_FADE_SECONDS = 4.0
+SPRITE_CACHE_SIZE = 256
+SPRITE_ALPHA_BUCKETS = 16
+TEXT_CACHE_SIZE = 512
+DIRTY_RECTS_MAX = 200  # above this many changed areas a frame is repainted in full
 
 # View profiles
 VIEW_PROFILES = [
@@ -53,3 +57,5 @@ VIEW_PROFILES = [
         "draw_radar": True,
     },
 ]
+METRICS_OVERLAY_LINES = 8
+METRICS_OVERLAY_REFRESH = 0.5  # seconds between metric overlay updates
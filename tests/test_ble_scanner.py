@@ -0,0 +1,93 @@
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.core import config
+from rf_radar.core.models import ObservationSource
+from rf_radar.infrastructure.queues import DROP_NEWEST, DROP_OLDEST, ObservationChannel, create_observation_queue
+from rf_radar.scanners.ble_scanner import AdvertisementCoalescer, BleScanner
+
+
+class FakeBackend:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.callback = None
+        self.stopped = False
+
+    def start(self, callback):
+        if self.fail:
+            raise ImportError("bleak")
+        self.callback = callback
+
+    def stop(self):
+        self.stopped = True
+
+    def advertise(self, address, rssi, ts):
+        self.callback(address, rssi, ts)
+
+
+def test_coalescer_aggregates_per_address():
+    coalescer = AdvertisementCoalescer(window=0.5)
+    for rssi, ts in ((-70, 0.0), (-60, 0.1), (-80, 0.2)):
+        coalescer.add("aa:01", rssi, ts)
+    coalescer.add("aa:02", -50, 0.3)
+
+    assert not coalescer.due(0.4)
+    assert coalescer.due(0.5)
+    observations = {obs.id: obs for obs in coalescer.flush()}
+
+    assert observations["aa:01"].rssi == -60
+    assert observations["aa:01"].ts == 0.2
+    assert observations["aa:01"].meta["count"] == 3
+    assert observations["aa:01"].meta["rssi_mean"] == -70
+    assert observations["aa:02"].source == ObservationSource.BLE
+    assert coalescer.flush() == []
+    assert not coalescer.due(10.0)
+
+
+def test_coalescer_mean_aggregate():
+    coalescer = AdvertisementCoalescer(window=0.5, aggregate="mean")
+    coalescer.add("aa:01", -70, 0.0)
+    coalescer.add("aa:01", -61, 0.1)
+
+    assert coalescer.flush()[0].rssi == -66
+
+
+def test_scanner_emits_one_observation_per_address_per_window():
+    queue = create_observation_queue(config)
+    backend = FakeBackend()
+    scanner = BleScanner(queue, config, backend=backend, clock=lambda: 0.0)
+    scanner.start()
+    try:
+        for i in range(50):
+            backend.advertise(f"dev-{i % 5}", -60 - i % 7, i * 0.001)
+    finally:
+        scanner.stop()
+
+    assert backend.stopped
+    assert queue.qsize() == 5
+    assert scanner.metrics == {"advertisements": 50, "emitted": 5, "dropped": 0}
+
+
+def test_full_channel_counts_emitted_by_drop_policy():
+    for policy, emitted in ((DROP_OLDEST, 3), (DROP_NEWEST, 0)):
+        channel = ObservationChannel(4, policy)
+        channel.push_many(["old"] * 4)
+        scanner = BleScanner(channel, config, backend=FakeBackend(), clock=lambda: 0.0)
+        for i in range(3):
+            scanner.coalescer.add(f"dev-{i}", -60, 0.0)
+        scanner.flush()
+
+        assert scanner.metrics == {"advertisements": 3, "emitted": emitted, "dropped": 3}, policy
+
+
+def test_scanner_degrades_when_backend_unavailable():
+    scanner = BleScanner(create_observation_queue(config), config, backend=FakeBackend(fail=True))
+    scanner.start()
+
+    assert not scanner.running
+    assert scanner.unavailable
+    scanner.stop()
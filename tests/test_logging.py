@@ -0,0 +1,36 @@
+import logging
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.infrastructure.logging import RateLimitFilter
+
+
+def _record(msg, level=logging.DEBUG):
+    return logging.LogRecord("rf_radar.test", level, __file__, 1, msg, (1,), None)
+
+
+def test_rate_limit_is_per_event_type():
+    now = [0.0]
+    limiter = RateLimitFilter(rate=2.0, burst=2, clock=lambda: now[0])
+
+    passed = [limiter.filter(_record("TARGET id=%s")) for _ in range(5)]
+    other = limiter.filter(_record("UI_DRAW id=%s"))
+
+    assert passed == [True, True, False, False, False]
+    assert other
+    assert limiter.suppressed == {"TARGET id=%s": 3}
+
+
+def test_rate_limit_refills_over_time_and_passes_warnings():
+    now = [0.0]
+    limiter = RateLimitFilter(rate=2.0, burst=1, clock=lambda: now[0])
+
+    assert limiter.filter(_record("TARGET id=%s"))
+    assert not limiter.filter(_record("TARGET id=%s"))
+    assert limiter.filter(_record("TARGET id=%s", logging.WARNING))
+    now[0] = 0.5
+    assert limiter.filter(_record("TARGET id=%s"))
@@ -1,6 +1,7 @@
 import math
 import pathlib
 import sys
+from types import SimpleNamespace
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -8,6 +9,7 @@ if str(ROOT) not in sys.path:
 
 from rf_radar.core import config
 from rf_radar.core import mapping
+from rf_radar.core.models import Observation, ObservationSource
 
 
 def test_angle_is_deterministic():
@@ -46,3 +48,65 @@ def test_polar_to_cartesian_preserves_radius():
     radius = 0.7
     x, y = mapping.polar_to_cartesian(angle, radius)
     assert math.isclose(math.hypot(x, y), radius, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_fractional_rssi_between_bands_maps_to_lower_band():
+    _, band_low = mapping.radius_from_rssi_band(-80, config)
+    _, band_gap = mapping.radius_from_rssi_band(-79.5, config)
+    _, band_high = mapping.radius_from_rssi_band(-79, config)
+    assert band_gap == band_low
+    assert band_high == band_low + 1
+
+
+def test_band_mapper_integer_table_matches_float_search():
+    mapper = mapping.BandMapper.from_config(config)
+    for value in range(config.RSSI_MIN - 5, config.RSSI_MAX + 6):
+        assert mapper.lookup(value) == mapper.lookup(float(value))
+    radii, bands = mapper.lookup_many([-90, -70.5, -45.0, -25])
+    assert bands == [0, 1, 2, 3]
+    assert radii == config.RADII_NORMALIZED
+
+
+def test_band_mapper_rebuilds_when_range_changes():
+    zoomed = SimpleNamespace(
+        RSSI_MIN=-70,
+        RSSI_MAX=-30,
+        RSSI_BANDS=[(-70, -51), (-50, -30)],
+        RADII_NORMALIZED=[1.0, 0.5],
+    )
+    assert mapping.radius_from_rssi_band(-60, zoomed) == (1.0, 0)
+    zoomed.RSSI_BANDS = [(-70, -61), (-60, -30)]
+    assert mapping.radius_from_rssi_band(-60, zoomed) == (0.5, 1)
+
+
+def test_angle_resolver_is_memoized_and_deterministic():
+    resolver = mapping.AngleResolver("blake2b", max_entries=8)
+    first = resolver.resolve("aa:bb:cc:dd:ee:ff")
+    assert resolver.resolve("aa:bb:cc:dd:ee:ff") == first
+    assert resolver.cache_info().hits == 1
+    assert first == mapping.angle_from_id("aa:bb:cc:dd:ee:ff", algorithm="blake2b")
+    assert all(0.0 <= angle < 2 * math.pi for angle in resolver.resolve_many(["a", "b", "c"]))
+
+
+def test_sha256_resolver_keeps_legacy_angles():
+    legacy = mapping.AngleResolver("sha256")
+    assert legacy.resolve_many(["alpha", "beta"]) == [
+        mapping.angle_from_id("alpha"),
+        mapping.angle_from_id("beta"),
+    ]
+
+
+def test_tracker_picks_up_band_changes_on_tick():
+    from rf_radar.core.tracker import Tracker
+
+    zoomed = SimpleNamespace(**{name: getattr(config, name) for name in dir(config) if name.isupper()})
+    tracker = Tracker(zoomed)
+    compiled = tracker._bands
+    tracker.update(Observation(ObservationSource.SIM, "a", -60, ts=0.0))
+    tracker.tick(0.1)
+    assert tracker._bands is compiled
+
+    zoomed.RSSI_MIN = -70
+    tracker.tick(0.2)
+    assert tracker._bands is not compiled
+    assert tracker._bands.rssi_min == -70
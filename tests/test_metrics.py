@@ -0,0 +1,90 @@
+import json
+import pathlib
+import sys
+import threading
+from queue import Queue
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.app.runtime import publish_snapshot
+from rf_radar.infrastructure import metrics
+from rf_radar.infrastructure.metrics import Histogram, JsonLinesDumper, MetricsRegistry
+
+
+def test_counter_sums_increments_from_all_threads():
+    counter = MetricsRegistry().counter("hits")
+
+    def work():
+        for _ in range(1000):
+            counter.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value() == 4000
+
+
+def test_histogram_reports_bucket_quantiles():
+    histogram = Histogram("latency", buckets=(1, 5, 10))
+    for value in [0.5] * 90 + [4.0] * 9 + [20.0]:
+        histogram.observe(value)
+
+    result = histogram.value()
+
+    assert result["count"] == 100
+    assert result["max"] == 20.0
+    assert result["mean"] == pytest.approx((45 + 36 + 20) / 100)
+    assert result["p50"] == 1
+    assert result["p95"] == 5
+    assert result["p99"] == 5
+    assert result["buckets"] == [90, 9, 0, 1]
+
+
+def test_registry_returns_same_metric_for_a_name():
+    registry = MetricsRegistry()
+    registry.counter("a").inc(3)
+    registry.gauge("g").set(2.5)
+    registry.histogram("h").observe(1.0)
+
+    assert registry.counter("a") is registry.counter("a")
+    values = registry.snapshot()
+    assert values["counters"] == {"a": 3}
+    assert values["gauges"] == {"g": 2.5}
+    assert values["histograms"]["h"]["count"] == 1
+    assert metrics.summary_lines(values, limit=2) == ["h p50=1 p95=1 n=1", "a=3"]
+
+
+def test_dumper_appends_json_lines(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter("a").inc()
+    path = tmp_path / "metrics.jsonl"
+    dumper = JsonLinesDumper(registry, str(path), interval=60.0)
+
+    dumper.dump()
+    dumper.start()
+    dumper.stop()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["counters"] == {"a": 1}
+
+
+def test_publish_snapshot_counts_replaced_snapshots():
+    replaced = metrics.registry.counter("snapshot.replaced")
+    published = metrics.registry.counter("snapshot.published")
+    before = (replaced.value(), published.value())
+    snapshot_queue = Queue(maxsize=1)
+
+    publish_snapshot(snapshot_queue, "first")
+    publish_snapshot(snapshot_queue, "second")
+
+    assert snapshot_queue.get_nowait() == "second"
+    assert replaced.value() - before[0] == 1
+    assert published.value() - before[1] == 2
@@ -0,0 +1,103 @@
+import pathlib
+import sys
+import threading
+import time
+from queue import Empty, Full
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.core import config
+from rf_radar.infrastructure import queues
+from rf_radar.infrastructure.queues import DROP_NEWEST, DROP_OLDEST, ObservationChannel, SnapshotMailbox
+
+
+def test_channel_preserves_order_across_wraparound():
+    channel = ObservationChannel(4)
+    channel.push_many([1, 2, 3])
+    assert channel.drain(2) == [1, 2]
+    channel.push_many([4, 5, 6])
+
+    assert channel.drain(10) == [3, 4, 5, 6]
+    assert channel.drain(10) == []
+    assert channel.stats() == {"size": 0, "enqueued": 6, "dropped": 0, "high_water": 4}
+
+
+def test_drop_oldest_keeps_newest_items():
+    channel = ObservationChannel(4, DROP_OLDEST)
+    channel.push_many([1, 2, 3])
+
+    assert channel.push_many([4, 5]) == 1
+    assert channel.push_many(range(10, 16)) == 6
+    assert channel.drain(10) == [12, 13, 14, 15]
+    assert channel.dropped == 7
+
+
+def test_drop_newest_rejects_incoming_items():
+    channel = ObservationChannel(3, DROP_NEWEST)
+
+    assert channel.push_many([1, 2, 3, 4]) == 1
+    with pytest.raises(Full):
+        channel.put_nowait(5)
+    assert channel.drain(10) == [1, 2, 3]
+    assert channel.dropped == 2
+
+
+def test_channel_is_queue_compatible():
+    channel = ObservationChannel(2)
+    with pytest.raises(Empty):
+        channel.get_nowait()
+
+    threading.Timer(0.05, channel.put_nowait, args=("late",)).start()
+    assert channel.get(timeout=1.0) == "late"
+    assert channel.qsize() == 0
+
+
+def test_queue_helpers_use_channel_batches():
+    channel = queues.create_observation_channel(config)
+    assert queues.put_many(channel, iter(range(5))) == 0
+
+    assert queues.drain(channel, max_items=3, timeout=0.0, budget=1.0) == [0, 1, 2]
+    batches = queues.drain_fair([channel, queues.create_observation_queue(config)], 10, 0.0, 1.0)
+    assert batches == [[3, 4], []]
+
+
+def test_drain_fair_sleeps_until_a_channel_notifies():
+    notifier = threading.Condition()
+    quiet = ObservationChannel(4, notifier=notifier)
+    busy = ObservationChannel(4, notifier=notifier)
+    threading.Timer(0.05, busy.push_many, args=([1, 2],)).start()
+
+    started = time.monotonic()
+    batches = queues.drain_fair([quiet, busy], 10, timeout=2.0, budget=1.0, notifier=notifier)
+
+    assert batches == [[], [1, 2]]
+    assert 0.04 <= time.monotonic() - started < 1.0
+    assert queues.drain_fair([quiet, busy], 10, timeout=0.05, budget=1.0, notifier=notifier) == [[], []]
+
+
+def test_snapshot_mailbox_keeps_latest_item():
+    mailbox = queues.create_snapshot_queue(config)
+    assert isinstance(mailbox, SnapshotMailbox)
+
+    assert mailbox.put("first") is False
+    assert mailbox.put("second") is True
+    assert mailbox.replaced == 1
+    assert mailbox.get_nowait() == "second"
+    with pytest.raises(Empty):
+        mailbox.get(timeout=0.01)
+
+    threading.Timer(0.05, mailbox.put_nowait, args=("late",)).start()
+    assert mailbox.get(timeout=1.0) == "late"
+    assert mailbox.empty()
+
+
+def test_drop_warning_due_on_first_drop_and_every_tenth():
+    assert queues.drop_warning_due(0, 1)
+    assert not queues.drop_warning_due(1, 5)
+    assert not queues.drop_warning_due(5, 10)
+    assert queues.drop_warning_due(10, 11)
+    assert queues.drop_warning_due(3, 40)
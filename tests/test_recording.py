@@ -0,0 +1,142 @@
+import pathlib
+import sys
+import threading
+import time
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.app.replay import Replayer
+from rf_radar.core import config
+from rf_radar.core.models import Observation, ObservationBatch, ObservationSource
+from rf_radar.core.tracker import Tracker
+from rf_radar.infrastructure.recording import SessionReader, SessionRecorder
+
+
+def _observations(count: int):
+    sources = (ObservationSource.WIFI, ObservationSource.BLE, ObservationSource.SIM)
+    return [
+        Observation(sources[idx % 3], f"dev-{idx % 7}", -40 - idx % 50, ts=100.0 + idx * 0.05)
+        for idx in range(count)
+    ]
+
+
+def _record(path, observations, compress=True, chunk_records=16):
+    with SessionRecorder(str(path), angle_hash="blake2b", compress=compress, chunk_records=chunk_records) as rec:
+        rec.record_many(observations)
+    return rec
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_round_trip_preserves_observations(tmp_path, compress):
+    observations = _observations(100)
+    recorder = _record(tmp_path / "session.rfrs", observations, compress=compress)
+
+    with SessionReader(str(tmp_path / "session.rfrs")) as reader:
+        batches = list(reader.batches())
+        assert reader.angle_hash == "blake2b"
+        assert len(reader) == 100
+        assert len(reader.chunks) == recorder.chunks == 7
+
+    ids = [i for batch in batches for i in batch.ids]
+    ts = [t for batch in batches for t in batch.ts]
+    assert ids == [obs.id for obs in observations]
+    assert [s for batch in batches for s in batch.sources] == [obs.source for obs in observations]
+    assert [r for batch in batches for r in batch.rssi] == [obs.rssi for obs in observations]
+    assert ts == pytest.approx([obs.ts for obs in observations], abs=1e-3)
+
+
+def test_rssi_is_clamped_to_int8(tmp_path):
+    _record(tmp_path / "s.rfrs", [Observation(ObservationSource.SIM, "x", -200, ts=0.0)])
+
+    with SessionReader(str(tmp_path / "s.rfrs")) as reader:
+        assert next(reader.batches()).rssi == [-128]
+
+
+def test_seek_skips_earlier_records(tmp_path):
+    _record(tmp_path / "s.rfrs", _observations(100))
+
+    with SessionReader(str(tmp_path / "s.rfrs")) as reader:
+        ts = [t for batch in reader.batches(start_ts=103.0) for t in batch.ts]
+
+    assert ts[0] == pytest.approx(103.0)
+    assert len(ts) == 40
+
+
+def test_file_without_index_is_rescanned(tmp_path):
+    path = tmp_path / "s.rfrs"
+    _record(path, _observations(40))
+    data = path.read_bytes()
+    index_size = 8 + 3 * 28 + 12
+    path.write_bytes(data[: len(data) - index_size - 1])
+
+    with SessionReader(str(path)) as reader:
+        assert len(reader.chunks) == 2
+        assert len(reader) == 32
+
+
+def test_periodic_flush_writes_buffered_records_before_close(tmp_path):
+    path = tmp_path / "s.rfrs"
+    rec = SessionRecorder(str(path), angle_hash="blake2b", chunk_records=1000, flush_interval=0.01)
+    try:
+        rec.record_many(_observations(5))
+        deadline = time.monotonic() + 2.0
+        while rec.records < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        with SessionReader(str(path)) as reader:
+            assert len(reader) == 5
+    finally:
+        rec.close()
+
+
+def test_replay_matches_direct_ingest(tmp_path):
+    observations = _observations(100)
+    _record(tmp_path / "s.rfrs", observations)
+    direct = Tracker(config)
+    direct.update_many(ObservationBatch.from_observations(observations))
+
+    replayed = Tracker(config)
+    with SessionReader(str(tmp_path / "s.rfrs")) as reader:
+        result = Replayer(reader, replayed, speed=None, tick_interval=0.075).run()
+
+    assert result["records"] == 100
+    assert result["ticks"] == 50
+    assert {t: v.rssi_filt for t, v in replayed.targets.items()} == pytest.approx(
+        {t: v.rssi_filt for t, v in direct.targets.items()}
+    )
+
+
+def test_replay_paces_by_speed(tmp_path):
+    _record(tmp_path / "s.rfrs", _observations(20))
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    with SessionReader(str(tmp_path / "s.rfrs")) as reader:
+        Replayer(
+            reader, Tracker(config), speed=2.0, tick_interval=0.075, clock=lambda: now[0], sleep=sleep
+        ).run()
+
+    assert len(sleeps) == 9
+    assert sum(sleeps) == pytest.approx(0.9 / 2.0, abs=1e-3)
+
+
+def test_write_failure_stops_recording_without_hanging_close(tmp_path):
+    rec = SessionRecorder(str(tmp_path / "s.rfrs"), angle_hash="blake2b", chunk_records=4)
+    rec.record_many([Observation(ObservationSource.SIM, "x" * 70000, -60, ts=0.0)] * 4)
+    rec.flush()
+    rec.record_many(_observations(10))
+
+    closer = threading.Thread(target=lambda: (rec.flush(), rec.close()), daemon=True)
+    closer.start()
+    closer.join(timeout=2.0)
+
+    assert not closer.is_alive()
+    assert rec.records == 0
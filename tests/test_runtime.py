@@ -1,14 +1,19 @@
+import asyncio
 import pathlib
 import sys
 import time
+from queue import Empty
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from rf_radar.app.runtime import Runtime
+from rf_radar.app.supervisor import ScannerSupervisor
 from rf_radar.core import config
+from rf_radar.core.models import Observation, ObservationSource
 from rf_radar.infrastructure.queues import create_observation_queue, create_snapshot_queue
+from rf_radar.scanners.sim_scanner import SimScanner
 
 
 def test_runtime_produces_snapshots_and_stops_cleanly():
@@ -26,3 +31,137 @@ def test_runtime_produces_snapshots_and_stops_cleanly():
     assert not runtime.is_running()
     if runtime.core_thread:
         assert not runtime.core_thread.is_alive()
+
+
+def test_runtime_drains_pending_observations_in_one_tick():
+    observation_queue = create_observation_queue(config)
+    snapshot_queue = create_snapshot_queue(config)
+    for idx in range(100):
+        observation_queue.put_nowait(
+            Observation(ObservationSource.SIM, f"burst-{idx}", -60, ts=0.0, meta=None)
+        )
+    runtime = Runtime(config, observation_queue, snapshot_queue)
+
+    runtime.start()
+    snap = snapshot_queue.get(timeout=2.0)
+    runtime.stop()
+
+    assert snap.stats["batch_max"] >= 100
+    assert snap.stats["ingested"] >= 100
+    assert "dropped" in snap.stats
+
+
+def test_runtime_keeps_sim_targets_across_idle_ticks():
+    # The sim emits every 0.5 s, so most core ticks ingest nothing.
+    def slow_sim(queue, cfg):
+        return SimScanner(queue, cfg, scenario="C", seed=1, tick_rate=2.0)
+
+    observation_queue = create_observation_queue(config)
+    snapshot_queue = create_snapshot_queue(config)
+    supervisor = ScannerSupervisor(config, factories={"sim": slow_sim}, inputs={"input": observation_queue})
+    runtime = Runtime(config, observation_queue, snapshot_queue, supervisor=supervisor)
+
+    runtime.start()
+    try:
+        snapshots = []
+        deadline = time.time() + 3.0
+        while time.time() < deadline:
+            try:
+                snapshots.append(snapshot_queue.get(timeout=0.5))
+            except Empty:
+                pass
+    finally:
+        runtime.stop()
+
+    seen = [idx for idx, snap in enumerate(snapshots) if snap.targets]
+    assert seen
+    assert all(snap.stats["total"] > 0 for snap in snapshots[seen[0]:])
+
+
+def test_process_runtime_publishes_snapshots_from_worker():
+    from rf_radar.app.process_runtime import ProcessRuntime
+
+    observation_queue = create_observation_queue(config)
+    snapshot_queue = create_snapshot_queue(config)
+    observation_queue.put_nowait(Observation(ObservationSource.SIM, "proc-1", -55, ts=time.time(), meta=None))
+    runtime = ProcessRuntime(config, observation_queue, snapshot_queue)
+
+    runtime.start()
+    try:
+        deadline = time.time() + 10.0
+        snap = None
+        while time.time() < deadline:
+            snap = snapshot_queue.get(timeout=deadline - time.time())
+            if "proc-1" in {t.id for t in snap.targets}:
+                break
+        assert runtime.is_running()
+    finally:
+        runtime.stop()
+
+    assert "proc-1" in {t.id for t in snap.targets}
+    assert snap.stats["ingested"] >= 1
+    assert not runtime.is_running()
+
+
+def test_async_runtime_ingests_producers_and_input_queue():
+    from rf_radar.app.async_runtime import AsyncRuntime
+
+    calls = []
+
+    async def producer(emit, cfg):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("first run fails")
+        emit([Observation(ObservationSource.SIM, "async-1", -50, ts=0.0, meta=None)])
+        await asyncio.Event().wait()
+
+    original_backoff = config.SCANNER_RESTART_BACKOFF
+    config.SCANNER_RESTART_BACKOFF = 0.01
+    observation_queue = create_observation_queue(config)
+    snapshot_queue = create_snapshot_queue(config)
+    observation_queue.put_nowait(Observation(ObservationSource.SIM, "input-1", -60, ts=0.0, meta=None))
+    runtime = AsyncRuntime(config, observation_queue, snapshot_queue, producers={"fake": producer})
+
+    runtime.start()
+    try:
+        deadline = time.time() + 5.0
+        ids = set()
+        while time.time() < deadline and not {"async-1", "input-1"} <= ids:
+            ids = {t.id for t in snapshot_queue.get(timeout=deadline - time.time()).targets}
+    finally:
+        stop_start = time.perf_counter()
+        runtime.stop()
+        config.SCANNER_RESTART_BACKOFF = original_backoff
+
+    assert {"async-1", "input-1"} <= ids
+    assert len(calls) == 2
+    assert time.perf_counter() - stop_start < 1.0
+    assert not runtime.is_running()
+
+
+def test_async_runtime_keeps_sim_targets_in_later_snapshots():
+    from rf_radar.app.async_runtime import AsyncRuntime
+    from rf_radar.scanners import sim_scanner
+
+    snapshot_queue = create_snapshot_queue(config)
+    runtime = AsyncRuntime(
+        config, create_observation_queue(config), snapshot_queue, producers={"sim": sim_scanner.produce_async}
+    )
+
+    runtime.start()
+    try:
+        snapshots = []
+        deadline = time.time() + 3.0
+        while time.time() < deadline:
+            try:
+                snapshots.append(snapshot_queue.get(timeout=0.5))
+            except Empty:
+                pass
+    finally:
+        runtime.stop()
+
+    seen = [idx for idx, snap in enumerate(snapshots) if "sim-move" in {t.id for t in snap.targets}]
+    assert seen
+    later = snapshots[seen[0]:]
+    assert len(later) > 5
+    assert all("sim-move" in {t.id for t in snap.targets} for snap in later)
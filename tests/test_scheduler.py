@@ -0,0 +1,102 @@
+import pathlib
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.app.scheduler import CoreScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_interval_backs_off_when_idle_and_resets_on_ingest():
+    clock = FakeClock()
+    scheduler = CoreScheduler(0.1, idle_interval_max=0.4, clock=clock)
+    intervals = []
+    for _ in range(4):
+        clock.now += scheduler.remaining()
+        assert scheduler.due()
+        scheduler.ticked()
+        intervals.append(scheduler.interval)
+
+    assert intervals == [0.2, 0.4, 0.4, 0.4]
+    assert scheduler.idle
+
+    scheduler.ingested(3)
+    clock.now += scheduler.remaining()
+    scheduler.ticked()
+    assert scheduler.interval == 0.1
+    assert not scheduler.idle
+    assert scheduler.remaining() == pytest.approx(0.1)
+
+
+def test_backlog_makes_next_tick_due_immediately():
+    clock = FakeClock()
+    scheduler = CoreScheduler(0.1, clock=clock)
+    clock.now = 0.1
+    scheduler.ingested(1024)
+    scheduler.ticked(backlog=500)
+
+    assert scheduler.due()
+    scheduler.ticked(backlog=0)
+    assert scheduler.remaining() == pytest.approx(0.1)
+
+
+def test_overrun_restarts_cadence():
+    clock = FakeClock()
+    scheduler = CoreScheduler(0.1, clock=clock)
+    clock.now = 0.35
+    scheduler.ticked()
+
+    assert scheduler.overruns == 1
+    assert scheduler.remaining() == pytest.approx(0.1)
+
+
+def test_snapshot_built_only_when_consumed_and_changed_or_stats_due():
+    clock = FakeClock()
+    scheduler = CoreScheduler(0.1, stats_interval=1.0, clock=clock)
+    assert scheduler.should_build(changed=False, consumed=False)
+    scheduler.built()
+
+    clock.now = 0.1
+    assert not scheduler.should_build(changed=True, consumed=False)
+    assert scheduler.should_build(changed=True, consumed=True)
+    assert not scheduler.should_build(changed=False, consumed=True)
+    clock.now = 1.0
+    assert scheduler.should_build(changed=False, consumed=True)
+
+
+def test_latency_measures_oldest_unpublished_ingest():
+    clock = FakeClock()
+    scheduler = CoreScheduler(0.1, clock=clock)
+    assert scheduler.latency() == 0.0
+
+    clock.now = 1.0
+    scheduler.ingested(5)
+    clock.now = 1.2
+    scheduler.ingested(5)
+    clock.now = 1.25
+    assert scheduler.latency() == pytest.approx(0.25)
+    scheduler.built()
+    assert scheduler.latency() == 0.0
+
+
+def test_now_ts_follows_the_observation_clock():
+    clock = FakeClock()
+    scheduler = CoreScheduler(0.1, clock=clock)
+    assert scheduler.now_ts(1e9) == 1e9
+
+    clock.now = 50.0
+    scheduler.observed(2.0)
+    clock.now = 50.3
+
+    assert scheduler.now_ts(1e9) == pytest.approx(2.3)
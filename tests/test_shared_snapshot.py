@@ -0,0 +1,56 @@
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.core import config
+from rf_radar.core.models import Observation, ObservationSource
+from rf_radar.core.tracker import Tracker
+from rf_radar.infrastructure.shared_snapshot import SharedSnapshotReader, SharedSnapshotWriter
+
+
+def _snapshot(count: int, now_ts: float):
+    tracker = Tracker(config)
+    for idx in range(count):
+        tracker.update(Observation(ObservationSource.BLE, f"dev-{idx}", -50 - idx, ts=now_ts))
+    return tracker.build_snapshot(now_ts, extra_stats={"ingested": count})
+
+
+def test_round_trip_through_shared_memory():
+    writer = SharedSnapshotWriter.create(capacity=8)
+    reader = SharedSnapshotReader.attach(writer.name)
+    try:
+        assert reader.read_if_new() is None
+        snap = _snapshot(3, now_ts=1.5)
+        writer.write(snap)
+
+        decoded = reader.read_if_new()
+        assert decoded.targets == snap.targets
+        assert decoded.selected_id == snap.selected_id
+        assert decoded.now_ts == 1.5
+        assert decoded.stats["ingested"] == 3
+        assert reader.read_if_new() is None
+    finally:
+        reader.close()
+        writer.close()
+        writer.unlink()
+
+
+def test_double_buffer_alternates_and_truncates_to_capacity():
+    writer = SharedSnapshotWriter.create(capacity=2)
+    reader = SharedSnapshotReader.attach(writer.name)
+    try:
+        writer.write(_snapshot(1, now_ts=1.0))
+        assert writer.header() == (1, 1)
+        writer.write(_snapshot(5, now_ts=2.0))
+        assert writer.header() == (2, 0)
+
+        decoded = reader.read()
+        assert len(decoded.targets) == 2
+        assert decoded.now_ts == 2.0
+    finally:
+        reader.close()
+        writer.close()
+        writer.unlink()
@@ -9,7 +9,7 @@ from rf_radar.core import config
 from rf_radar.core.models import ObservationSource
 from rf_radar.core.tracker import Tracker
 from rf_radar.infrastructure.queues import create_observation_queue
-from rf_radar.scanners.sim_scanner import SimScanner
+from rf_radar.scanners.sim_scanner import LoadProfile, SimScanner
 
 
 def _first_obs(scanner: SimScanner, step: int):
@@ -68,3 +68,37 @@ def test_tracker_integration_with_sim_scanner():
     assert "sim-move" in ids
     assert snap.selected_id == "sim-move"
     config.TARGET_UPDATE_INTERVAL = original_interval
+
+
+def test_load_scenarios_are_reproducible_with_seed():
+    for scenario in ("CROWD", "CHURN", "BURST"):
+        s1 = SimScanner(create_observation_queue(config), config, scenario=scenario, seed=9, tick_rate=10)
+        s2 = SimScanner(create_observation_queue(config), config, scenario=scenario, seed=9, tick_rate=10)
+        seq1 = [(o.id, o.rssi, o.ts) for step in range(3) for o in s1._build_observations(step)]
+        seq2 = [(o.id, o.rssi, o.ts) for step in range(3) for o in s2._build_observations(step)]
+        assert seq1 and seq1 == seq2
+        assert all(config.RSSI_MIN <= rssi <= config.RSSI_MAX for _, rssi, _ in seq1)
+
+
+def test_load_profile_controls_rate_bursts_and_churn():
+    profile = LoadProfile(
+        static_aps=0,
+        moving_phones=20,
+        obs_per_second=100.0,
+        rotation_interval=1.0,
+        burst_period=10.0,
+        burst_duration=1.0,
+        burst_factor=5.0,
+    )
+    scanner = SimScanner(
+        create_observation_queue(config), config, scenario="LOAD", seed=3, tick_rate=10, load_profile=profile
+    )
+
+    in_burst = [len(scanner._build_observations(step)) for step in range(10)]
+    steady = [len(scanner._build_observations(step)) for step in range(10, 20)]
+    assert sum(in_burst) == 500
+    assert sum(steady) == 100
+
+    ids_early = {o.id for o in scanner._build_observations(20)}
+    ids_late = {o.id for o in scanner._build_observations(40)}
+    assert not ids_early & ids_late
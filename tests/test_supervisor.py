@@ -0,0 +1,193 @@
+import pathlib
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.app.supervisor import ScannerSupervisor, default_factories
+from rf_radar.core import config
+from rf_radar.core.models import Observation, ObservationSource
+
+
+class FakeScanner:
+    def __init__(self, observation_queue, alive=True):
+        self.observation_queue = observation_queue
+        self.alive = alive
+        self.started = False
+        self.dropped = 0
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.alive = False
+
+    def is_alive(self):
+        return self.started and self.alive
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _obs(source, idx):
+    return Observation(source, f"{source.value}-{idx}", -60, ts=float(idx), meta=None)
+
+
+def _supervisor(factories, clock=None):
+    return ScannerSupervisor(config, factories=factories, clock=clock or FakeClock())
+
+
+def test_default_factories_follow_enable_flags():
+    cfg = SimpleNamespace(ENABLE_WIFI=True, ENABLE_BLE=False, ENABLE_SIMULATOR=True)
+
+    assert list(default_factories(cfg)) == ["wifi", "sim"]
+
+
+def test_drain_shares_capacity_fairly_between_sources():
+    scanners = {}
+
+    def factory(name):
+        def build(queue, cfg):
+            scanners[name] = FakeScanner(queue)
+            return scanners[name]
+
+        return build
+
+    supervisor = _supervisor({"ble": factory("ble"), "wifi": factory("wifi")})
+    supervisor.start()
+    try:
+        for idx in range(200):
+            scanners["ble"].observation_queue.put_nowait(_obs(ObservationSource.BLE, idx))
+        for idx in range(5):
+            scanners["wifi"].observation_queue.put_nowait(_obs(ObservationSource.WIFI, idx))
+
+        batch = supervisor.drain(max_items=50, timeout=0.0, budget=1.0)
+    finally:
+        supervisor.stop()
+
+    sources = [obs.source for obs in batch]
+    assert len(batch) == 50
+    assert sources.count(ObservationSource.WIFI) == 5
+    assert sources.count(ObservationSource.BLE) == 45
+    stats = supervisor.stats()
+    assert stats["wifi.ingested"] == 5
+    assert stats["ble.backlog"] == 155
+
+
+def test_stats_include_scanner_metrics():
+    def factory(queue, cfg):
+        scanner = FakeScanner(queue)
+        scanner.metrics = {"scans": 3, "dropped": 99}
+        return scanner
+
+    supervisor = _supervisor({"wifi": factory})
+    supervisor.start()
+    try:
+        stats = supervisor.stats()
+    finally:
+        supervisor.stop()
+
+    assert stats["wifi.scans"] == 3
+    assert stats["wifi.dropped"] == 0
+
+
+def test_crashed_scanner_restarts_with_backoff():
+    built = []
+
+    def factory(queue, cfg):
+        built.append(FakeScanner(queue))
+        return built[-1]
+
+    clock = FakeClock()
+    supervisor = _supervisor({"sim": factory}, clock=clock)
+    supervisor.start()
+    try:
+        built[0].alive = False
+        built[0].dropped = 3
+        supervisor.check()
+        assert len(built) == 1
+
+        clock.now += config.SCANNER_RESTART_BACKOFF
+        supervisor.check()
+        assert len(built) == 2 and built[1].started
+
+        built[1].alive = False
+        supervisor.check()
+        clock.now += config.SCANNER_RESTART_BACKOFF
+        supervisor.check()
+        assert len(built) == 2
+
+        clock.now += config.SCANNER_RESTART_BACKOFF
+        supervisor.check()
+        assert len(built) == 3
+    finally:
+        supervisor.stop()
+
+    stats = supervisor.stats()
+    assert stats["sim.restarts"] == 2
+    assert stats["sim.dropped"] == 3
+    assert supervisor.dropped() == 3
+
+
+def test_unavailable_scanner_is_not_restarted():
+    built = []
+
+    def factory(queue, cfg):
+        built.append(FakeScanner(queue, alive=False))
+        built[-1].unavailable = True
+        return built[-1]
+
+    clock = FakeClock()
+    supervisor = _supervisor({"ble": factory}, clock=clock)
+    supervisor.start()
+    try:
+        for _ in range(3):
+            supervisor.check()
+            clock.now += config.SCANNER_RESTART_BACKOFF_MAX
+    finally:
+        supervisor.stop()
+
+    assert len(built) == 1
+    stats = supervisor.stats()
+    assert stats["ble.unavailable"] == 1
+    assert stats["ble.restarts"] == 0
+
+
+def test_failing_factory_is_retried():
+    attempts = []
+
+    def factory(queue, cfg):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("no adapter")
+        return FakeScanner(queue)
+
+    clock = FakeClock()
+    supervisor = _supervisor({"ble": factory}, clock=clock)
+    supervisor.start()
+    try:
+        supervisor.check()
+        clock.now += config.SCANNER_RESTART_BACKOFF
+        supervisor.check()
+        assert supervisor.scanner("ble").is_alive()
+    finally:
+        supervisor.stop()
+
+    assert len(attempts) == 2
+
+
+def test_default_sim_stamps_wall_clock_times():
+    before = time.time()
+    scanner = default_factories(config)["sim"](None, config)
+
+    observation = next(iter(scanner._build_observations(0)))
+
+    assert before <= observation.ts <= time.time()
@@ -0,0 +1,93 @@
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.core import config
+from rf_radar.core.models import Observation, ObservationSource, TargetState
+from rf_radar.core.target_store import ExpiryIndex, NearestIndex, TargetStore
+from rf_radar.core.tracker import Tracker
+
+
+def test_released_slots_are_recycled():
+    store = TargetStore()
+    first = store.allocate("a", source_bits=1, rssi=-60, angle_deg=10.0, radius_norm=0.8, band=1, ts=0.0)
+    store.allocate("b", source_bits=1, rssi=-70, angle_deg=20.0, radius_norm=0.8, band=1, ts=0.0)
+
+    store.release(first)
+    assert "a" not in store.index
+    reused = store.allocate("c", source_bits=2, rssi=-50, angle_deg=30.0, radius_norm=0.55, band=2, ts=1.0)
+
+    assert reused == first
+    assert len(store.ids) == 2
+    target = store.materialize(reused)
+    assert target.id == "c"
+    assert target.state == TargetState.ACTIVE
+    assert target.last_seen_ts == 1.0
+
+
+def test_source_mask_accumulates_as_bitmask():
+    tracker = Tracker(config)
+    tracker.update(Observation(ObservationSource.WIFI, "dual", -60, ts=0.0, meta=None))
+    tracker.update(Observation(ObservationSource.BLE, "dual", -61, ts=0.1, meta=None))
+
+    assert tracker.targets["dual"].source_mask == {ObservationSource.WIFI, ObservationSource.BLE}
+
+
+def test_materialized_targets_are_immutable():
+    tracker = Tracker(config)
+    tracker.update(Observation(ObservationSource.SIM, "copy", -60, ts=0.0, meta=None))
+    target = tracker.targets["copy"]
+
+    for mutate in (
+        lambda: setattr(target, "rssi_filt", 0.0),
+        lambda: target.source_mask.add(ObservationSource.BLE),
+    ):
+        try:
+            mutate()
+            mutated = True
+        except (AttributeError, TypeError):
+            mutated = False
+        assert not mutated
+
+    assert tracker.targets["copy"].source_mask == {ObservationSource.SIM}
+
+
+def test_expiry_index_returns_each_due_slot_once():
+    store = TargetStore()
+    slots = [
+        store.allocate(name, source_bits=1, rssi=-60, angle_deg=0.0, radius_norm=0.8, band=1, ts=0.0)
+        for name in ("a", "b", "c")
+    ]
+    expiry = ExpiryIndex(store, resolution=1.0)
+    expiry.schedule(slots[0], 1.2)
+    expiry.schedule(slots[1], 1.7)
+    expiry.schedule(slots[2], 3.0)
+    expiry.schedule(slots[0], 1.4)
+    expiry.schedule(slots[2], 5.0)
+
+    assert expiry.pop_due(1.5) == [slots[0]]
+    assert expiry.pop_due(1.5) == []
+    store.release(slots[1])
+    assert expiry.pop_due(4.0) == []
+    assert expiry.pop_due(5.0) == [slots[2]]
+
+
+def test_nearest_index_prefers_smallest_radius_then_oldest():
+    store = TargetStore()
+    nearest = NearestIndex(store)
+    far = store.allocate("far", source_bits=1, rssi=-80, angle_deg=0.0, radius_norm=0.8, band=1, ts=0.0)
+    old = store.allocate("old", source_bits=1, rssi=-80, angle_deg=0.0, radius_norm=0.8, band=1, ts=0.0)
+    for slot in (far, old):
+        nearest.push(slot)
+    assert nearest.nearest() == "far"
+
+    store.radius_norm[old] = 0.3
+    nearest.push(old)
+    assert nearest.nearest() == "old"
+
+    nearest.remove(old)
+    store.release(old)
+    assert nearest.nearest() == "far"
@@ -82,3 +82,58 @@ def test_snapshot_immutability():
     except Exception:
         stats_mutated = True
     assert stats_mutated
+
+
+def test_refreshed_target_is_rescheduled_before_going_stale():
+    tracker = Tracker(config)
+    timeout = config.RSSI_STALE_TIMEOUT
+    tracker.update(Observation(ObservationSource.SIM, "id-5", -70, ts=0.0, meta=None))
+    tracker.update(Observation(ObservationSource.SIM, "id-5", -70, ts=timeout - 1.0, meta=None))
+
+    tracker.tick(timeout + 0.1)
+    assert tracker.targets["id-5"].state == TargetState.ACTIVE
+
+    tracker.tick(2 * timeout - 0.9)
+    assert tracker.targets["id-5"].state == TargetState.STALE
+
+    tracker.update(Observation(ObservationSource.SIM, "id-5", -70, ts=2 * timeout - 0.8, meta=None))
+    tracker.tick(3 * timeout - 1.0)
+    assert tracker.targets["id-5"].state == TargetState.ACTIVE
+
+    tracker.tick(5 * timeout)
+    assert "id-5" not in tracker.targets
+
+
+def test_snapshot_reuses_unchanged_records():
+    tracker = Tracker(config)
+    tracker.update(Observation(ObservationSource.SIM, "still", -60, ts=0.0, meta=None))
+    tracker.update(Observation(ObservationSource.SIM, "moving", -60, ts=0.0, meta=None))
+    first = tracker.build_snapshot(now_ts=0.0)
+
+    assert tracker.build_snapshot(now_ts=0.1) is first
+
+    tracker.update(Observation(ObservationSource.SIM, "moving", -58, ts=0.2, meta=None))
+    second = tracker.build_snapshot(now_ts=0.2)
+    assert second is not first
+    previous = {t.id: t for t in first.targets}
+    current = {t.id: t for t in second.targets}
+    assert current["still"] is previous["still"]
+    assert current["moving"] is not previous["moving"]
+    assert [t.id for t in second.targets] == ["still", "moving"]
+
+
+def test_snapshot_counters_follow_state_transitions():
+    tracker = Tracker(config)
+    timeout = config.RSSI_STALE_TIMEOUT
+    tracker.update(Observation(ObservationSource.SIM, "old", -60, ts=0.0, meta=None))
+    tracker.update(Observation(ObservationSource.SIM, "new", -60, ts=timeout, meta=None))
+
+    tracker.tick(timeout + 0.5)
+    snap = tracker.build_snapshot(now_ts=timeout + 0.5)
+    assert (snap.stats["total"], snap.stats["active"], snap.stats["stale"]) == (2, 1, 1)
+    assert snap.selected_id == "old"
+
+    tracker.tick(2 * timeout + 0.5)
+    snap = tracker.build_snapshot(now_ts=2 * timeout + 0.5)
+    assert (snap.stats["total"], snap.stats["active"], snap.stats["stale"]) == (1, 0, 1)
+    assert snap.selected_id == "new"
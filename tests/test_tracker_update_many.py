@@ -0,0 +1,71 @@
+import pathlib
+import sys
+from random import Random
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.core import config
+from rf_radar.core.models import Observation, ObservationBatch, ObservationSource
+from rf_radar.core.tracker import Tracker
+
+
+def _random_observations(count: int, seed: int):
+    rng = Random(seed)
+    ids = [f"dev-{i}" for i in range(12)]
+    sources = list(ObservationSource)
+    ts = 0.0
+    observations = []
+    for _ in range(count):
+        ts += rng.uniform(0.0, 0.5)
+        observations.append(
+            Observation(
+                source=rng.choice(sources),
+                id=rng.choice(ids),
+                rssi=rng.randint(config.RSSI_MIN, config.RSSI_MAX),
+                ts=ts,
+                meta=None,
+            )
+        )
+    return observations
+
+
+def _state(tracker: Tracker):
+    return {
+        target_id: (
+            tgt.source_mask,
+            tgt.rssi_raw_last,
+            tgt.rssi_filt,
+            tgt.angle_deg,
+            tgt.radius_norm,
+            tgt.last_seen_ts,
+            tgt.state,
+            tgt.kind,
+        )
+        for target_id, tgt in tracker.targets.items()
+    }
+
+
+def test_update_many_matches_sequential_update(monkeypatch):
+    monkeypatch.setattr(config, "TARGET_UPDATE_INTERVAL", 1.0)
+    observations = _random_observations(2000, seed=5)
+
+    scalar = Tracker(config)
+    for obs in observations:
+        scalar.update(obs)
+
+    bulk = Tracker(config)
+    for start in range(0, len(observations), 250):
+        bulk.update_many(ObservationBatch.from_observations(observations[start:start + 250]))
+
+    assert _state(bulk) == _state(scalar)
+
+
+def test_observation_batch_rejects_ragged_columns():
+    try:
+        ObservationBatch(ids=["a", "b"], rssi=[-60], ts=[0.0, 1.0], sources=[ObservationSource.SIM] * 2)
+        raised = False
+    except ValueError:
+        raised = True
+    assert raised
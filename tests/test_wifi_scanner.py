@@ -0,0 +1,187 @@
+import asyncio
+import pathlib
+import sys
+import time
+from queue import Queue
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from rf_radar.core import config
+from rf_radar.core.models import ObservationSource
+from rf_radar.infrastructure import metrics
+from rf_radar.infrastructure.queues import create_observation_queue
+from rf_radar.scanners.wifi_scanner import WifiScanner, parse_iw, parse_nmcli, produce_async, run_command_async
+
+FIXTURES = ROOT / "tests" / "fixtures"
+
+
+def _fixture_lines(name: str):
+    with open(FIXTURES / name, encoding="utf-8") as handle:
+        yield from handle
+
+
+class FakeRunner:
+    def __init__(self, fixture: str, fail: bool = False, missing: bool = False):
+        self.fixture = fixture
+        self.fail = fail
+        self.missing = missing
+        self.commands = []
+
+    def __call__(self, command, timeout):
+        self.commands.append((list(command), timeout))
+        if self.missing:
+            raise FileNotFoundError(command[0])
+        if self.fail:
+            raise OSError(f"{command[0]} failed")
+        return _fixture_lines(self.fixture)
+
+
+def test_parse_nmcli_handles_escapes_and_skips_bad_lines():
+    records = list(parse_nmcli(_fixture_lines("nmcli_wifi_list.txt")))
+
+    assert [r.bssid for r in records] == [
+        "aa:bb:cc:dd:ee:01",
+        "aa:bb:cc:dd:ee:02",
+        "aa:bb:cc:dd:ee:01",
+        "aa:bb:cc:dd:ee:04",
+    ]
+    assert records[1].ssid == "Cafe:Guest"
+    assert records[1].freq == 5180
+    assert records[0].rssi == -59
+    assert records[3].rssi == -90
+
+
+def test_parse_iw_emits_blocks_with_signal():
+    records = list(parse_iw(_fixture_lines("iw_scan.txt")))
+
+    assert [(r.bssid, r.rssi, r.ssid, r.freq) for r in records] == [
+        ("aa:bb:cc:dd:ee:11", -48, "HomeNet", 2412),
+        ("aa:bb:cc:dd:ee:12", -72, "Office", 5180),
+        ("aa:bb:cc:dd:ee:11", -60, "HomeNet", 2412),
+    ]
+
+
+def test_scan_dedupes_bssids_keeping_strongest():
+    queue = create_observation_queue(config)
+    scanner = WifiScanner(queue, config, runner=FakeRunner("nmcli_wifi_list.txt"), clock=lambda: 42.0)
+    timed = metrics.registry.histogram("wifi.scan_ms").value()["count"]
+
+    observations = scanner.scan_once()
+
+    by_id = {obs.id: obs for obs in observations}
+    assert len(observations) == 3
+    assert by_id["aa:bb:cc:dd:ee:01"].rssi == -55
+    assert all(obs.source == ObservationSource.WIFI and obs.ts == 42.0 for obs in observations)
+    assert queue.qsize() == 3
+    assert scanner.metrics["scans"] == 1
+    assert scanner.metrics["last_bssids"] == 3
+    assert metrics.registry.histogram("wifi.scan_ms").value()["count"] == timed + 1
+
+
+def test_iw_backend_builds_iw_command():
+    original_backend = config.WIFI_BACKEND
+    config.WIFI_BACKEND = "iw"
+    try:
+        runner = FakeRunner("iw_scan.txt")
+        scanner = WifiScanner(create_observation_queue(config), config, runner=runner)
+        observations = scanner.scan_once()
+    finally:
+        config.WIFI_BACKEND = original_backend
+
+    assert runner.commands[0][0][:2] == ["iw", "dev"]
+    assert {obs.id: obs.rssi for obs in observations} == {"aa:bb:cc:dd:ee:11": -48, "aa:bb:cc:dd:ee:12": -72}
+
+
+def test_full_queue_counts_dropped_observations():
+    queue = Queue(maxsize=1)
+    scanner = WifiScanner(queue, config, runner=FakeRunner("nmcli_wifi_list.txt"))
+
+    scanner.scan_once()
+
+    assert scanner.dropped == 2
+    assert scanner.metrics["dropped"] == 2
+
+
+def test_failed_scan_is_counted_and_does_not_stop_thread():
+    runner = FakeRunner("nmcli_wifi_list.txt", fail=True)
+    original_interval = config.WIFI_SCAN_INTERVAL
+    config.WIFI_SCAN_INTERVAL = 0.01
+    try:
+        scanner = WifiScanner(create_observation_queue(config), config, runner=runner)
+        scanner.start()
+        deadline = time.time() + 2.0
+        while len(runner.commands) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        scanner.stop()
+    finally:
+        config.WIFI_SCAN_INTERVAL = original_interval
+
+    assert len(runner.commands) >= 2
+    assert scanner.metrics["failures"] >= 1
+    assert scanner.metrics["scans"] == 0
+
+
+def test_missing_scan_command_marks_scanner_unavailable():
+    runner = FakeRunner("nmcli_wifi_list.txt", missing=True)
+    original_interval = config.WIFI_SCAN_INTERVAL
+    config.WIFI_SCAN_INTERVAL = 0.01
+    try:
+        scanner = WifiScanner(create_observation_queue(config), config, runner=runner)
+        scanner.start()
+        deadline = time.time() + 2.0
+        while scanner.is_alive() and time.time() < deadline:
+            time.sleep(0.01)
+        scanner.stop()
+    finally:
+        config.WIFI_SCAN_INTERVAL = original_interval
+
+    assert scanner.unavailable
+    assert len(runner.commands) == 1
+    assert scanner.metrics["failures"] == 0
+
+    async def missing(command, timeout):
+        raise FileNotFoundError(command[0])
+
+    emitted = []
+    asyncio.run(asyncio.wait_for(produce_async(emitted.append, config, runner=missing), 2.0))
+    assert emitted == []
+
+
+def test_async_scan_records_parse_time():
+    parse_ms = metrics.registry.histogram("wifi.parse_ms")
+    before = parse_ms.value()["count"]
+
+    async def runner(command, timeout):
+        return list(_fixture_lines("nmcli_wifi_list.txt"))
+
+    async def scan_once():
+        emitted = []
+        task = asyncio.create_task(produce_async(emitted.append, config, runner=runner))
+        while not emitted:
+            await asyncio.sleep(0.001)
+        task.cancel()
+
+    asyncio.run(scan_once())
+    assert parse_ms.value()["count"] == before + 1
+
+
+def test_async_scan_runs_subprocess_and_emits_observations():
+    lines = asyncio.run(run_command_async([sys.executable, "-c", "print('a'); print('b')"], 5.0))
+    assert [line.strip() for line in lines] == ["a", "b"]
+
+    emitted = []
+
+    async def runner(command, timeout):
+        return list(_fixture_lines("nmcli_wifi_list.txt"))
+
+    async def scan_once():
+        task = asyncio.create_task(produce_async(emitted.append, config, runner=runner, clock=lambda: 7.0))
+        while not emitted:
+            await asyncio.sleep(0.001)
+        task.cancel()
+
+    asyncio.run(scan_once())
+    assert len(emitted[0]) == 3
+    assert {obs.ts for obs in emitted[0]} == {7.0}